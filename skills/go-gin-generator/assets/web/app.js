@@ -0,0 +1,15 @@
+
+// Basic JavaScript functionality
+document.addEventListener('DOMContentLoaded', function() {
+    console.log('Application loaded');
+
+    // Add any client-side functionality here
+    fetch('/api/v1/health')
+        .then(response => response.json())
+        .then(data => {
+            console.log('Health check:', data);
+        })
+        .catch(error => {
+            console.error('Health check failed:', error);
+        });
+});
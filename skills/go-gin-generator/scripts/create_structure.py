@@ -7,151 +7,103 @@ and files following golang-standards/project-layout conventions.
 """
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional
-
-
-class GoProjectStructure:
-    """Creates and manages Go project directory structure."""
-
-    def __init__(self, project_name: str, project_path: str):
-        """
-        Initialize project structure creator.
-
-        Args:
-            project_name: Name of the project
-            project_path: Base path where project will be created
-        """
-        self.project_name = project_name
-        self.project_path = Path(project_path) / project_name
-        self.module_path = f"github.com/username/{project_name}"  # Default, can be customized
-
-    def set_module_path(self, module_path: str):
-        """Set the Go module path for the project."""
-        self.module_path = module_path
-
-    def create_directory_structure(self, project_type: str = "api") -> None:
-        """
-        Create the standard Go project directory structure.
-
-        Args:
-            project_type: Type of project ("api", "web", "microservice", "grpc")
-        """
-        # Standard directories for all project types
-        base_dirs = [
-            "cmd/server",
-            "internal/config",
-            "internal/handler",
-            "internal/middleware",
-            "internal/model",
-            "internal/repository",
-            "internal/service",
-            "pkg",
-            "api",
-            "scripts",
-            "configs",
-            "docs",
-            "web",
-            "build",
-            "deployments",
-            "init"
-        ]
-
-        # Additional directories for specific project types
-        if project_type in ["api", "web"]:
-            base_dirs.extend([
-                "internal/validator",
-                "internal/response",
-                "test/e2e",
-                "test/integration"
-            ])
+from string import Template
+from typing import Dict, List, Optional, Tuple
+
+# Optional io_uring backend for the batched file writes. python-liburing is
+# Linux-only and not part of the script's requirements; when it is missing
+# the synchronous/thread-pool writers below are used instead.
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+
+# Directory layouts are precomputed per project type at import time, so
+# create_directory_structure does one dict lookup per call instead of
+# rebuilding the list through a chain of branches and extends.
+_BASE_DIRS = (
+    "cmd/server",
+    "internal/config",
+    "internal/handler",
+    "internal/middleware",
+    "internal/model",
+    "internal/repository",
+    "internal/service",
+    "pkg",
+    "api",
+    "scripts",
+    "configs",
+    "docs",
+    "web",
+    "build",
+    "deployments",
+    "init",
+)
 
-        if project_type == "web":
-            base_dirs.extend([
-                "internal/template",
-                "internal/static",
-                "web/templates",
-                "web/static/css",
-                "web/static/js",
-                "web/static/images"
-            ])
+_API_WEB_EXTRA_DIRS = (
+    "internal/validator",
+    "internal/response",
+    "test/e2e",
+    "test/integration",
+)
 
-        if project_type == "microservice":
-            base_dirs.extend([
-                "internal/health",
-                "internal/metrics",
-                "internal/grpc",
-                "proto"
-            ])
-
-        if project_type == "grpc":
-            base_dirs.extend([
-                "internal/grpc",
-                "internal/proto",
-                "proto",
-                "third_party/proto"
-            ])
-
-        # Create all directories
-        for dir_path in base_dirs:
-            full_path = self.project_path / dir_path
-            full_path.mkdir(parents=True, exist_ok=True)
-
-        # Create .gitkeep files in empty directories
-        for dir_path in base_dirs:
-            self._create_gitkeep(dir_path)
-
-    def _create_gitkeep(self, dir_path: str) -> None:
-        """Create .gitkeep file in specified directory."""
-        gitkeep_path = self.project_path / dir_path / ".gitkeep"
-        if not any(gitkeep_path.parent.iterdir()):
-            gitkeep_path.touch()
+_WEB_EXTRA_DIRS = (
+    "internal/render",
+    "internal/template",
+    "internal/static",
+    "web/templates",
+    "web/static/css",
+    "web/static/js",
+    "web/static/images",
+)
 
-    def create_main_file(self, project_type: str = "api") -> None:
-        """
-        Create the main.go file with basic setup.
+_MICROSERVICE_EXTRA_DIRS = (
+    "internal/health",
+    "internal/metrics",
+    "internal/grpc",
+    "proto",
+)
 
-        Args:
-            project_type: Type of project being created
-        """
-        main_file = self.project_path / "cmd/server/main.go"
-
-        if project_type == "api":
-            content = self._get_api_main_template()
-        elif project_type == "web":
-            content = self._get_web_main_template()
-        elif project_type == "microservice":
-            content = self._get_microservice_main_template()
-        elif project_type == "grpc":
-            content = self._get_grpc_main_template()
-        else:
-            content = self._get_api_main_template()  # Default to API template
+_GRPC_EXTRA_DIRS = (
+    "internal/grpc",
+    "internal/proto",
+    "proto",
+    "third_party/proto",
+)
 
-        main_file.write_text(content)
+_DIRS_BY_TYPE = {
+    "api": _BASE_DIRS + _API_WEB_EXTRA_DIRS,
+    "web": _BASE_DIRS + _API_WEB_EXTRA_DIRS + _WEB_EXTRA_DIRS,
+    "microservice": _BASE_DIRS + _MICROSERVICE_EXTRA_DIRS,
+    "grpc": _BASE_DIRS + _GRPC_EXTRA_DIRS,
+}
 
-    def _get_api_main_template(self) -> str:
-        """Get main.go template for REST API projects."""
-        return f'''package main
+# Templates are parsed once at import time; per-call work is reduced to a
+# single Template.substitute over the pre-compiled literal.
+_API_MAIN_TMPL = Template('''package main
 
 import (
 	"log"
 	"os"
 
-	"{self.module_path}/internal/config"
-	"{self.module_path}/internal/handler"
-	"{self.module_path}/internal/middleware"
+	"${module_path}/internal/config"
+	"${module_path}/internal/handler"
+	"${module_path}/internal/middleware"
 
 	"github.com/gin-gonic/gin"
 )
 
-func main() {{
+func main() {
 	// Initialize configuration
 	cfg := config.Load()
 
 	// Set Gin mode
-	if cfg.Server.Mode == "release" {{
+	if cfg.Server.Mode == "release" {
 		gin.SetMode(gin.ReleaseMode)
-	}}
+	}
 
 	// Create Gin engine
 	r := gin.Default()
@@ -163,47 +115,45 @@ func main() {{
 
 	// Initialize handlers
 	api := r.Group("/api/v1")
-	{{
+	{
 		handler.NewHealthHandler(api)
 		handler.NewExampleHandler(api)
-	}}
+	}
 
 	// Start server
 	port := os.Getenv("PORT")
-	if port == "" {{
+	if port == "" {
 		port = cfg.Server.Port
-	}}
+	}
 
 	log.Printf("Server starting on port %s", port)
-	if err := r.Run(":" + port); err != nil {{
+	if err := r.Run(":" + port); err != nil {
 		log.Fatal("Failed to start server:", err)
-	}}
-}}
-'''
+	}
+}
+''')
 
-    def _get_web_main_template(self) -> str:
-        """Get main.go template for web applications."""
-        return f'''package main
+_WEB_MAIN_TMPL = Template('''package main
 
 import (
 	"log"
 	"os"
 
-	"{self.module_path}/internal/config"
-	"{self.module_path}/internal/handler"
-	"{self.module_path}/internal/middleware"
+	"${module_path}/internal/config"
+	"${module_path}/internal/handler"
+	"${module_path}/internal/middleware"
 
 	"github.com/gin-gonic/gin"
 )
 
-func main() {{
+func main() {
 	// Initialize configuration
 	cfg := config.Load()
 
 	// Set Gin mode
-	if cfg.Server.Mode == "release" {{
+	if cfg.Server.Mode == "release" {
 		gin.SetMode(gin.ReleaseMode)
-	}}
+	}
 
 	// Create Gin engine
 	r := gin.Default()
@@ -219,10 +169,10 @@ func main() {{
 
 	// Initialize handlers
 	api := r.Group("/api/v1")
-	{{
+	{
 		handler.NewHealthHandler(api)
 		handler.NewAPIHandler(api)
-	}}
+	}
 
 	// Web routes
 	r.GET("/", handler.NewWebHandler().Home)
@@ -230,20 +180,18 @@ func main() {{
 
 	// Start server
 	port := os.Getenv("PORT")
-	if port == "" {{
+	if port == "" {
 		port = cfg.Server.Port
-	}}
+	}
 
 	log.Printf("Server starting on port %s", port)
-	if err := r.Run(":" + port); err != nil {{
+	if err := r.Run(":" + port); err != nil {
 		log.Fatal("Failed to start server:", err)
-	}}
-}}
-'''
+	}
+}
+''')
 
-    def _get_microservice_main_template(self) -> str:
-        """Get main.go template for microservices."""
-        return f'''package main
+_MICROSERVICE_MAIN_TMPL = Template('''package main
 
 import (
 	"context"
@@ -253,23 +201,23 @@ import (
 	"syscall"
 	"time"
 
-	"{self.module_path}/internal/config"
-	"{self.module_path}/internal/health"
-	"{self.module_path}/internal/handler"
-	"{self.module_path}/internal/middleware"
-	"{self.module_path}/internal/metrics"
+	"${module_path}/internal/config"
+	"${module_path}/internal/health"
+	"${module_path}/internal/handler"
+	"${module_path}/internal/middleware"
+	"${module_path}/internal/metrics"
 
 	"github.com/gin-gonic/gin"
 )
 
-func main() {{
+func main() {
 	// Initialize configuration
 	cfg := config.Load()
 
 	// Set Gin mode
-	if cfg.Server.Mode == "release" {{
+	if cfg.Server.Mode == "release" {
 		gin.SetMode(gin.ReleaseMode)
-	}}
+	}
 
 	// Create Gin engine
 	r := gin.Default()
@@ -285,25 +233,25 @@ func main() {{
 
 	// Initialize handlers
 	api := r.Group("/api/v1")
-	{{
+	{
 		handler.NewHealthHandler(api, healthCheck)
 		handler.NewServiceHandler(api)
-	}}
+	}
 
 	// Metrics endpoint
 	r.GET("/metrics", metrics.PrometheusHandler())
 
 	// Graceful shutdown
-	server := &http.Server{{
+	server := &http.Server{
 		Addr:    ":" + cfg.Server.Port,
 		Handler: r,
-	}}
+	}
 
-	go func() {{
-		if err := server.ListenAndServe(); err != nil && err != http.ErrServerClosed {{
+	go func() {
+		if err := server.ListenAndServe(); err != nil && err != http.ErrServerClosed {
 			log.Fatal("Failed to start server:", err)
-		}}
-	}}()
+		}
+	}()
 
 	// Wait for interrupt signal to gracefully shutdown
 	quit := make(chan os.Signal, 1)
@@ -315,17 +263,15 @@ func main() {{
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	if err := server.Shutdown(ctx); err != nil {{
+	if err := server.Shutdown(ctx); err != nil {
 		log.Fatal("Server forced to shutdown:", err)
-	}}
+	}
 
 	log.Println("Server exited")
-}}
-'''
+}
+''')
 
-    def _get_grpc_main_template(self) -> str:
-        """Get main.go template for gRPC gateway projects."""
-        return f'''package main
+_GRPC_MAIN_TMPL = Template('''package main
 
 import (
 	"context"
@@ -333,15 +279,15 @@ import (
 	"net"
 	"net/http"
 
-	"{self.module_path}/internal/config"
-	"{self.module_path}/internal/grpc"
-	grpcHandler "{self.module_path}/internal/handler"
+	"${module_path}/internal/config"
+	"${module_path}/internal/grpc"
+	grpcHandler "${module_path}/internal/handler"
 
 	"github.com/gin-gonic/gin"
 	"google.golang.org/grpc"
 )
 
-func main() {{
+func main() {
 	// Initialize configuration
 	cfg := config.Load()
 
@@ -351,17 +297,17 @@ func main() {{
 	grpcService.Register(grpcServer)
 
 	// Start gRPC server in a goroutine
-	go func() {{
+	go func() {
 		lis, err := net.Listen("tcp", ":"+cfg.GRPC.Port)
-		if err != nil {{
+		if err != nil {
 			log.Fatal("Failed to listen for gRPC:", err)
-		}}
+		}
 
 		log.Printf("gRPC server starting on port %s", cfg.GRPC.Port)
-		if err := grpcServer.Serve(lis); err != nil {{
+		if err := grpcServer.Serve(lis); err != nil {
 			log.Fatal("Failed to start gRPC server:", err)
-		}}
-	}}()
+		}
+	}()
 
 	// Create Gin gateway
 	r := gin.Default()
@@ -372,37 +318,13 @@ func main() {{
 
 	// Start HTTP gateway
 	log.Printf("HTTP gateway starting on port %s", cfg.Server.Port)
-	if err := r.Run(":" + cfg.Server.Port); err != nil {{
+	if err := r.Run(":" + cfg.Server.Port); err != nil {
 		log.Fatal("Failed to start HTTP gateway:", err)
-	}}
-}}
-'''
-
-    def create_config_files(self, project_type: str = "api") -> None:
-        """
-        Create configuration files for the project.
-
-        Args:
-            project_type: Type of project being created
-        """
-        # Create config struct
-        config_file = self.project_path / "internal/config/config.go"
-        config_file.write_text(self._get_config_template(project_type))
-
-        # Create config files
-        config_dir = self.project_path / "configs"
-
-        # Development config
-        dev_config = config_dir / "config.dev.yaml"
-        dev_config.write_text(self._get_dev_config_template())
-
-        # Production config
-        prod_config = config_dir / "config.prod.yaml"
-        prod_config.write_text(self._get_prod_config_template())
+	}
+}
+''')
 
-    def _get_config_template(self, project_type: str) -> str:
-        """Get config.go template."""
-        return f'''package config
+_CONFIG_TMPL = Template('''package config
 
 import (
 	"fmt"
@@ -411,49 +333,49 @@ import (
 	"github.com/spf13/viper"
 )
 
-type Config struct {{
+type Config struct {
 	Server   ServerConfig   `mapstructure:"server"`
 	Database DatabaseConfig `mapstructure:"database"`
 	Redis    RedisConfig    `mapstructure:"redis"`
 	JWT      JWTConfig      `mapstructure:"jwt"`
 	Log      LogConfig      `mapstructure:"log"`
-	{self._get_additional_config(project_type)}
-}}
+	${additional_config}
+}
 
-type ServerConfig struct {{
+type ServerConfig struct {
 	Port string `mapstructure:"port"`
 	Mode string `mapstructure:"mode"`
-}}
+}
 
-type DatabaseConfig struct {{
+type DatabaseConfig struct {
 	Host     string `mapstructure:"host"`
 	Port     string `mapstructure:"port"`
 	User     string `mapstructure:"user"`
 	Password string `mapstructure:"password"`
 	DBName   string `mapstructure:"dbname"`
 	SSLMode  string `mapstructure:"sslmode"`
-}}
+}
 
-type RedisConfig struct {{
+type RedisConfig struct {
 	Host     string `mapstructure:"host"`
 	Port     string `mapstructure:"port"`
 	Password string `mapstructure:"password"`
 	DB       int    `mapstructure:"db"`
-}}
+}
 
-type JWTConfig struct {{
+type JWTConfig struct {
 	Secret     string `mapstructure:"secret"`
 	Expiration int    `mapstructure:"expiration"`
-}}
+}
 
-type LogConfig struct {{
+type LogConfig struct {
 	Level  string `mapstructure:"level"`
 	Format string `mapstructure:"format"`
-}}
+}
 
-{self._get_additional_config_structs(project_type)}
+${additional_config_structs}
 
-func Load() *Config {{
+func Load() *Config {
 	viper.SetConfigName("config")
 	viper.SetConfigType("yaml")
 	viper.AddConfigPath("./configs")
@@ -466,672 +388,447 @@ func Load() *Config {{
 	setDefaults()
 
 	// Read config file
-	if err := viper.ReadInConfig(); err != nil {{
+	if err := viper.ReadInConfig(); err != nil {
 		fmt.Printf("Config file not found, using defaults: %v\n", err)
-	}}
+	}
 
 	var config Config
-	if err := viper.Unmarshal(&config); err != nil {{
+	if err := viper.Unmarshal(&config); err != nil {
 		fmt.Printf("Error unmarshaling config: %v\n", err)
 		os.Exit(1)
-	}}
+	}
 
 	return &config
-}}
+}
 
-func setDefaults() {{
+func setDefaults() {
 	viper.SetDefault("server.port", "8080")
 	viper.SetDefault("server.mode", "debug")
 	viper.SetDefault("log.level", "info")
 	viper.SetDefault("log.format", "json")
 	viper.SetDefault("jwt.expiration", 24) // hours
-}}
+}
 
-{self._get_additional_config_functions(project_type)}
-'''
+${additional_config_functions}
+''')
 
-    def _get_additional_config(self, project_type: str) -> str:
-        """Get additional config fields based on project type."""
-        if project_type == "microservice":
-            return "Metrics MetricsConfig `mapstructure:\"metrics\"`"
-        elif project_type == "grpc":
-            return "GRPC GRPCConfig `mapstructure:\"grpc\"`"
-        return ""
 
-    def _get_additional_config_structs(self, project_type: str) -> str:
-        """Get additional config structs based on project type."""
-        if project_type == "microservice":
-            return '''
-type MetricsConfig struct {
-	Enabled bool   `mapstructure:"enabled"`
-	Port    string `mapstructure:"port"`
-	Path    string `mapstructure:"path"`
-}'''
-        elif project_type == "grpc":
-            return '''
-type GRPCConfig struct {
-	Port    string `mapstructure:"port"`
-	Address string `mapstructure:"address"`
-}'''
-        return ""
+# README fragments keyed by project type; assembled with a single join
+# in _get_readme_template instead of repeated string concatenation.
+_README_HEADER = '''# {project_name}
 
-    def _get_additional_config_functions(self, project_type: str) -> str:
-        """Get additional config functions based on project type."""
-        if project_type == "microservice":
-            return '''
-func (c *Config) GetMetricsPort() string {
-	if c.Metrics.Port != "" {
-		return c.Metrics.Port
-	}
-	return "9090"
-}'''
-        return ""
+A modern Go web application built with the Gin framework.
 
-    def _get_dev_config_template(self) -> str:
-        """Get development config template."""
-        return '''server:
-  port: "8080"
-  mode: "debug"
+## Features
 
-database:
-  host: "localhost"
-  port: "5432"
-  user: "postgres"
-  password: "postgres"
-  dbname: "myapp_dev"
-  sslmode: "disable"
+- ⚡ High-performance HTTP router
+- 🏗️ Clean architecture with separation of concerns
+- 🔧 Configuration management with Viper
+- 📝 Structured logging
+- 🐳 Docker support
+- 🧪 Unit and integration tests
+- 📊 API documentation with Swagger
+- 🔒 JWT authentication
+- 📈 Metrics and monitoring
+'''
 
-redis:
-  host: "localhost"
-  port: "6379"
-  password: ""
-  db: 0
+_README_FEATURES_BY_TYPE = {
+    "api": '''- 🔄 RESTful API design
+- ✅ Input validation
+- 🌐 CORS support
+''',
+    "web": '''- 🎨 HTML template rendering
+- 📁 Static file serving
+- 🌐 Web interface
+''',
+    "microservice": '''- 🏥 Health checks
+- 📊 Prometheus metrics
+- 🔄 Graceful shutdown
+- 📋 Service discovery ready
+''',
+    "grpc": '''- 🚀 gRPC server
+- 🌐 HTTP/JSON gateway
+- 📡 Protocol Buffers
+''',
+}
 
-jwt:
-  secret: "your-secret-key-change-in-production"
-  expiration: 24
+_README_FOOTER = '''
 
-log:
-  level: "debug"
-  format: "console"
-'''
+## Quick Start
 
-    def _get_prod_config_template(self) -> str:
-        """Get production config template."""
-        return '''server:
-  port: "8080"
-  mode: "release"
+### Prerequisites
 
-database:
-  host: "${DB_HOST}"
-  port: "${DB_PORT}"
-  user: "${DB_USER}"
-  password: "${DB_PASSWORD}"
-  dbname: "${DB_NAME}"
-  sslmode: "require"
+- Go 1.21 or later
+- Docker and Docker Compose
+- PostgreSQL (for full functionality)
+- Redis (for caching)
 
-redis:
-  host: "${REDIS_HOST}"
-  port: "${REDIS_PORT}"
-  password: "${REDIS_PASSWORD}"
-  db: 0
+### Installation
 
-jwt:
-  secret: "${JWT_SECRET}"
-  expiration: 24
+1. Clone the repository:
+```bash
+git clone <repository-url>
+cd {project_name}
+```
 
-log:
-  level: "info"
-  format: "json"
-'''
+2. Install dependencies:
+```bash
+go mod download
+```
 
-    def create_docker_files(self, project_type: str = "api") -> None:
-        """
-        Create Docker-related files.
+3. Set up environment variables:
+```bash
+cp configs/config.dev.yaml configs/config.yaml
+# Edit configs/config.yaml with your settings
+```
 
-        Args:
-            project_type: Type of project being created
-        """
-        # Dockerfile
-        dockerfile = self.project_path / "Dockerfile"
-        dockerfile.write_text(self._get_dockerfile_template())
+4. Run with Docker Compose (recommended):
+```bash
+docker-compose up -d
+```
 
-        # docker-compose.yml
-        compose_file = self.project_path / "docker-compose.yml"
-        compose_file.write_text(self._get_docker_compose_template(project_type))
+5. Or run locally:
+```bash
+go run cmd/server/main.go
+```
 
-        # .dockerignore
-        dockerignore = self.project_path / ".dockerignore"
-        dockerignore.write_text(self._get_dockerignore_template())
+### Development
 
-    def _get_dockerfile_template(self) -> str:
-        """Get Dockerfile template."""
-        return '''# Build stage
-FROM golang:1.21-alpine AS builder
+#### Running Tests
+```bash
+# Run all tests
+go test ./...
 
-WORKDIR /app
+# Run tests with coverage
+go test -cover ./...
 
-# Install dependencies
-COPY go.mod go.sum ./
-RUN go mod download
+# Generate coverage report
+go test -coverprofile=coverage.out ./...
+go tool cover -html=coverage.out
+```
 
-# Copy source code
-COPY . .
+#### Live Reload
+```bash
+# Install air
+go install github.com/air-verse/air@latest
 
-# Build the application
-RUN CGO_ENABLED=0 GOOS=linux go build -a -installsuffix cgo -o main cmd/server/main.go
-
-# Final stage
-FROM alpine:latest
-
-RUN apk --no-cache add ca-certificates tzdata
+# Run with live reload
+air
+```
 
-WORKDIR /root/
+## API Documentation
 
-# Copy the binary from builder stage
-COPY --from=builder /app/main .
+Once the server is running, visit:
 
-# Copy config files
-COPY --from=builder /app/configs ./configs
+- Swagger UI: http://localhost:8080/swagger/index.html
+- Health Check: http://localhost:8080/api/v1/health
 
-# Expose port
-EXPOSE 8080
+## Configuration
 
-# Run the binary
-CMD ["./main"]
-'''
+The application uses YAML configuration files located in the `configs/` directory:
 
-    def _get_docker_compose_template(self, project_type: str) -> str:
-        """Get docker-compose.yml template."""
-        base_compose = '''version: '3.8'
+- `config.dev.yaml` - Development environment
+- `config.prod.yaml` - Production environment
 
-services:
-  app:
-    build: .
-    ports:
-      - "8080:8080"
-    environment:
-      - GIN_MODE=release
-    depends_on:
-      - postgres
-      - redis
-    volumes:
-      - ./configs:/root/configs
+Configuration can also be set via environment variables.
 
-  postgres:
-    image: postgres:15-alpine
-    environment:
-      POSTGRES_DB: myapp
-      POSTGRES_USER: postgres
-      POSTGRES_PASSWORD: postgres
-    ports:
-      - "5432:5432"
-    volumes:
-      - postgres_data:/var/lib/postgresql/data
+## Project Structure
 
-  redis:
-    image: redis:7-alpine
-    ports:
-      - "6379:6379"
-    volumes:
-      - redis_data:/data
+```
+{project_name}/
+├── cmd/server/          # Application entry point
+├── internal/            # Private application code
+│   ├── config/         # Configuration
+│   ├── handler/        # HTTP handlers
+│   ├── middleware/     # HTTP middleware
+│   ├── model/          # Data models
+│   ├── repository/     # Data access layer
+│   └── service/        # Business logic
+├── pkg/                # Public library code
+├── api/                # API definitions
+├── web/                # Web assets
+├── configs/            # Configuration files
+├── scripts/            # Build and deployment scripts
+└── docs/               # Documentation
+```
 
-volumes:
-  postgres_data:
-  redis_data:
-'''
+## Contributing
 
-        if project_type == "microservice":
-            base_compose += '''
-  prometheus:
-    image: prom/prometheus:latest
-    ports:
-      - "9090:9090"
-    volumes:
-      - ./monitoring/prometheus.yml:/etc/prometheus/prometheus.yml
+1. Fork the repository
+2. Create your feature branch (`git checkout -b feature/amazing-feature`)
+3. Commit your changes (`git commit -m 'Add some amazing feature'`)
+4. Push to the branch (`git push origin feature/amazing-feature`)
+5. Open a Pull Request
 
-  grafana:
-    image: grafana/grafana:latest
-    ports:
-      - "3000:3000"
-    environment:
-      - GF_SECURITY_ADMIN_PASSWORD=admin
-    volumes:
-      - grafana_data:/var/lib/grafana
+## License
 
-volumes:
-  grafana_data:
+This project is licensed under the MIT License - see the LICENSE file for details.
 '''
 
-        return base_compose
-
-    def _get_dockerignore_template(self) -> str:
-        """Get .dockerignore template."""
-        return '''# Git
-.git
-.gitignore
-
-# Documentation
-README.md
-docs/
-
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
 
-# OS
-.DS_Store
-Thumbs.db
+# The Makefile has a single interpolation point; keeping it as a plain
+# literal with one str.replace avoids re-parsing the $$-heavy body
+# through the f-string machinery on every call.
+_MAKEFILE_TMPL = '''.PHONY: help build run test clean docker-build docker-run docker-stop lint format
 
-# Logs
-*.log
+# Variables
+APP_NAME := {project_name}
+VERSION := $$(shell git describe --tags --always --dirty)
+BUILD_TIME := $$(shell date +%Y-%m-%dT%H:%M:%S%z)
+LDFLAGS := -ldflags "-X main.version=$$(VERSION) -X main.buildTime=$$(BUILD_TIME)"
 
-# Test files
-*_test.go
-test/
+# Help
+help: ## Show this help message
+	@echo 'Usage: make [target]'
+	@echo ''
+	@echo 'Available targets:'
+	@awk 'BEGIN {FS = ":.*?## "} /^[a-zA-Z_-]+:.*?## / {printf "  %-15s %s\n", $$1, $$2}' $$(MAKEFILE_LIST)
 
-# Build artifacts
-*.exe
-main
-/vendor/
+# Build
+build: ## Build the application
+	go build $$(LDFLAGS) -o bin/$$(APP_NAME) cmd/server/main.go
 
-# Config files (sensitive data)
-.env
-config.prod.yaml
-'''
+run: ## Run the application
+	go run cmd/server/main.go
 
-    def create_gitignore(self) -> None:
-        """Create .gitignore file."""
-        gitignore_file = self.project_path / ".gitignore"
-        gitignore_content = '''# Binaries for programs and plugins
-*.exe
-*.exe~
-*.dll
-*.so
-*.dylib
+# Testing
+test: ## Run tests
+	go test -v ./...
 
-# Test binary, built with `go test -c`
-*.test
+test-coverage: ## Run tests with coverage
+	go test -coverprofile=coverage.out ./...
+	go tool cover -html=coverage.out -o coverage.html
 
-# Output of the go coverage tool
-*.out
+test-integration: ## Run integration tests
+	go test -tags=integration ./test/integration/...
 
-# Go workspace file
-go.work
+# Code Quality
+lint: ## Run linter
+	golangci-lint run
 
-# Dependency directories
-vendor/
+format: ## Format code
+	go fmt ./...
+	goimports -w .
 
-# IDE
-.vscode/
-.idea/
-*.swp
-*.swo
+# Docker
+docker-build: ## Build Docker image
+	docker build -t $$(APP_NAME):$$(VERSION) .
+	docker tag $$(APP_NAME):$$(VERSION) $$(APP_NAME):latest
 
-# OS
-.DS_Store
-Thumbs.db
+docker-run: ## Run with Docker Compose
+	docker-compose up -d
 
-# Environment files
-.env
-.env.local
-.env.*.local
+docker-stop: ## Stop Docker Compose
+	docker-compose down
 
-# Config files
-config.prod.yaml
+docker-logs: ## Show Docker logs
+	docker-compose logs -f
 
-# Logs
-*.log
-logs/
+# Development
+dev: ## Run in development mode with hot reload
+	air
 
-# Build output
-/build/
-/dist/
-/bin/
+install-deps: ## Install development dependencies
+	go install github.com/air-verse/air@latest
+	go install golang.org/x/tools/cmd/goimports@latest
+	go install github.com/golangci/golangci-lint/cmd/golangci-lint@latest
 
 # Database
-*.db
-*.sqlite
+migrate-up: ## Run database migrations
+	go run cmd/migrate/main.go up
 
-# Temporary files
-*.tmp
-*.temp
+migrate-down: ## Rollback database migrations
+	go run cmd/migrate/main.go down
 
-# Coverage
-coverage.txt
-coverage.out
+migrate-create: ## Create new migration (use name=migration_name)
+	@if [ -z "$$(name)" ]; then echo "Usage: make migrate-create name=migration_name"; exit 1; fi
+	migrate create -ext sql -dir migrations $$(name)
 
-# Air (live reload)
-tmp/
-'''
-        gitignore_file.write_text(gitignore_content)
+# Clean
+clean: ## Clean build artifacts
+	rm -rf bin/
+	rm -f coverage.out coverage.html
+	go clean -cache
 
-    def create_readme(self, project_type: str = "api") -> None:
-        """
-        Create README.md file.
+# Install
+install: build ## Install the application
+	cp bin/$$(APP_NAME) $$(GOPATH)/bin/
 
-        Args:
-            project_type: Type of project being created
-        """
-        readme_file = self.project_path / "README.md"
-        readme_file.write_text(self._get_readme_template(project_type))
+# Release
+release: clean test lint build ## Prepare a release
+	@echo "Release ready: $$(APP_NAME):$$(VERSION)"
+'''
 
-    def _get_readme_template(self, project_type: str) -> str:
-        """Get README.md template."""
-        base_readme = f'''# {self.project_name}
 
-A modern Go web application built with the Gin framework.
+# Fixed template bodies, encoded to bytes once at import so the getters
+# hand back the same constant object instead of re-materializing the
+# literal (and re-encoding it) on every generated project.
+_DEV_CONFIG_YAML = b'''server:
+  port: "8080"
+  mode: "debug"
 
-## Features
-
-- ⚡ High-performance HTTP router
-- 🏗️ Clean architecture with separation of concerns
-- 🔧 Configuration management with Viper
-- 📝 Structured logging
-- 🐳 Docker support
-- 🧪 Unit and integration tests
-- 📊 API documentation with Swagger
-- 🔒 JWT authentication
-- 📈 Metrics and monitoring
-'''
-
-        if project_type == "api":
-            base_readme += '''- 🔄 RESTful API design
-- ✅ Input validation
-- 🌐 CORS support
-'''
-        elif project_type == "web":
-            base_readme += '''- 🎨 HTML template rendering
-- 📁 Static file serving
-- 🌐 Web interface
-'''
-        elif project_type == "microservice":
-            base_readme += '''- 🏥 Health checks
-- 📊 Prometheus metrics
-- 🔄 Graceful shutdown
-- 📋 Service discovery ready
-'''
-        elif project_type == "grpc":
-            base_readme += '''- 🚀 gRPC server
-- 🌐 HTTP/JSON gateway
-- 📡 Protocol Buffers
-'''
-
-        base_readme += f'''
+database:
+  host: "localhost"
+  port: "5432"
+  user: "postgres"
+  password: "postgres"
+  dbname: "myapp_dev"
+  sslmode: "disable"
 
-## Quick Start
+redis:
+  host: "localhost"
+  port: "6379"
+  password: ""
+  db: 0
 
-### Prerequisites
+jwt:
+  secret: "your-secret-key-change-in-production"
+  expiration: 24
 
-- Go 1.21 or later
-- Docker and Docker Compose
-- PostgreSQL (for full functionality)
-- Redis (for caching)
+log:
+  level: "debug"
+  format: "console"
+'''
 
-### Installation
+_PROD_CONFIG_YAML = b'''server:
+  port: "8080"
+  mode: "release"
 
-1. Clone the repository:
-```bash
-git clone <repository-url>
-cd {self.project_name}
-```
+database:
+  host: "${DB_HOST}"
+  port: "${DB_PORT}"
+  user: "${DB_USER}"
+  password: "${DB_PASSWORD}"
+  dbname: "${DB_NAME}"
+  sslmode: "require"
 
-2. Install dependencies:
-```bash
-go mod download
-```
+redis:
+  host: "${REDIS_HOST}"
+  port: "${REDIS_PORT}"
+  password: "${REDIS_PASSWORD}"
+  db: 0
 
-3. Set up environment variables:
-```bash
-cp configs/config.dev.yaml configs/config.yaml
-# Edit configs/config.yaml with your settings
-```
+jwt:
+  secret: "${JWT_SECRET}"
+  expiration: 24
 
-4. Run with Docker Compose (recommended):
-```bash
-docker-compose up -d
-```
+log:
+  level: "info"
+  format: "json"
+'''
 
-5. Or run locally:
-```bash
-go run cmd/server/main.go
-```
+_DOCKERFILE = b'''# Build stage
+FROM golang:1.21-alpine AS builder
 
-### Development
+WORKDIR /app
 
-#### Running Tests
-```bash
-# Run all tests
-go test ./...
+# Install dependencies
+COPY go.mod go.sum ./
+RUN go mod download
 
-# Run tests with coverage
-go test -cover ./...
+# Copy source code
+COPY . .
 
-# Generate coverage report
-go test -coverprofile=coverage.out ./...
-go tool cover -html=coverage.out
-```
+# Build the application
+RUN CGO_ENABLED=0 GOOS=linux go build -a -installsuffix cgo -o main cmd/server/main.go
 
-#### Live Reload
-```bash
-# Install air
-go install github.com/air-verse/air@latest
+# Final stage
+FROM alpine:latest
 
-# Run with live reload
-air
-```
+RUN apk --no-cache add ca-certificates tzdata
 
-## API Documentation
+WORKDIR /root/
 
-Once the server is running, visit:
+# Copy the binary from builder stage
+COPY --from=builder /app/main .
 
-- Swagger UI: http://localhost:8080/swagger/index.html
-- Health Check: http://localhost:8080/api/v1/health
+# Copy config files
+COPY --from=builder /app/configs ./configs
 
-## Configuration
+# Expose port
+EXPOSE 8080
 
-The application uses YAML configuration files located in the `configs/` directory:
+# Run the binary
+CMD ["./main"]
+'''
 
-- `config.dev.yaml` - Development environment
-- `config.prod.yaml` - Production environment
+_DOCKERIGNORE = b'''# Git
+.git
+.gitignore
 
-Configuration can also be set via environment variables.
+# Documentation
+README.md
+docs/
 
-## Project Structure
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
 
-```
-{self.project_name}/
-├── cmd/server/          # Application entry point
-├── internal/            # Private application code
-│   ├── config/         # Configuration
-│   ├── handler/        # HTTP handlers
-│   ├── middleware/     # HTTP middleware
-│   ├── model/          # Data models
-│   ├── repository/     # Data access layer
-│   └── service/        # Business logic
-├── pkg/                # Public library code
-├── api/                # API definitions
-├── web/                # Web assets
-├── configs/            # Configuration files
-├── scripts/            # Build and deployment scripts
-└── docs/               # Documentation
-```
+# OS
+.DS_Store
+Thumbs.db
 
-## Contributing
+# Logs
+*.log
 
-1. Fork the repository
-2. Create your feature branch (`git checkout -b feature/amazing-feature`)
-3. Commit your changes (`git commit -m 'Add some amazing feature'`)
-4. Push to the branch (`git push origin feature/amazing-feature`)
-5. Open a Pull Request
+# Test files
+*_test.go
+test/
 
-## License
+# Build artifacts
+*.exe
+main
+/vendor/
 
-This project is licensed under the MIT License - see the LICENSE file for details.
+# Config files (sensitive data)
+.env
+config.prod.yaml
 '''
 
-        return base_readme
-
-    def create_makefile(self) -> None:
-        """Create Makefile for common tasks."""
-        makefile = self.project_path / "Makefile"
-        makefile_content = f'''.PHONY: help build run test clean docker-build docker-run docker-stop lint format
+_HEALTH_HANDLER_GO = b'''package handler
 
-# Variables
-APP_NAME := {self.project_name}
-VERSION := $$(shell git describe --tags --always --dirty)
-BUILD_TIME := $$(shell date +%Y-%m-%dT%H:%M:%S%z)
-LDFLAGS := -ldflags "-X main.version=$$(VERSION) -X main.buildTime=$$(BUILD_TIME)"
+import (
+	"net/http"
+	"time"
 
-# Help
-help: ## Show this help message
-	@echo 'Usage: make [target]'
-	@echo ''
-	@echo 'Available targets:'
-	@awk 'BEGIN {{FS = ":.*?## "}} /^[a-zA-Z_-]+:.*?## / {{printf "  %-15s %s\n", $$1, $$2}}' $$(MAKEFILE_LIST)
+	"github.com/gin-gonic/gin"
+)
 
-# Build
-build: ## Build the application
-	go build $$(LDFLAGS) -o bin/$$(APP_NAME) cmd/server/main.go
+type HealthHandler struct {
+	startTime time.Time
+}
 
-run: ## Run the application
-	go run cmd/server/main.go
+func NewHealthHandler(router *gin.RouterGroup) *HealthHandler {
+	h := &HealthHandler{
+		startTime: time.Now(),
+	}
 
-# Testing
-test: ## Run tests
-	go test -v ./...
+	health := router.Group("/health")
+	{
+		health.GET("/", h.Check)
+		health.GET("/detailed", h.DetailedCheck)
+	}
 
-test-coverage: ## Run tests with coverage
-	go test -coverprofile=coverage.out ./...
-	go tool cover -html=coverage.out -o coverage.html
+	return h
+}
 
-test-integration: ## Run integration tests
-	go test -tags=integration ./test/integration/...
+type HealthResponse struct {
+	Status    string    `json:"status"`
+	Timestamp time.Time `json:"timestamp"`
+	Uptime    string    `json:"uptime"`
+	Version   string    `json:"version"`
+}
 
-# Code Quality
-lint: ## Run linter
-	golangci-lint run
-
-format: ## Format code
-	go fmt ./...
-	goimports -w .
-
-# Docker
-docker-build: ## Build Docker image
-	docker build -t $$(APP_NAME):$$(VERSION) .
-	docker tag $$(APP_NAME):$$(VERSION) $$(APP_NAME):latest
-
-docker-run: ## Run with Docker Compose
-	docker-compose up -d
-
-docker-stop: ## Stop Docker Compose
-	docker-compose down
-
-docker-logs: ## Show Docker logs
-	docker-compose logs -f
-
-# Development
-dev: ## Run in development mode with hot reload
-	air
-
-install-deps: ## Install development dependencies
-	go install github.com/air-verse/air@latest
-	go install golang.org/x/tools/cmd/goimports@latest
-	go install github.com/golangci/golangci-lint/cmd/golangci-lint@latest
-
-# Database
-migrate-up: ## Run database migrations
-	go run cmd/migrate/main.go up
-
-migrate-down: ## Rollback database migrations
-	go run cmd/migrate/main.go down
-
-migrate-create: ## Create new migration (use name=migration_name)
-	@if [ -z "$$(name)" ]; then echo "Usage: make migrate-create name=migration_name"; exit 1; fi
-	migrate create -ext sql -dir migrations $$(name)
-
-# Clean
-clean: ## Clean build artifacts
-	rm -rf bin/
-	rm -f coverage.out coverage.html
-	go clean -cache
-
-# Install
-install: build ## Install the application
-	cp bin/$$(APP_NAME) $$(GOPATH)/bin/
-
-# Release
-release: clean test lint build ## Prepare a release
-	@echo "Release ready: $$(APP_NAME):$$(VERSION)"
-'''
-        makefile.write_text(makefile_content)
-
-    def create_basic_handlers(self, project_type: str = "api") -> None:
-        """
-        Create basic handler files.
-
-        Args:
-            project_type: Type of project being created
-        """
-        # Health handler
-        health_file = self.project_path / "internal/handler/health.go"
-        health_file.write_text(self._get_health_handler_template())
-
-        # Example handler
-        example_file = self.project_path / "internal/handler/example.go"
-        example_file.write_text(self._get_example_handler_template())
-
-        if project_type == "web":
-            # Web handler
-            web_file = self.project_path / "internal/handler/web.go"
-            web_file.write_text(self._get_web_handler_template())
-
-    def _get_health_handler_template(self) -> str:
-        """Get health handler template."""
-        return '''package handler
-
-import (
-	"net/http"
-	"time"
-
-	"github.com/gin-gonic/gin"
-)
-
-type HealthHandler struct {
-	startTime time.Time
-}
-
-func NewHealthHandler(router *gin.RouterGroup) *HealthHandler {
-	h := &HealthHandler{
-		startTime: time.Now(),
-	}
-
-	health := router.Group("/health")
-	{
-		health.GET("/", h.Check)
-		health.GET("/detailed", h.DetailedCheck)
-	}
-
-	return h
-}
-
-type HealthResponse struct {
-	Status    string    `json:"status"`
-	Timestamp time.Time `json:"timestamp"`
-	Uptime    string    `json:"uptime"`
-	Version   string    `json:"version"`
-}
-
-func (h *HealthHandler) Check(c *gin.Context) {
-	c.JSON(http.StatusOK, HealthResponse{
-		Status:    "ok",
-		Timestamp: time.Now(),
-		Uptime:    time.Since(h.startTime).String(),
-		Version:   "1.0.0",
-	})
-}
+func (h *HealthHandler) Check(c *gin.Context) {
+	c.JSON(http.StatusOK, HealthResponse{
+		Status:    "ok",
+		Timestamp: time.Now(),
+		Uptime:    time.Since(h.startTime).String(),
+		Version:   "1.0.0",
+	})
+}
 
 func (h *HealthHandler) DetailedCheck(c *gin.Context) {
 	// Add more detailed health checks here
@@ -1150,9 +847,7 @@ func (h *HealthHandler) DetailedCheck(c *gin.Context) {
 }
 '''
 
-    def _get_example_handler_template(self) -> str:
-        """Get example handler template."""
-        return '''package handler
+_EXAMPLE_HANDLER_GO = b'''package handler
 
 import (
 	"net/http"
@@ -1218,219 +913,816 @@ func (h *ExampleHandler) GetExample(c *gin.Context) {
 	})
 }
 
-func (h *ExampleHandler) CreateExample(c *gin.Context) {
-	var req struct {
-		Name  string `json:"name" binding:"required"`
-		Value string `json:"value" binding:"required"`
-	}
+func (h *ExampleHandler) CreateExample(c *gin.Context) {
+	var req struct {
+		Name  string `json:"name" binding:"required"`
+		Value string `json:"value" binding:"required"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	// Create example - replace with actual data access
+	example := Example{
+		ID:    3, // Should be generated by database
+		Name:  req.Name,
+		Value: req.Value,
+	}
+
+	c.JSON(http.StatusCreated, gin.H{
+		"data": example,
+	})
+}
+
+func (h *ExampleHandler) UpdateExample(c *gin.Context) {
+	id, err := strconv.Atoi(c.Param("id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
+		return
+	}
+
+	var req struct {
+		Name  string `json:"name"`
+		Value string `json:"value"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	// Update example - replace with actual data access
+	example := Example{
+		ID:    id,
+		Name:  req.Name,
+		Value: req.Value,
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"data": example,
+	})
+}
+
+func (h *ExampleHandler) DeleteExample(c *gin.Context) {
+	id, err := strconv.Atoi(c.Param("id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
+		return
+	}
+
+	// Delete example - replace with actual data access
+
+	c.JSON(http.StatusOK, gin.H{
+		"message": "Example deleted successfully",
+		"id": id,
+	})
+}
+'''
+
+_WEB_HANDLER_TMPL = Template('''package handler
+
+import (
+	"net/http"
+
+	"${module_path}/internal/render"
+
+	"github.com/gin-gonic/gin"
+)
+
+type WebHandler struct {
+	// Add dependencies here
+}
+
+func NewWebHandler() *WebHandler {
+	return &WebHandler{}
+}
+
+func (h *WebHandler) Home(c *gin.Context) {
+	render.HTML(c, http.StatusOK, "index.html", gin.H{
+		// Two operands: plain + beats Sprintf/Builder here. Switch to
+		// strings.Builder once a third fragment joins the concatenation.
+		"title": "Welcome to " + c.Request.Host,
+	})
+}
+
+func (h *WebHandler) About(c *gin.Context) {
+	render.HTML(c, http.StatusOK, "about.html", gin.H{
+		"title": "About Us",
+	})
+}
+''')
+
+_RENDER_GO = b'''package render
+
+import (
+	"bytes"
+	"html/template"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+// templates is parsed once at package init; HTML below executes into a
+// pooled buffer so per-request rendering does not allocate a fresh one.
+var templates = template.Must(template.ParseGlob("web/templates/*"))
+
+var bufPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
+// HTML executes the named template into a pooled buffer and writes the
+// result with a single Data call.
+func HTML(c *gin.Context, status int, name string, data any) {
+	buf := bufPool.Get().(*bytes.Buffer)
+	defer func() {
+		buf.Reset()
+		bufPool.Put(buf)
+	}()
+
+	if err := templates.ExecuteTemplate(buf, name, data); err != nil {
+		c.AbortWithError(500, err)
+		return
+	}
+
+	c.Data(status, "text/html; charset=utf-8", buf.Bytes())
+}
+'''
+
+_LOG_MW_GO = b'''package middleware
+
+import (
+	"github.com/sirupsen/logrus"
+)
+
+// logger is shared by every middleware in this package. It is constructed
+// and configured exactly once at package init instead of per middleware
+// install, so Logger() and Recovery() close over the same instance.
+var logger = func() *logrus.Logger {
+	l := logrus.New()
+	l.SetFormatter(&logrus.JSONFormatter{})
+	return l
+}()
+'''
+
+_LOGGER_MW_GO = b'''package middleware
+
+import (
+	"strings"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+func Logger() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		start := time.Now()
+		path := c.Request.URL.Path
+		raw := c.Request.URL.RawQuery
+
+		// Process request
+		c.Next()
+
+		// Log request
+		latency := time.Since(start)
+		clientIP := c.ClientIP()
+		method := c.Request.Method
+		statusCode := c.Writer.Status()
+
+		if raw != "" {
+			// Assemble with strings.Builder: one sized allocation on this
+			// per-request path, and the pattern to copy when extending the
+			// log line with more fragments.
+			var sb strings.Builder
+			sb.Grow(len(path) + 1 + len(raw))
+			sb.WriteString(path)
+			sb.WriteByte('?')
+			sb.WriteString(raw)
+			path = sb.String()
+		}
+
+		logger.WithFields(logrus.Fields{
+			"method":     method,
+			"path":       path,
+			"status":     statusCode,
+			"latency":    latency,
+			"client_ip":  clientIP,
+			"user_agent": c.Request.UserAgent(),
+		}).Info("Request processed")
+	}
+}
+'''
+
+_RECOVERY_MW_GO = b'''package middleware
+
+import (
+	"net/http"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+func Recovery() gin.HandlerFunc {
+	return gin.CustomRecovery(func(c *gin.Context, recovered interface{}) {
+		logger.WithFields(logrus.Fields{
+			"error":  recovered,
+			"method": c.Request.Method,
+			"path":   c.Request.URL.Path,
+		}).Error("Panic recovered")
+
+		c.JSON(http.StatusInternalServerError, gin.H{
+			"error": "Internal server error",
+		})
+	})
+}
+'''
+
+_CORS_MW_GO = b'''package middleware
+
+import (
+	"net/http"
+
+	"github.com/gin-gonic/gin"
+)
+
+func CORS() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		c.Header("Access-Control-Allow-Origin", "*")
+		c.Header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
+		c.Header("Access-Control-Allow-Headers", "Origin, Content-Type, Authorization")
+		c.Header("Access-Control-Allow-Credentials", "true")
+
+		if c.Request.Method == "OPTIONS" {
+			c.AbortWithStatus(http.StatusNoContent)
+			return
+		}
+
+		c.Next()
+	}
+}
+'''
+
+_DOCKER_COMPOSE_BASE = b'''version: '3.8'
+
+services:
+  app:
+    build: .
+    ports:
+      - "8080:8080"
+    environment:
+      - GIN_MODE=release
+    depends_on:
+      - postgres
+      - redis
+    volumes:
+      - ./configs:/root/configs
+
+  postgres:
+    image: postgres:15-alpine
+    environment:
+      POSTGRES_DB: myapp
+      POSTGRES_USER: postgres
+      POSTGRES_PASSWORD: postgres
+    ports:
+      - "5432:5432"
+    volumes:
+      - postgres_data:/var/lib/postgresql/data
+
+  redis:
+    image: redis:7-alpine
+    ports:
+      - "6379:6379"
+    volumes:
+      - redis_data:/data
+
+volumes:
+  postgres_data:
+  redis_data:
+'''
+
+_DOCKER_COMPOSE_MICROSERVICE_EXTRA = b'''
+  prometheus:
+    image: prom/prometheus:latest
+    ports:
+      - "9090:9090"
+    volumes:
+      - ./monitoring/prometheus.yml:/etc/prometheus/prometheus.yml
+
+  grafana:
+    image: grafana/grafana:latest
+    ports:
+      - "3000:3000"
+    environment:
+      - GF_SECURITY_ADMIN_PASSWORD=admin
+    volumes:
+      - grafana_data:/var/lib/grafana
+
+volumes:
+  grafana_data:
+'''
+
+_GITIGNORE = b'''# Binaries for programs and plugins
+*.exe
+*.exe~
+*.dll
+*.so
+*.dylib
+
+# Test binary, built with `go test -c`
+*.test
+
+# Output of the go coverage tool
+*.out
+
+# Go workspace file
+go.work
+
+# Dependency directories
+vendor/
+
+# IDE
+.vscode/
+.idea/
+*.swp
+*.swo
+
+# OS
+.DS_Store
+Thumbs.db
+
+# Environment files
+.env
+.env.local
+.env.*.local
+
+# Config files
+config.prod.yaml
+
+# Logs
+*.log
+logs/
+
+# Build output
+/build/
+/dist/
+/bin/
+
+# Database
+*.db
+*.sqlite
+
+# Temporary files
+*.tmp
+*.temp
+
+# Coverage
+coverage.txt
+coverage.out
+
+# Air (live reload)
+tmp/
+'''
+
+
+class GoProjectStructure:
+    """Creates and manages Go project directory structure."""
+
+    def __init__(self, project_name: str, project_path: str,
+                 module_path: Optional[str] = None):
+        """
+        Initialize project structure creator.
+
+        Args:
+            project_name: Name of the project
+            project_path: Base path where project will be created
+            module_path: Go module path; defaults to github.com/username/<name>
+        """
+        self.project_name = project_name
+        self.project_path = Path(project_path) / project_name
+        # Cached str form for the hot os-level calls; Path.__truediv__ pays
+        # parse/normalize/allocate costs we don't want in tight loops.
+        self._project_path_str = os.fspath(self.project_path)
+        self.module_path = module_path or f"github.com/username/{project_name}"
+        self._pending_writes: List[Tuple[str, bytes]] = []
+        self._defer_writes = False
+        # Table-driven main.go template resolution: one dict lookup instead
+        # of a chain of string comparisons, and adding a project type is a
+        # single table edit.
+        self._main_template_by_type = {
+            "api": self._get_api_main_template,
+            "web": self._get_web_main_template,
+            "microservice": self._get_microservice_main_template,
+            "grpc": self._get_grpc_main_template,
+        }
+
+    def _queue_write(self, relative_path: str, content) -> None:
+        """Queue a file write, encoding str content to bytes once up front.
+
+        Templates without interpolation points are already bytes constants
+        and skip the encode entirely.
+        """
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        self._pending_writes.append((relative_path, content))
+
+    def _write_one(self, pending: Tuple[str, bytes]) -> None:
+        """Write a single queued file with raw os calls.
+
+        The raw os.open/os.write pair skips pathlib's per-call stat and
+        normalization overhead.
+        """
+        relative_path, data = pending
+        fd = os.open(
+            os.path.join(self._project_path_str, relative_path),
+            os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        )
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+
+    def _flush_writes(self) -> None:
+        """
+        Write all queued files, sorted by path so files in the same
+        directory are written back-to-back (directory locality keeps the
+        dentry cache warm).
+
+        No-op while create_all is deferring writes for a single parallel
+        flush at the end.
+        """
+        if self._defer_writes:
+            return
+        self._pending_writes.sort(key=lambda pending: pending[0])
+        self._write_batch(self._pending_writes)
+        self._pending_writes.clear()
+
+    def _write_batch(self, pending: List[Tuple[str, bytes]]) -> None:
+        """
+        Write a batch of files, preferring the io_uring path when it pays.
+
+        A single io_uring submission is only worthwhile once several
+        operations amortize the ring setup; below four files plain
+        os.write wins, so small batches always take the synchronous path.
+        """
+        if liburing is not None and len(pending) >= 4 and self._write_batch_iouring(pending):
+            return
+        for item in pending:
+            self._write_one(item)
+
+    def _write_batch_iouring(self, pending: List[Tuple[str, bytes]]) -> bool:
+        """
+        Submit the whole batch as linked openat->write->close io_uring ops.
+
+        Each file becomes a chain of three linked SQEs targeting a direct
+        descriptor slot, so one io_uring_enter replaces the three syscalls
+        per file the synchronous writer pays. Returns False if submission
+        fails for any reason so the caller can fall back.
+        """
+        ring = liburing.io_uring()
+        ring_ready = False
+        try:
+            liburing.io_uring_queue_init(max(64, len(pending) * 4), ring)
+            ring_ready = True
+            liburing.io_uring_register_files_sparse(ring, len(pending))
+
+            for slot, (relative_path, data) in enumerate(pending):
+                path = os.path.join(self._project_path_str, relative_path).encode()
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_openat_direct(
+                    sqe, path,
+                    flags=os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                    mode=0o666, file_index=slot,
+                )
+                sqe.flags |= liburing.IOSQE_IO_LINK
+
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_write(sqe, slot, data, len(data), 0)
+                sqe.flags |= liburing.IOSQE_FIXED_FILE | liburing.IOSQE_IO_LINK
+
+                sqe = liburing.io_uring_get_sqe(ring)
+                liburing.io_uring_prep_close_direct(sqe, slot)
+
+            cqe = liburing.io_uring_cqe()
+            liburing.io_uring_submit_and_wait(ring, len(pending) * 3)
+            for _ in range(len(pending) * 3):
+                liburing.io_uring_wait_cqe(ring, cqe)
+                if cqe.res < 0:
+                    return False
+                liburing.io_uring_cqe_seen(ring, cqe)
+            return True
+        except Exception:
+            # Any binding/kernel mismatch falls back to the sync writer.
+            return False
+        finally:
+            # Only tear down a ring that was actually set up: queue_exit
+            # on a failed init (e.g. RLIMIT_MEMLOCK) raises out of the
+            # finally and would defeat the fallback contract above.
+            if ring_ready:
+                try:
+                    liburing.io_uring_queue_exit(ring)
+                except Exception:
+                    pass
+
+    def build_plan(self, project_type: str = "api") -> Dict[str, bytes]:
+        """
+        Materialize every file the project needs as one {path: bytes} plan.
+
+        The eight create_* passes run with writes deferred, so this is pure
+        template work — no filesystem traffic — and len(plan) reports the
+        file count without listing any tree.
+
+        Args:
+            project_type: Type of project being created
+
+        Returns:
+            Mapping of project-relative paths to file contents
+        """
+        self._defer_writes = True
+        try:
+            self.create_main_file(project_type)
+            self.create_config_files(project_type)
+            self.create_basic_handlers(project_type)
+            self.create_basic_middleware()
+            self.create_docker_files(project_type)
+            self.create_gitignore()
+            self.create_makefile()
+            self.create_readme(project_type)
+        finally:
+            self._defer_writes = False
+
+        plan = dict(self._pending_writes)
+        self._pending_writes.clear()
+        return plan
+
+    def emit(self, plan: Dict[str, bytes], project_type: str = "api") -> None:
+        """
+        Write a plan to disk in a single fused pass.
+
+        The directory phase runs synchronously (file writes depend on it);
+        the planned file writes are independent of each other, so they go
+        through one io_uring submission when available or a thread pool
+        otherwise. The GIL is released during os.write, so wall-clock time
+        approaches the slowest single write rather than the sum.
+
+        Args:
+            plan: Mapping of project-relative paths to file contents
+            project_type: Type of project, for the directory layout
+        """
+        self.create_directory_structure(project_type)
+
+        pending = sorted(plan.items())
+
+        # One io_uring submission beats a thread pool when available; the
+        # pool remains the fallback for other platforms.
+        if liburing is not None and len(pending) >= 4 and self._write_batch_iouring(pending):
+            return
 
-	if err := c.ShouldBindJSON(&req); err != nil {
-		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
-		return
-	}
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self._write_one, pending))
 
-	// Create example - replace with actual data access
-	example := Example{
-		ID:    3, // Should be generated by database
-		Name:  req.Name,
-		Value: req.Value,
-	}
+    def create_all(self, project_type: str = "api") -> None:
+        """
+        Create the complete project: plan every file, then emit in one pass.
 
-	c.JSON(http.StatusCreated, gin.H{
-		"data": example,
-	})
-}
+        Args:
+            project_type: Type of project being created
+        """
+        self.emit(self.build_plan(project_type), project_type)
 
-func (h *ExampleHandler) UpdateExample(c *gin.Context) {
-	id, err := strconv.Atoi(c.Param("id"))
-	if err != nil {
-		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
-		return
-	}
+    def create_directory_structure(self, project_type: str = "api") -> None:
+        """
+        Create the standard Go project directory structure.
 
-	var req struct {
-		Name  string `json:"name"`
-		Value string `json:"value"`
-	}
+        Args:
+            project_type: Type of project ("api", "web", "microservice", "grpc")
+        """
+        base_dirs = _DIRS_BY_TYPE.get(project_type, _BASE_DIRS)
+
+        # Deduplicate directories: any ancestor of another entry is created
+        # transitively by mkdir(parents=True), so only leaf paths need a call.
+        unique_dirs = {Path(d) for d in base_dirs}
+        leaf_dirs = [
+            p for p in unique_dirs
+            if not any(p in other.parents for other in unique_dirs)
+        ]
 
-	if err := c.ShouldBindJSON(&req); err != nil {
-		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
-		return
-	}
+        # Create deepest paths first so each mkdir(parents=True) builds the
+        # maximum amount of new tree per call instead of re-statting prefixes.
+        # A leaf we just created is empty by construction (leaf_dirs holds no
+        # entry nested under another, so nothing later in the loop populates
+        # it). Recording existence before mkdir turns the per-directory
+        # scandir emptiness probe into a plain existence check.
+        for dir_path in sorted(leaf_dirs, key=lambda p: len(p.parts), reverse=True):
+            full_path = os.path.join(self._project_path_str, str(dir_path))
+            created_empty = not os.path.exists(full_path)
+            os.makedirs(full_path, exist_ok=True)
+            if created_empty:
+                os.close(os.open(
+                    os.path.join(full_path, ".gitkeep"),
+                    os.O_WRONLY | os.O_CREAT,
+                ))
 
-	// Update example - replace with actual data access
-	example := Example{
-		ID:    id,
-		Name:  req.Name,
-		Value: req.Value,
-	}
+    def create_main_file(self, project_type: str = "api") -> None:
+        """
+        Create the main.go file with basic setup.
 
-	c.JSON(http.StatusOK, gin.H{
-		"data": example,
-	})
-}
+        Args:
+            project_type: Type of project being created
+        """
+        # Unknown types default to the API template, as before
+        template = self._main_template_by_type.get(project_type, self._get_api_main_template)
 
-func (h *ExampleHandler) DeleteExample(c *gin.Context) {
-	id, err := strconv.Atoi(c.Param("id"))
-	if err != nil {
-		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
-		return
-	}
+        self._queue_write("cmd/server/main.go", template())
+        self._flush_writes()
 
-	// Delete example - replace with actual data access
+    def _get_api_main_template(self) -> str:
+        """Get main.go template for REST API projects."""
+        return _API_MAIN_TMPL.substitute(module_path=self.module_path)
 
-	c.JSON(http.StatusOK, gin.H{
-		"message": "Example deleted successfully",
-		"id": id,
-	})
-}
-'''
+    def _get_web_main_template(self) -> str:
+        """Get main.go template for web applications."""
+        return _WEB_MAIN_TMPL.substitute(module_path=self.module_path)
 
-    def _get_web_handler_template(self) -> str:
-        """Get web handler template."""
-        return '''package handler
+    def _get_microservice_main_template(self) -> str:
+        """Get main.go template for microservices."""
+        return _MICROSERVICE_MAIN_TMPL.substitute(module_path=self.module_path)
 
-import (
-	"net/http"
+    def _get_grpc_main_template(self) -> str:
+        """Get main.go template for gRPC gateway projects."""
+        return _GRPC_MAIN_TMPL.substitute(module_path=self.module_path)
 
-	"github.com/gin-gonic/gin"
-)
+    def create_config_files(self, project_type: str = "api") -> None:
+        """
+        Create configuration files for the project.
 
-type WebHandler struct {
-	// Add dependencies here
-}
+        Args:
+            project_type: Type of project being created
+        """
+        # Config struct plus environment config files, written in one batch
+        self._queue_write("internal/config/config.go", self._get_config_template(project_type))
+        self._queue_write("configs/config.dev.yaml", self._get_dev_config_template())
+        self._queue_write("configs/config.prod.yaml", self._get_prod_config_template())
+        self._flush_writes()
 
-func NewWebHandler() *WebHandler {
-	return &WebHandler{}
-}
+    def _get_config_template(self, project_type: str) -> str:
+        """Get config.go template."""
+        return _CONFIG_TMPL.substitute(
+            additional_config=self._get_additional_config(project_type),
+            additional_config_structs=self._get_additional_config_structs(project_type),
+            additional_config_functions=self._get_additional_config_functions(project_type),
+        )
 
-func (h *WebHandler) Home(c *gin.Context) {
-	c.HTML(http.StatusOK, "index.html", gin.H{
-		"title": "Welcome to " + c.Request.Host,
-	})
-}
+    def _get_additional_config(self, project_type: str) -> str:
+        """Get additional config fields based on project type."""
+        if project_type == "microservice":
+            return "Metrics MetricsConfig `mapstructure:\"metrics\"`"
+        elif project_type == "grpc":
+            return "GRPC GRPCConfig `mapstructure:\"grpc\"`"
+        return ""
 
-func (h *WebHandler) About(c *gin.Context) {
-	c.HTML(http.StatusOK, "about.html", gin.H{
-		"title": "About Us",
-	})
-}
-'''
+    def _get_additional_config_structs(self, project_type: str) -> str:
+        """Get additional config structs based on project type."""
+        if project_type == "microservice":
+            return '''
+type MetricsConfig struct {
+	Enabled bool   `mapstructure:"enabled"`
+	Port    string `mapstructure:"port"`
+	Path    string `mapstructure:"path"`
+}'''
+        elif project_type == "grpc":
+            return '''
+type GRPCConfig struct {
+	Port    string `mapstructure:"port"`
+	Address string `mapstructure:"address"`
+}'''
+        return ""
 
-    def create_basic_middleware(self) -> None:
-        """Create basic middleware files."""
-        # Logger middleware
-        logger_file = self.project_path / "internal/middleware/logger.go"
-        logger_file.write_text(self._get_logger_middleware_template())
+    def _get_additional_config_functions(self, project_type: str) -> str:
+        """Get additional config functions based on project type."""
+        if project_type == "microservice":
+            return '''
+func (c *Config) GetMetricsPort() string {
+	if c.Metrics.Port != "" {
+		return c.Metrics.Port
+	}
+	return "9090"
+}'''
+        return ""
 
-        # Recovery middleware
-        recovery_file = self.project_path / "internal/middleware/recovery.go"
-        recovery_file.write_text(self._get_recovery_middleware_template())
+    def _get_dev_config_template(self) -> bytes:
+        """Get development config template."""
+        return _DEV_CONFIG_YAML
 
-        # CORS middleware
-        cors_file = self.project_path / "internal/middleware/cors.go"
-        cors_file.write_text(self._get_cors_middleware_template())
+    def _get_prod_config_template(self) -> bytes:
+        """Get production config template."""
+        return _PROD_CONFIG_YAML
 
-    def _get_logger_middleware_template(self) -> str:
-        """Get logger middleware template."""
-        return '''package middleware
+    def create_docker_files(self, project_type: str = "api") -> None:
+        """
+        Create Docker-related files.
 
-import (
-	"fmt"
-	"time"
+        Args:
+            project_type: Type of project being created
+        """
+        self._queue_write("Dockerfile", self._get_dockerfile_template())
+        self._queue_write("docker-compose.yml", self._get_docker_compose_template(project_type))
+        self._queue_write(".dockerignore", self._get_dockerignore_template())
+        self._flush_writes()
 
-	"github.com/gin-gonic/gin"
-	"github.com/sirupsen/logrus"
-)
+    def _get_dockerfile_template(self) -> bytes:
+        """Get Dockerfile template."""
+        return _DOCKERFILE
 
-func Logger() gin.HandlerFunc {
-	logger := logrus.New()
-	logger.SetFormatter(&logrus.JSONFormatter{})
+    def _get_docker_compose_template(self, project_type: str) -> bytes:
+        """Get docker-compose.yml template."""
+        if project_type == "microservice":
+            return _DOCKER_COMPOSE_BASE + _DOCKER_COMPOSE_MICROSERVICE_EXTRA
+        return _DOCKER_COMPOSE_BASE
 
-	return func(c *gin.Context) {
-		start := time.Now()
-		path := c.Request.URL.Path
-		raw := c.Request.URL.RawQuery
+    def _get_dockerignore_template(self) -> bytes:
+        """Get .dockerignore template."""
+        return _DOCKERIGNORE
 
-		// Process request
-		c.Next()
+    def create_gitignore(self) -> None:
+        """Create .gitignore file."""
+        self._queue_write(".gitignore", _GITIGNORE)
+        self._flush_writes()
 
-		// Log request
-		latency := time.Since(start)
-		clientIP := c.ClientIP()
-		method := c.Request.Method
-		statusCode := c.Writer.Status()
+    def create_readme(self, project_type: str = "api") -> None:
+        """
+        Create README.md file.
 
-		if raw != "" {
-			path = path + "?" + raw
-		}
+        Args:
+            project_type: Type of project being created
+        """
+        self._queue_write("README.md", self._get_readme_template(project_type))
+        self._flush_writes()
 
-		logger.WithFields(logrus.Fields{
-			"method":     method,
-			"path":       path,
-			"status":     statusCode,
-			"latency":    latency,
-			"client_ip":  clientIP,
-			"user_agent": c.Request.UserAgent(),
-		}).Info("Request processed")
-	}
-}
-'''
+    def _get_readme_template(self, project_type: str) -> str:
+        """Get README.md template."""
+        parts = [_README_HEADER.format(project_name=self.project_name)]
 
-    def _get_recovery_middleware_template(self) -> str:
-        """Get recovery middleware template."""
-        return '''package middleware
+        type_features = _README_FEATURES_BY_TYPE.get(project_type)
+        if type_features:
+            parts.append(type_features)
 
-import (
-	"net/http"
+        parts.append(_README_FOOTER.format(project_name=self.project_name))
+        return "".join(parts)
 
-	"github.com/gin-gonic/gin"
-	"github.com/sirupsen/logrus"
-)
+    def create_makefile(self) -> None:
+        """Create Makefile for common tasks."""
+        self._queue_write("Makefile", _MAKEFILE_TMPL.replace("{project_name}", self.project_name))
+        self._flush_writes()
 
-func Recovery() gin.HandlerFunc {
-	logger := logrus.New()
+    def create_basic_handlers(self, project_type: str = "api") -> None:
+        """
+        Create basic handler files.
 
-	return gin.CustomRecovery(func(c *gin.Context, recovered interface{}) {
-		logger.WithFields(logrus.Fields{
-			"error":  recovered,
-			"method": c.Request.Method,
-			"path":   c.Request.URL.Path,
-		}).Error("Panic recovered")
+        Args:
+            project_type: Type of project being created
+        """
+        self._queue_write("internal/handler/health.go", self._get_health_handler_template())
+        self._queue_write("internal/handler/example.go", self._get_example_handler_template())
 
-		c.JSON(http.StatusInternalServerError, gin.H{
-			"error": "Internal server error",
-		})
-	})
-}
-'''
+        if project_type == "web":
+            self._queue_write("internal/handler/web.go", self._get_web_handler_template())
+            self._queue_write("internal/render/render.go", _RENDER_GO)
 
-    def _get_cors_middleware_template(self) -> str:
-        """Get CORS middleware template."""
-        return '''package middleware
+        self._flush_writes()
 
-import (
-	"net/http"
+    def _get_health_handler_template(self) -> bytes:
+        """Get health handler template."""
+        return _HEALTH_HANDLER_GO
 
-	"github.com/gin-gonic/gin"
-)
+    def _get_example_handler_template(self) -> bytes:
+        """Get example handler template."""
+        return _EXAMPLE_HANDLER_GO
 
-func CORS() gin.HandlerFunc {
-	return func(c *gin.Context) {
-		c.Header("Access-Control-Allow-Origin", "*")
-		c.Header("Access-Control-Allow-Methods", "GET, POST, PUT, DELETE, OPTIONS")
-		c.Header("Access-Control-Allow-Headers", "Origin, Content-Type, Authorization")
-		c.Header("Access-Control-Allow-Credentials", "true")
+    def _get_web_handler_template(self) -> bytes:
+        """Get web handler template."""
+        return _WEB_HANDLER_TMPL.substitute(module_path=self.module_path).encode()
 
-		if c.Request.Method == "OPTIONS" {
-			c.AbortWithStatus(http.StatusNoContent)
-			return
-		}
+    def create_basic_middleware(self) -> None:
+        """Create basic middleware files."""
+        self._queue_write("internal/middleware/log.go", _LOG_MW_GO)
+        self._queue_write("internal/middleware/logger.go", self._get_logger_middleware_template())
+        self._queue_write("internal/middleware/recovery.go", self._get_recovery_middleware_template())
+        self._queue_write("internal/middleware/cors.go", self._get_cors_middleware_template())
+        self._flush_writes()
 
-		c.Next()
-	}
-}
-'''
+    def _get_logger_middleware_template(self) -> bytes:
+        """Get logger middleware template."""
+        return _LOGGER_MW_GO
+
+    def _get_recovery_middleware_template(self) -> bytes:
+        """Get recovery middleware template."""
+        return _RECOVERY_MW_GO
+
+    def _get_cors_middleware_template(self) -> bytes:
+        """Get CORS middleware template."""
+        return _CORS_MW_GO
 
 
 def main():
@@ -1446,15 +1738,7 @@ def main():
     project_path = "."  # Current directory
 
     creator = GoProjectStructure(project_name, project_path)
-    creator.create_directory_structure(project_type)
-    creator.create_main_file(project_type)
-    creator.create_config_files(project_type)
-    creator.create_basic_handlers(project_type)
-    creator.create_basic_middleware()
-    creator.create_docker_files(project_type)
-    creator.create_gitignore()
-    creator.create_makefile()
-    creator.create_readme(project_type)
+    creator.create_all(project_type)
 
     print(f"✅ Go project '{project_name}' created successfully!")
     print(f"📁 Location: {creator.project_path}")
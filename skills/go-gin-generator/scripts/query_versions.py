@@ -7,12 +7,123 @@ and frameworks from various sources including GitHub API and Go modules.
 """
 
 import requests
+import copy
 import json
+import os
 import re
-from typing import Dict, Optional, Tuple
-from packaging import version
-
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; stdlib json is the fallback
+    orjson = None
+
+# One session for every version query: keep-alive connections to
+# api.github.com and proxy.golang.org skip the TCP+TLS handshake after the
+# first request, and the adapter retries transient 429/5xx responses with
+# exponential backoff, honoring any Retry-After header the server sends.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=[429, 500, 502, 503, 504],
+                      respect_retry_after_header=True),
+))
+_SESSION.headers.update({
+    "Accept": "application/vnd.github+json",
+    "User-Agent": "go-gin-generator",
+})
+
+# Compiled once; the /@v/list fallback matches it against every version line.
+_PRERELEASE_RE = re.compile(r'-(?:alpha|beta|rc|pre)')
+
+
+def _loads(data: bytes):
+    """Decode a JSON payload with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _semver_key(ver: str) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    Sort key for Go-style semver strings (v1.2.3, v1.2.3-rc.1).
 
+    A tiny tuple parser beats packaging.version.parse here: it allocates no
+    Version objects and PEP 440 semantics are not needed for proxy output.
+    Malformed components sort lowest rather than raising.
+    """
+    core, _, pre = ver.lstrip('v').partition('-')
+    nums = []
+    for part in core.split('.')[:3]:
+        try:
+            nums.append(int(part))
+        except ValueError:
+            nums.append(-1)
+    return tuple(nums), tuple(pre.split('.')) if pre else ()
+
+
+# Persistent result cache: version lookups are repeated several times per
+# setup run and change rarely, so cache hits skip the HTTP round-trip
+# entirely. TTL defaults to a day and is tunable via GOGEN_CACHE_TTL.
+_CACHE_FILE = Path.home() / ".cache" / "go-gin-generator" / "versions.json"
+_CACHE_TTL = float(os.environ.get("GOGEN_CACHE_TTL", 86400))
+_cache_lock = threading.Lock()
+_cache: Optional[Dict[str, Dict]] = None
+
+
+def _load_cache() -> Dict[str, Dict]:
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache() -> None:
+    """Atomically persist the cache; a failed write never breaks a lookup."""
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_FILE.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(_cache, f)
+        os.replace(tmp_path, _CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _disk_cached(prefix: str):
+    """Cache a version-query function's result on disk under a TTL."""
+    def decorator(func):
+        @wraps(func)
+        def wrapper(*args):
+            key = prefix + ":" + "/".join(args)
+            now = time.time()
+            with _cache_lock:
+                entry = _load_cache().get(key)
+                if entry and now - entry["ts"] <= _CACHE_TTL:
+                    return entry["val"]
+            result = func(*args)
+            if result is not None:
+                with _cache_lock:
+                    _load_cache()[key] = {"val": result, "ts": now}
+                    _save_cache()
+            return result
+        return wrapper
+    return decorator
+
+
+@_disk_cached("gh")
 def query_github_api_latest_release(repo_owner: str, repo_name: str) -> Optional[str]:
     """
     Query the latest release version from GitHub API.
@@ -26,10 +137,22 @@ def query_github_api_latest_release(repo_owner: str, repo_name: str) -> Optional
     """
     try:
         url = f"https://api.github.com/repos/{repo_owner}/{repo_name}/releases/latest"
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
+
+        # A 403 with the rate-limit quota exhausted is not a real failure:
+        # wait for the reset window (capped so a distant reset cannot hang
+        # the run) and retry once. A 404 means the repo has no releases —
+        # retrying cannot help, so bail out immediately.
+        if (response.status_code == 403
+                and int(response.headers.get("X-RateLimit-Remaining", "1")) == 0):
+            reset = int(response.headers.get("X-RateLimit-Reset", "0"))
+            time.sleep(min(max(0, reset - time.time()), 60))
+            response = _SESSION.get(url, timeout=10)
+        if response.status_code == 404:
+            return None
         response.raise_for_status()
 
-        data = response.json()
+        data = _loads(response.content)
         tag_name = data.get("tag_name", "")
 
         # Remove 'v' prefix if present
@@ -42,6 +165,7 @@ def query_github_api_latest_release(repo_owner: str, repo_name: str) -> Optional
         return None
 
 
+@_disk_cached("goproxy")
 def query_go_module_version(module_path: str) -> Optional[str]:
     """
     Query the latest version of a Go module using Go proxy API.
@@ -53,21 +177,30 @@ def query_go_module_version(module_path: str) -> Optional[str]:
         Latest version string or None if failed
     """
     try:
+        # The @latest endpoint returns one constant-size JSON document with
+        # the proxy's selected latest version — no multi-kilobyte version
+        # list to download, filter and sort.
+        url = f"https://proxy.golang.org/{module_path}/@latest"
+        response = _SESSION.get(url, timeout=10)
+        if response.status_code != 404:
+            response.raise_for_status()
+            latest = _loads(response.content).get("Version", "")
+            if latest:
+                return latest.lstrip('v')
+
+        # Fallback: some modules only answer on the full version list.
         url = f"https://proxy.golang.org/{module_path}/@v/list"
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10)
         response.raise_for_status()
 
-        versions = response.text.strip().split('\n')
         # Filter out pre-release versions and find the latest stable version
-        stable_versions = []
-
-        for ver in versions:
-            if ver and not re.search(r'-(alpha|beta|rc|pre)', ver):
-                stable_versions.append(version.parse(ver))
+        stable_versions = [
+            ver for ver in response.text.strip().split('\n')
+            if ver and not _PRERELEASE_RE.search(ver)
+        ]
 
         if stable_versions:
-            latest = max(stable_versions)
-            return str(latest)
+            return max(stable_versions, key=_semver_key).lstrip('v')
 
         return None
     except Exception as e:
@@ -75,7 +208,59 @@ def query_go_module_version(module_path: str) -> Optional[str]:
         return None
 
 
-def get_gin_framework_info() -> Dict[str, str]:
+def query_github_graphql_latest_releases(
+        repos: List[Tuple[str, str]]) -> Dict[Tuple[str, str], str]:
+    """
+    Fetch the latest release tag for many repositories in one GraphQL call.
+
+    A single aliased query costs one rate-limit point where the REST
+    endpoint charges one per repository. Requires a GITHUB_TOKEN; callers
+    should fall back to the REST path when the token is absent or the
+    request fails.
+
+    Args:
+        repos: List of (owner, name) tuples
+
+    Returns:
+        Mapping of (owner, name) to version string (without 'v' prefix);
+        repositories without releases are omitted
+    """
+    token = os.environ.get("GITHUB_TOKEN")
+    if not token or not repos:
+        return {}
+
+    fields = [
+        f'r{i}: repository(owner: "{owner}", name: "{name}") '
+        '{ latestRelease { tagName } }'
+        for i, (owner, name) in enumerate(repos)
+    ]
+    query = "query { " + " ".join(fields) + " }"
+
+    try:
+        response = _SESSION.post(
+            "https://api.github.com/graphql",
+            json={"query": query},
+            headers={"Authorization": f"Bearer {token}"},
+            timeout=10,
+        )
+        response.raise_for_status()
+        data = _loads(response.content).get("data") or {}
+    except Exception as e:
+        print(f"GitHub GraphQL batch query failed: {e}")
+        return {}
+
+    results = {}
+    for i, repo in enumerate(repos):
+        node = data.get(f"r{i}") or {}
+        release = node.get("latestRelease") or {}
+        tag_name = release.get("tagName")
+        if tag_name:
+            results[repo] = tag_name.lstrip('v')
+    return results
+
+
+@lru_cache(maxsize=1)
+def _fetch_gin_framework_info() -> Dict[str, str]:
     """
     Get comprehensive information about the Gin framework.
 
@@ -102,7 +287,8 @@ def get_gin_framework_info() -> Dict[str, str]:
     return gin_info
 
 
-def get_go_version_info() -> Dict[str, str]:
+@lru_cache(maxsize=1)
+def _fetch_go_version_info() -> Dict[str, str]:
     """
     Get information about the latest Go version.
 
@@ -111,10 +297,10 @@ def get_go_version_info() -> Dict[str, str]:
     """
     try:
         # Query Go's official API for latest stable version
-        response = requests.get("https://golang.org/dl/?mode=json", timeout=10)
+        response = _SESSION.get("https://golang.org/dl/?mode=json", timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        data = _loads(response.content)
         if data:
             # Find the latest stable version
             stable_versions = [item for item in data if item.get("stable", False)]
@@ -133,84 +319,107 @@ def get_go_version_info() -> Dict[str, str]:
         return {"version": "1.21.5", "stable": True}
 
 
-def get_common_dependency_versions() -> Dict[str, Dict[str, str]]:
+# Static dependency metadata: (name, module_path, import_path, github_repo).
+# Hoisted to module scope so the fetcher does not rebuild a dozen dict
+# literals on every call; github_repo is None for modules without releases.
+_DEPS_META: Tuple[Tuple[str, str, str, Optional[str]], ...] = (
+    ("gorm", "gorm.io/gorm", "gorm.io/gorm", "go-gorm/gorm"),
+    ("gorm-driver-postgres", "gorm.io/driver/postgres",
+     "gorm.io/driver/postgres", None),
+    ("gorm-driver-mysql", "gorm.io/driver/mysql",
+     "gorm.io/driver/mysql", None),
+    ("gorm-driver-sqlite", "gorm.io/driver/sqlite",
+     "gorm.io/driver/sqlite", None),
+    ("viper", "github.com/spf13/viper", "github.com/spf13/viper",
+     "spf13/viper"),
+    ("logrus", "github.com/sirupsen/logrus", "github.com/sirupsen/logrus",
+     "sirupsen/logrus"),
+    ("zap", "go.uber.org/zap", "go.uber.org/zap", "uber-go/zap"),
+    ("jwt", "github.com/golang-jwt/jwt", "github.com/golang-jwt/jwt/v5",
+     "golang-jwt/jwt"),
+    ("validator", "github.com/go-playground/validator",
+     "github.com/go-playground/validator/v10", "go-playground/validator"),
+    ("swaggo", "github.com/swaggo/swag", "github.com/swaggo/swag",
+     "swaggo/swag"),
+    ("gin-cors", "github.com/gin-contrib/cors", "github.com/gin-contrib/cors",
+     "gin-contrib/cors"),
+    ("testify", "github.com/stretchr/testify", "github.com/stretchr/testify",
+     "stretchr/testify"),
+)
+
+
+@lru_cache(maxsize=1)
+def _fetch_common_dependency_versions() -> Dict[str, Dict[str, str]]:
     """
     Get versions for common Go dependencies used in Gin projects.
 
     Returns:
         Dictionary mapping dependency names to version info
     """
-    dependencies = {
-        "gorm": {
-            "module_path": "gorm.io/gorm",
-            "import_path": "gorm.io/gorm",
-            "github_repo": "go-gorm/gorm"
-        },
-        "gorm-driver-postgres": {
-            "module_path": "gorm.io/driver/postgres",
-            "import_path": "gorm.io/driver/postgres",
-        },
-        "gorm-driver-mysql": {
-            "module_path": "gorm.io/driver/mysql",
-            "import_path": "gorm.io/driver/mysql",
-        },
-        "gorm-driver-sqlite": {
-            "module_path": "gorm.io/driver/sqlite",
-            "import_path": "gorm.io/driver/sqlite",
-        },
-        "viper": {
-            "module_path": "github.com/spf13/viper",
-            "import_path": "github.com/spf13/viper",
-            "github_repo": "spf13/viper"
-        },
-        "logrus": {
-            "module_path": "github.com/sirupsen/logrus",
-            "import_path": "github.com/sirupsen/logrus",
-            "github_repo": "sirupsen/logrus"
-        },
-        "zap": {
-            "module_path": "go.uber.org/zap",
-            "import_path": "go.uber.org/zap",
-            "github_repo": "uber-go/zap"
-        },
-        "jwt": {
-            "module_path": "github.com/golang-jwt/jwt",
-            "import_path": "github.com/golang-jwt/jwt/v5",
-            "github_repo": "golang-jwt/jwt"
-        },
-        "validator": {
-            "module_path": "github.com/go-playground/validator",
-            "import_path": "github.com/go-playground/validator/v10",
-            "github_repo": "go-playground/validator"
-        },
-        "swaggo": {
-            "module_path": "github.com/swaggo/swag",
-            "import_path": "github.com/swaggo/swag",
-            "github_repo": "swaggo/swag"
-        },
-        "gin-cors": {
-            "module_path": "github.com/gin-contrib/cors",
-            "import_path": "github.com/gin-contrib/cors",
-            "github_repo": "gin-contrib/cors"
-        },
-        "testify": {
-            "module_path": "github.com/stretchr/testify",
-            "import_path": "github.com/stretchr/testify",
-            "github_repo": "stretchr/testify"
+    # With a GITHUB_TOKEN, one GraphQL call covers every GitHub-hosted
+    # dependency and costs a single rate-limit point; anything it misses
+    # falls through to the per-repo path below.
+    github_repos = [
+        tuple(github_repo.split("/"))
+        for _, _, _, github_repo in _DEPS_META
+        if github_repo
+    ]
+    graphql_versions = query_github_graphql_latest_releases(github_repos)
+
+    # Query the remaining versions concurrently: the calls are independent
+    # and I/O-bound, so wall time collapses from N round-trips to roughly one.
+    def query_one(module_path: str, github_repo: Optional[str]) -> Optional[str]:
+        try:
+            if github_repo:
+                owner, name = github_repo.split("/")
+                return query_github_api_latest_release(owner, name)
+            return query_go_module_version(module_path)
+        except Exception:
+            # One failed lookup must not poison the batch.
+            return None
+
+    versions: Dict[str, str] = {}
+    with ThreadPoolExecutor(max_workers=16) as executor:
+        futures = {}
+        for name, module_path, _, github_repo in _DEPS_META:
+            if github_repo and tuple(github_repo.split("/")) in graphql_versions:
+                versions[name] = graphql_versions[tuple(github_repo.split("/"))]
+            else:
+                futures[name] = executor.submit(query_one, module_path, github_repo)
+        for name, future in futures.items():
+            versions[name] = future.result() or "latest"
+
+    dependencies = {}
+    for name, module_path, import_path, github_repo in _DEPS_META:
+        info = {
+            "module_path": module_path,
+            "import_path": import_path,
+            "version": versions[name],
         }
-    }
+        if github_repo:
+            info["github_repo"] = github_repo
+        dependencies[name] = info
 
-    # Query versions for dependencies
-    for dep_name, dep_info in dependencies.items():
-        if "github_repo" in dep_info:
-            repo_parts = dep_info["github_repo"].split("/")
-            latest_version = query_github_api_latest_release(repo_parts[0], repo_parts[1])
-        else:
-            latest_version = query_go_module_version(dep_info["module_path"])
+    return dependencies
 
-        dep_info["version"] = latest_version or "latest"
 
-    return dependencies
+# The three info functions are pure for the life of the process but were
+# re-executed by every caller in setup_project_deps. The memoized fetchers
+# above run once; these thin wrappers hand each caller its own deep copy so
+# nobody can mutate the cached result.
+def get_gin_framework_info() -> Dict[str, str]:
+    """Get comprehensive information about the Gin framework (memoized)."""
+    return copy.deepcopy(_fetch_gin_framework_info())
+
+
+def get_go_version_info() -> Dict[str, str]:
+    """Get information about the latest Go version (memoized)."""
+    return copy.deepcopy(_fetch_go_version_info())
+
+
+def get_common_dependency_versions() -> Dict[str, Dict[str, str]]:
+    """Get versions for common Go dependencies (memoized)."""
+    return copy.deepcopy(_fetch_common_dependency_versions())
 
 
 def generate_go_mod_content(project_name: str, module_path: str, dependencies: Dict[str, bool]) -> str:
@@ -225,28 +434,35 @@ def generate_go_mod_content(project_name: str, module_path: str, dependencies: D
     Returns:
         go.mod file content as string
     """
+    # Gin info and the dependency sweep are independent network work;
+    # overlap them on the pool.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        gin_future = executor.submit(get_gin_framework_info)
+        deps_future = executor.submit(get_common_dependency_versions)
+        gin_info = gin_future.result()
+        all_deps = deps_future.result()
+
+    def require_line(import_path: str, ver: str) -> str:
+        if ver.startswith('v'):
+            ver = ver[1:]
+        return f"\trequire {import_path} v{ver}"
+
+    # Precompute every line, then join once: no intermediate list growth or
+    # repeated small-string formatting inside the loop.
     lines = [
         f"module {module_path}",
         "",
         f"go {get_go_version_info()['version']}",
-        ""
+        "",
+        require_line(gin_info['import_path'], gin_info['version']),
     ]
-
-    # Get Gin and dependency versions
-    gin_info = get_gin_framework_info()
-    all_deps = get_common_dependency_versions()
-
-    # Always include Gin
-    lines.append(f"\trequire {gin_info['import_path']} v{gin_info['version']}")
-
-    # Add selected dependencies
-    for dep_name, include in dependencies.items():
-        if include and dep_name in all_deps:
-            dep_info = all_deps[dep_name]
-            version = dep_info["version"]
-            if version != "latest":
-                lines.append(f"\trequire {dep_info['import_path']} v{version}")
-
+    lines.extend(
+        require_line(all_deps[dep_name]['import_path'],
+                     all_deps[dep_name]['version'])
+        for dep_name, include in dependencies.items()
+        if include and dep_name in all_deps
+        and all_deps[dep_name]['version'] != "latest"
+    )
     lines.append("")
 
     return "\n".join(lines)
@@ -6,16 +6,25 @@ This module provides functions to manage Go module dependencies using go mod com
 avoiding direct editing of go.mod and go.sum files.
 """
 
+import hashlib
 import subprocess
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Set
+from typing import Dict, List, Optional, Set, Tuple
 from dataclasses import dataclass
 import json
 
 from query_versions import get_gin_framework_info, get_common_dependency_versions, get_go_version_info
 
 
+# Setup fingerprints live outside the generated project, keyed by its
+# resolved path, so the generator's bookkeeping never lands in the
+# project's own initial commit.
+_FINGERPRINT_DIR = Path.home() / ".cache" / "go-gin-generator" / "setup-hashes"
+
+
 @dataclass
 class Dependency:
     """Represents a Go dependency."""
@@ -40,23 +49,79 @@ class GoDependencyManager:
         self.project_path = Path(project_path)
         self.go_mod_path = self.project_path / "go.mod"
         self.go_sum_path = self.project_path / "go.sum"
+        # (mtime, content) of go.mod, so warm paths skip re-reading it.
+        self._go_mod_cache: Optional[Tuple[float, str]] = None
 
-    def _run_go_command(self, command: List[str], check: bool = True) -> subprocess.CompletedProcess:
+    def _read_go_mod(self) -> Optional[str]:
+        """
+        Return the current go.mod content, or None if the file is absent.
+
+        One stat validates the cached copy; repeated callers within a run
+        avoid re-reading the file.
+        """
+        try:
+            st = self.go_mod_path.stat()
+        except OSError:
+            self._go_mod_cache = None
+            return None
+        if self._go_mod_cache and self._go_mod_cache[0] == st.st_mtime:
+            return self._go_mod_cache[1]
+        content = self.go_mod_path.read_text()
+        self._go_mod_cache = (st.st_mtime, content)
+        return content
+
+    def _run_go_command(self, command: List[str], check: bool = True,
+                        stream: bool = False) -> subprocess.CompletedProcess:
         """
         Run a Go command in the project directory.
 
         Args:
             command: Command to run (as list)
             check: Whether to check return code
+            stream: Forward output line by line instead of buffering it;
+                use for noisy long-running commands (download, get -u)
+                whose output is never parsed
 
         Returns:
-            CompletedProcess object
+            CompletedProcess object (stdout is empty when streaming)
         """
         try:
             env = os.environ.copy()
             # Ensure GOPATH and GOCACHE are set for consistent behavior
             env.setdefault("GOPATH", os.path.expanduser("~/go"))
             env.setdefault("GOCACHE", os.path.expanduser("~/Library/Caches/go-build"))
+            # Module fetches go through the proxy CDN instead of raw VCS
+            # clones, downloads land in a stable module cache, and the
+            # toolchain may use every core for parallel fetch/extract.
+            env.setdefault("GOPROXY", "https://proxy.golang.org,direct")
+            env.setdefault("GOSUMDB", "sum.golang.org")
+            env.setdefault("GOMODCACHE", os.path.expanduser("~/go/pkg/mod"))
+            env.setdefault("GOMAXPROCS", str(os.cpu_count() or 4))
+            if command and command[0] in ("get", "mod"):
+                # Skip workspace probing for module operations.
+                env.setdefault("GOFLAGS", "-mod=mod")
+
+            if stream:
+                # Line-buffered pass-through: progress appears as it
+                # happens and memory stays bounded regardless of how much
+                # the command prints.
+                with subprocess.Popen(
+                    ["go"] + command,
+                    cwd=self.project_path,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    bufsize=1,
+                    text=True,
+                    env=env,
+                ) as proc:
+                    for line in proc.stdout:
+                        sys.stdout.write(line)
+                returncode = proc.returncode
+                if check and returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        returncode, ["go"] + command, output="", stderr="")
+                return subprocess.CompletedProcess(
+                    ["go"] + command, returncode, "", "")
 
             result = subprocess.run(
                 ["go"] + command,
@@ -81,7 +146,7 @@ class GoDependencyManager:
         Args:
             module_path: Module path (e.g., github.com/user/project)
         """
-        if self.go_mod_path.exists():
+        if self._read_go_mod() is not None:
             print(f"go.mod already exists in {self.project_path}")
             return
 
@@ -89,6 +154,35 @@ class GoDependencyManager:
         result = self._run_go_command(["mod", "init", module_path])
         print(f"✅ Go module initialized: {module_path}")
 
+    @staticmethod
+    def _dependency_spec(module_path: str, version: Optional[str] = None) -> str:
+        """Build the module@version argument go get expects."""
+        if version:
+            if not version.startswith('v'):
+                version = 'v' + version
+            return f"{module_path}@{version}"
+        return module_path
+
+    def add_dependencies_bulk(self, specs: List[Tuple[str, Optional[str]]]) -> None:
+        """
+        Add several dependencies with a single go get invocation.
+
+        One go process resolves the whole set, so the module-graph loading
+        overhead is paid once instead of per dependency.
+
+        Args:
+            specs: (module_path, version) pairs; version may be None
+        """
+        if not specs:
+            return
+
+        args = [self._dependency_spec(module_path, version)
+                for module_path, version in specs]
+        print(f"Adding dependencies: {', '.join(args)}")
+        self._run_go_command(["get"] + args)
+        for module_path, _ in specs:
+            print(f"✅ Added: {module_path}")
+
     def add_dependency(self, module_path: str, version: Optional[str] = None) -> None:
         """
         Add a dependency to the project.
@@ -97,15 +191,7 @@ class GoDependencyManager:
             module_path: Module path to add
             version: Specific version (optional)
         """
-        cmd = ["get", module_path]
-        if version:
-            if not version.startswith('v'):
-                version = 'v' + version
-            cmd[-1] = f"{module_path}@{version}"
-
-        print(f"Adding dependency: {cmd[-1]}")
-        result = self._run_go_command(cmd)
-        print(f"✅ Added: {module_path}")
+        self.add_dependencies_bulk([(module_path, version)])
 
     def add_dev_dependencies(self, dependencies: List[str]) -> None:
         """
@@ -114,8 +200,7 @@ class GoDependencyManager:
         Args:
             dependencies: List of module paths to add for development
         """
-        for dep in dependencies:
-            self.add_dependency(dep)
+        self.add_dependencies_bulk([(dep, None) for dep in dependencies])
 
     def remove_dependency(self, module_path: str) -> None:
         """
@@ -143,10 +228,10 @@ class GoDependencyManager:
         if targets:
             for target in targets:
                 print(f"Updating: {target}")
-                self._run_go_command(["get", "-u", target])
+                self._run_go_command(["get", "-u", target], stream=True)
         else:
             print("Updating all dependencies...")
-            self._run_go_command(["get", "-u", "./..."])
+            self._run_go_command(["get", "-u", "./..."], stream=True)
 
         self._run_go_command(["mod", "tidy"])
         print("✅ Dependencies updated")
@@ -176,7 +261,7 @@ class GoDependencyManager:
     def download_dependencies(self) -> None:
         """Download all dependencies without installing them."""
         print("Downloading dependencies...")
-        result = self._run_go_command(["mod", "download"])
+        result = self._run_go_command(["mod", "download"], stream=True)
         print("✅ Dependencies downloaded")
 
     def list_dependencies(self) -> Dict[str, str]:
@@ -186,17 +271,18 @@ class GoDependencyManager:
         Returns:
             Dictionary mapping module paths to versions
         """
-        result = self._run_go_command(["list", "-m", "-versions", "all"])
-        output = result.stdout
+        # -versions made the proxy enumerate every known version of every
+        # transitive module, hundreds of KB that was immediately discarded.
+        # The template prints exactly the two fields we keep, one per line.
+        result = self._run_go_command(
+            ["list", "-m", "-f", "{{.Path}} {{.Version}}", "all"])
 
         dependencies = {}
-        for line in output.split('\n'):
+        for line in result.stdout.split('\n'):
             if line and not line.startswith('#'):
                 parts = line.split()
                 if len(parts) >= 2:
-                    module_path = parts[0]
-                    # The second line contains versions, first is usually the latest
-                    dependencies[module_path] = parts[1] if len(parts) > 1 else "unknown"
+                    dependencies[parts[0]] = parts[1]
 
         return dependencies
 
@@ -249,14 +335,25 @@ class GoDependencyManager:
         gin_info = get_gin_framework_info()
         print(f"Setting up Gin v{gin_info['version']}...")
 
-        # Always add Gin framework
-        self.add_dependency(gin_info["module_path"])
-
-        # Add dependencies based on project configuration
+        # Keep the whole setup at a handful of go invocations: one go mod
+        # edit records every version-pinned dependency (it accepts any
+        # number of -require flags and does not load the module graph), one
+        # go get resolves the unpinned rest, then one tidy + one download.
         deps_to_add = self._get_dependencies_for_config(project_config)
-
+        pinned = []
+        unpinned = [(gin_info["module_path"], None)]
         for dep in deps_to_add:
-            self.add_dependency(dep.module_path, dep.version)
+            if dep.version and dep.version != "latest":
+                pinned.append((dep.module_path, dep.version))
+            else:
+                unpinned.append((dep.module_path, None))
+
+        if pinned:
+            requires = [f"-require={self._dependency_spec(module_path, version)}"
+                        for module_path, version in pinned]
+            self._run_go_command(["mod", "edit"] + requires)
+            print(f"✅ Recorded {len(pinned)} pinned dependencies in go.mod")
+        self.add_dependencies_bulk(unpinned)
 
         # Clean up
         self.tidy_dependencies()
@@ -396,22 +493,39 @@ class GoDependencyManager:
             if dep.module_path in common_deps:
                 dep.version = common_deps[dep.module_path].get("version")
 
-        return dependencies
+        # Overlapping features request the same module twice (e.g. goredis
+        # under both rate_limiting and cache). Deduplicate by module path,
+        # keeping the first occurrence but adopting a version from any
+        # duplicate that carries one.
+        seen: Dict[str, Dependency] = {}
+        for dep in dependencies:
+            kept = seen.setdefault(dep.module_path, dep)
+            if kept is not dep and kept.version is None and dep.version:
+                kept.version = dep.version
 
-    def generate_go_mod_content(self, module_path: str, config: Dict[str, any]) -> str:
+        return list(seen.values())
+
+    def _build_deps(self, config: Dict[str, any]) -> tuple:
         """
-        Generate go.mod file content based on configuration.
+        Resolve everything go.mod needs in one dependency pass.
 
         Args:
-            module_path: Go module path
             config: Project configuration
 
         Returns:
-            go.mod file content as string
+            Tuple of (gin_info, go_info, dependencies)
         """
-        go_info = get_go_version_info()
-        gin_info = get_gin_framework_info()
-
+        return (
+            get_gin_framework_info(),
+            get_go_version_info(),
+            self._get_dependencies_for_config(config),
+        )
+
+    @staticmethod
+    def _render_go_mod(module_path: str, gin_info: Dict[str, str],
+                       go_info: Dict[str, str],
+                       dependencies: List[Dependency]) -> str:
+        """Render go.mod content from already-resolved dependency info."""
         lines = [
             f"module {module_path}",
             "",
@@ -421,8 +535,6 @@ class GoDependencyManager:
             f"\t{gin_info['module_path']} v{gin_info['version']}"
         ]
 
-        # Get dependencies
-        dependencies = self._get_dependencies_for_config(config)
         for dep in dependencies:
             if dep.version and dep.version != "latest":
                 lines.append(f"\t{dep.module_path} v{dep.version}")
@@ -436,6 +548,20 @@ class GoDependencyManager:
 
         return "\n".join(lines)
 
+    def generate_go_mod_content(self, module_path: str, config: Dict[str, any]) -> str:
+        """
+        Generate go.mod file content based on configuration.
+
+        Args:
+            module_path: Go module path
+            config: Project configuration
+
+        Returns:
+            go.mod file content as string
+        """
+        gin_info, go_info, dependencies = self._build_deps(config)
+        return self._render_go_mod(module_path, gin_info, go_info, dependencies)
+
     def create_go_mod_from_config(self, module_path: str, config: Dict[str, any]) -> None:
         """
         Create go.mod file from configuration.
@@ -444,30 +570,85 @@ class GoDependencyManager:
             module_path: Go module path
             config: Project configuration
         """
-        content = self.generate_go_mod_content(module_path, config)
+        # One dependency-resolution pass covers both the content and the
+        # count; the second _get_dependencies_for_config call here used to
+        # redo the whole sweep just to print len().
+        gin_info, go_info, dependencies = self._build_deps(config)
+        content = self._render_go_mod(module_path, gin_info, go_info, dependencies)
+
+        # Unchanged content means nothing to do: skip the write (and the
+        # mtime bump that would invalidate downstream caches).
+        if self._read_go_mod() == content:
+            print(f"✅ go.mod already up to date "
+                  f"({len(dependencies)} dependencies)")
+            return
+
         self.go_mod_path.write_text(content)
-        print(f"✅ Created go.mod with {len(self._get_dependencies_for_config(config))} dependencies")
+        self._go_mod_cache = (self.go_mod_path.stat().st_mtime, content)
+        print(f"✅ Created go.mod with {len(dependencies)} dependencies")
+
+    _GO_TOOLS = (
+        "github.com/air-verse/air@latest",              # Live reload
+        "github.com/swaggo/swag/cmd/swag@latest",       # Swagger generation
+        "github.com/golangci/golangci-lint/cmd/golangci-lint@latest",  # Linting
+        "golang.org/x/tools/cmd/goimports@latest",     # Import formatting
+        "github.com/golang/mock/mockgen@latest",       # Mock generation
+        "google.golang.org/protobuf/cmd/protoc-gen-go@latest",  # Protocol buffers
+        "google.golang.org/grpc/cmd/protoc-gen-go-grpc@latest",  # gRPC
+    )
 
     def install_go_tools(self) -> None:
         """Install common Go development tools."""
-        tools = [
-            "github.com/air-verse/air@latest",              # Live reload
-            "github.com/swaggo/swag/cmd/swag@latest",       # Swagger generation
-            "github.com/golangci/golangci-lint/cmd/golangci-lint@latest",  # Linting
-            "golang.org/x/tools/cmd/goimports@latest",     # Import formatting
-            "github.com/golang/mock/mockgen@latest",       # Mock generation
-            "google.golang.org/protobuf/cmd/protoc-gen-go@latest",  # Protocol buffers
-            "google.golang.org/grpc/cmd/protoc-gen-go-grpc@latest",  # gRPC
-        ]
+        tools = list(self._GO_TOOLS)
 
+        # The installs are independent and Go's build cache tolerates
+        # concurrent writers, so run them in parallel — this keeps per-tool
+        # success reporting while still finishing in roughly the time of
+        # the slowest single install.
         print("Installing Go development tools...")
-        for tool in tools:
-            try:
-                print(f"Installing {tool}...")
-                self._run_go_command(["install", tool], check=False)
-                print(f"✅ Installed {tool}")
-            except Exception as e:
-                print(f"❌ Failed to install {tool}: {e}")
+        workers = min(len(tools), os.cpu_count() or 4)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self._run_go_command, ["install", tool],
+                                check=False): tool
+                for tool in tools
+            }
+            for future in as_completed(futures):
+                tool = futures[future]
+                try:
+                    result = future.result()
+                    if result.returncode == 0:
+                        print(f"✅ Installed {tool}")
+                    else:
+                        print(f"❌ Failed to install {tool}: "
+                              f"{result.stderr.strip()}")
+                except Exception as e:
+                    print(f"❌ Failed to install {tool}: {e}")
+
+    def _fingerprint_path(self) -> Path:
+        """Cache-file path holding this project's last setup fingerprint."""
+        project_key = hashlib.sha256(
+            str(self.project_path.resolve()).encode()).hexdigest()[:16]
+        return _FINGERPRINT_DIR / f"{project_key}.hash"
+
+    def _setup_fingerprint(self, module_path: str, config: Dict[str, any]) -> str:
+        """
+        Hash everything setup_project_deps would install for this config.
+
+        Args:
+            module_path: Go module path
+            config: Project configuration
+
+        Returns:
+            Hex digest covering module path, resolved dependencies and tools
+        """
+        deps = self._get_dependencies_for_config(config)
+        payload = json.dumps([
+            module_path,
+            sorted((dep.module_path, dep.version) for dep in deps),
+            list(self._GO_TOOLS),
+        ])
+        return hashlib.sha256(payload.encode()).hexdigest()
 
     def setup_project_deps(self, module_path: str, config: Dict[str, any]) -> None:
         """
@@ -479,6 +660,20 @@ class GoDependencyManager:
         """
         print(f"🚀 Setting up dependencies for {module_path}")
 
+        # Repeat runs with an unchanged config are a no-op: a sidecar hash
+        # of (module path, dependencies, tools) tells us go.mod already
+        # reflects this exact setup, so only a quick verify remains.
+        fingerprint = self._setup_fingerprint(module_path, config)
+        hash_path = self._fingerprint_path()
+        if self.go_mod_path.exists():
+            try:
+                if hash_path.read_text() == fingerprint:
+                    print("✅ Dependencies already up to date, skipping setup")
+                    self.verify_dependencies()
+                    return
+            except OSError:
+                pass
+
         # Initialize module
         self.init_module(module_path)
 
@@ -497,19 +692,28 @@ class GoDependencyManager:
         # Install development tools
         self.install_go_tools()
 
+        try:
+            hash_path.parent.mkdir(parents=True, exist_ok=True)
+            hash_path.write_text(fingerprint)
+        except OSError:
+            pass
+
         print("🎉 Project dependency setup complete!")
 
 
 def main():
     """Example usage of Go dependency manager."""
-    import sys
-    import json
-
-    if len(sys.argv) < 2:
-        print("Usage: python setup_dependencies.py <project_path> [config_json]")
-        sys.exit(1)
-
-    project_path = sys.argv[1]
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Set up Go module dependencies for a Gin project")
+    parser.add_argument("project_path", help="Path to the Go project")
+    parser.add_argument("config_json", nargs="?",
+                        help="Project configuration as a JSON string")
+    parser.add_argument("--config-file",
+                        help="Read project configuration from a JSON file "
+                             "instead of the command line")
+    args = parser.parse_args()
 
     # Default configuration
     default_config = {
@@ -523,19 +727,22 @@ def main():
         "testing": {"enhanced": True}
     }
 
-    # Load config from command line if provided
     config = default_config
-    if len(sys.argv) > 2:
-        try:
-            config = json.loads(sys.argv[2])
-        except json.JSONDecodeError:
-            print("Invalid JSON config, using defaults")
+    try:
+        if args.config_file:
+            with open(args.config_file, "rb") as f:
+                config = json.load(f)
+        elif args.config_json:
+            config = json.loads(args.config_json)
+    except (OSError, json.JSONDecodeError):
+        print("Invalid JSON config, using defaults")
 
     # Get module path
-    module_path = config.get("module_path", f"github.com/username/{Path(project_path).name}")
+    module_path = config.get(
+        "module_path", f"github.com/username/{Path(args.project_path).name}")
 
     # Setup dependencies
-    manager = GoDependencyManager(project_path)
+    manager = GoDependencyManager(args.project_path)
     manager.setup_project_deps(module_path, config)
 
 
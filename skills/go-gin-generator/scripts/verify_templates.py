@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Skeleton verification for the Go Gin project generator.
+
+Renders each packaged skeleton exactly the way generate_project does and
+compares the result byte-for-byte against procedural generation, so a
+skeleton that drifts from create_structure.py — or a file shadowed out
+of the repository by the template's own ignore rules — is caught before
+it ships.
+"""
+
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+from typing import Dict
+
+from create_structure import GoProjectStructure
+from init_project import _SKELETON_SUBST_FILES, _TEMPLATES_DIR
+
+# Fixed identity for both render paths; any values work as long as the
+# skeleton substitution and the procedural generator agree on them.
+_VERIFY_NAME = "skeleton-check"
+_VERIFY_MODULE = "example.com/skeleton-check"
+
+
+def _snapshot(root: Path) -> Dict[str, bytes]:
+    """Map project-relative paths to file bytes for a rendered tree."""
+    return {
+        str(path.relative_to(root)): path.read_bytes()
+        for path in sorted(root.rglob("*")) if path.is_file()
+    }
+
+
+def _render_skeleton(project_type: str, dest: Path) -> None:
+    """Copy and substitute a skeleton the way generate_project does."""
+    shutil.copytree(_TEMPLATES_DIR / project_type, dest)
+    ignore_file = dest / "gitignore"
+    if ignore_file.is_file():
+        ignore_file.replace(dest / ".gitignore")
+    for relative_path in _SKELETON_SUBST_FILES:
+        target = dest / relative_path
+        if target.is_file():
+            data = target.read_bytes()
+            data = data.replace(b"__PROJECT_NAME__", _VERIFY_NAME.encode())
+            data = data.replace(b"__MODULE_PATH__", _VERIFY_MODULE.encode())
+            target.write_bytes(data)
+
+
+def verify_skeleton(project_type: str) -> bool:
+    """Compare one packaged skeleton against procedural generation."""
+    with tempfile.TemporaryDirectory() as tmp:
+        skeleton_dir = Path(tmp) / "skeleton"
+        _render_skeleton(project_type, skeleton_dir)
+
+        creator = GoProjectStructure(
+            _VERIFY_NAME, str(Path(tmp) / "procedural"), _VERIFY_MODULE)
+        creator.create_all(project_type)
+
+        skeleton = _snapshot(skeleton_dir)
+        procedural = _snapshot(creator.project_path)
+
+    ok = True
+    for path in sorted(set(skeleton) | set(procedural)):
+        if path not in procedural:
+            print(f"  ❌ {project_type}: {path} only exists in the skeleton")
+            ok = False
+        elif path not in skeleton:
+            print(f"  ❌ {project_type}: {path} is missing from the skeleton")
+            ok = False
+        elif skeleton[path] != procedural[path]:
+            print(f"  ❌ {project_type}: {path} differs")
+            ok = False
+    return ok
+
+
+def main():
+    """Verify every packaged skeleton and exit non-zero on divergence."""
+    print("🔍 Verifying packaged skeletons against procedural generation...")
+
+    failed = []
+    for project_type in ("api", "web", "microservice", "grpc"):
+        if not (_TEMPLATES_DIR / project_type).is_dir():
+            print(f"  ⚠️  {project_type}: no packaged skeleton")
+            continue
+        if verify_skeleton(project_type):
+            print(f"  ✅ {project_type}: skeleton matches")
+        else:
+            failed.append(project_type)
+
+    if failed:
+        print(f"\n❌ Skeletons out of date: {', '.join(failed)}")
+        sys.exit(1)
+    print("\n✅ All skeletons match procedural generation")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,14 @@
+package middleware
+
+import (
+	"github.com/sirupsen/logrus"
+)
+
+// logger is shared by every middleware in this package. It is constructed
+// and configured exactly once at package init instead of per middleware
+// install, so Logger() and Recovery() close over the same instance.
+var logger = func() *logrus.Logger {
+	l := logrus.New()
+	l.SetFormatter(&logrus.JSONFormatter{})
+	return l
+}()
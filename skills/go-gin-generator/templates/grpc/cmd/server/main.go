@@ -0,0 +1,51 @@
+package main
+
+import (
+	"context"
+	"log"
+	"net"
+	"net/http"
+
+	"__MODULE_PATH__/internal/config"
+	"__MODULE_PATH__/internal/grpc"
+	grpcHandler "__MODULE_PATH__/internal/handler"
+
+	"github.com/gin-gonic/gin"
+	"google.golang.org/grpc"
+)
+
+func main() {
+	// Initialize configuration
+	cfg := config.Load()
+
+	// Start gRPC server
+	grpcServer := grpc.NewServer()
+	grpcService := grpc.NewService()
+	grpcService.Register(grpcServer)
+
+	// Start gRPC server in a goroutine
+	go func() {
+		lis, err := net.Listen("tcp", ":"+cfg.GRPC.Port)
+		if err != nil {
+			log.Fatal("Failed to listen for gRPC:", err)
+		}
+
+		log.Printf("gRPC server starting on port %s", cfg.GRPC.Port)
+		if err := grpcServer.Serve(lis); err != nil {
+			log.Fatal("Failed to start gRPC server:", err)
+		}
+	}()
+
+	// Create Gin gateway
+	r := gin.Default()
+
+	// Initialize gRPC gateway handlers
+	gateway := grpcHandler.NewGateway(cfg.GRPC.Address)
+	gateway.RegisterRoutes(r)
+
+	// Start HTTP gateway
+	log.Printf("HTTP gateway starting on port %s", cfg.Server.Port)
+	if err := r.Run(":" + cfg.Server.Port); err != nil {
+		log.Fatal("Failed to start HTTP gateway:", err)
+	}
+}
@@ -0,0 +1,78 @@
+package main
+
+import (
+	"context"
+	"log"
+	"os"
+	"os/signal"
+	"syscall"
+	"time"
+
+	"__MODULE_PATH__/internal/config"
+	"__MODULE_PATH__/internal/health"
+	"__MODULE_PATH__/internal/handler"
+	"__MODULE_PATH__/internal/middleware"
+	"__MODULE_PATH__/internal/metrics"
+
+	"github.com/gin-gonic/gin"
+)
+
+func main() {
+	// Initialize configuration
+	cfg := config.Load()
+
+	// Set Gin mode
+	if cfg.Server.Mode == "release" {
+		gin.SetMode(gin.ReleaseMode)
+	}
+
+	// Create Gin engine
+	r := gin.Default()
+
+	// Add middleware
+	r.Use(middleware.Logger())
+	r.Use(middleware.Recovery())
+	r.Use(middleware.CORS())
+	r.Use(metrics.PrometheusMiddleware())
+
+	// Initialize health check
+	healthCheck := health.NewChecker()
+
+	// Initialize handlers
+	api := r.Group("/api/v1")
+	{
+		handler.NewHealthHandler(api, healthCheck)
+		handler.NewServiceHandler(api)
+	}
+
+	// Metrics endpoint
+	r.GET("/metrics", metrics.PrometheusHandler())
+
+	// Graceful shutdown
+	server := &http.Server{
+		Addr:    ":" + cfg.Server.Port,
+		Handler: r,
+	}
+
+	go func() {
+		if err := server.ListenAndServe(); err != nil && err != http.ErrServerClosed {
+			log.Fatal("Failed to start server:", err)
+		}
+	}()
+
+	// Wait for interrupt signal to gracefully shutdown
+	quit := make(chan os.Signal, 1)
+	signal.Notify(quit, syscall.SIGINT, syscall.SIGTERM)
+	<-quit
+
+	log.Println("Shutting down server...")
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+
+	if err := server.Shutdown(ctx); err != nil {
+		log.Fatal("Server forced to shutdown:", err)
+	}
+
+	log.Println("Server exited")
+}
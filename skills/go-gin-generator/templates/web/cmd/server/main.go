@@ -0,0 +1,56 @@
+package main
+
+import (
+	"log"
+	"os"
+
+	"__MODULE_PATH__/internal/config"
+	"__MODULE_PATH__/internal/handler"
+	"__MODULE_PATH__/internal/middleware"
+
+	"github.com/gin-gonic/gin"
+)
+
+func main() {
+	// Initialize configuration
+	cfg := config.Load()
+
+	// Set Gin mode
+	if cfg.Server.Mode == "release" {
+		gin.SetMode(gin.ReleaseMode)
+	}
+
+	// Create Gin engine
+	r := gin.Default()
+
+	// Load templates
+	r.LoadHTMLGlob("web/templates/*")
+	r.Static("/static", "./web/static")
+
+	// Add middleware
+	r.Use(middleware.Logger())
+	r.Use(middleware.Recovery())
+	r.Use(middleware.CORS())
+
+	// Initialize handlers
+	api := r.Group("/api/v1")
+	{
+		handler.NewHealthHandler(api)
+		handler.NewAPIHandler(api)
+	}
+
+	// Web routes
+	r.GET("/", handler.NewWebHandler().Home)
+	r.GET("/about", handler.NewWebHandler().About)
+
+	// Start server
+	port := os.Getenv("PORT")
+	if port == "" {
+		port = cfg.Server.Port
+	}
+
+	log.Printf("Server starting on port %s", port)
+	if err := r.Run(":" + port); err != nil {
+		log.Fatal("Failed to start server:", err)
+	}
+}
@@ -0,0 +1,132 @@
+package handler
+
+import (
+	"net/http"
+	"strconv"
+
+	"github.com/gin-gonic/gin"
+)
+
+type ExampleHandler struct {
+	// Add dependencies here (services, repositories, etc.)
+}
+
+func NewExampleHandler(router *gin.RouterGroup) *ExampleHandler {
+	h := &ExampleHandler{}
+
+	examples := router.Group("/examples")
+	{
+		examples.GET("/", h.GetExamples)
+		examples.GET("/:id", h.GetExample)
+		examples.POST("/", h.CreateExample)
+		examples.PUT("/:id", h.UpdateExample)
+		examples.DELETE("/:id", h.DeleteExample)
+	}
+
+	return h
+}
+
+type Example struct {
+	ID    int    `json:"id"`
+	Name  string `json:"name"`
+	Value string `json:"value"`
+}
+
+func (h *ExampleHandler) GetExamples(c *gin.Context) {
+	// Example data - replace with actual data access
+	examples := []Example{
+		{ID: 1, Name: "Example 1", Value: "Value 1"},
+		{ID: 2, Name: "Example 2", Value: "Value 2"},
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"data": examples,
+		"total": len(examples),
+	})
+}
+
+func (h *ExampleHandler) GetExample(c *gin.Context) {
+	id, err := strconv.Atoi(c.Param("id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
+		return
+	}
+
+	// Example data - replace with actual data access
+	example := Example{
+		ID:    id,
+		Name:  "Example " + strconv.Itoa(id),
+		Value: "Value " + strconv.Itoa(id),
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"data": example,
+	})
+}
+
+func (h *ExampleHandler) CreateExample(c *gin.Context) {
+	var req struct {
+		Name  string `json:"name" binding:"required"`
+		Value string `json:"value" binding:"required"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	// Create example - replace with actual data access
+	example := Example{
+		ID:    3, // Should be generated by database
+		Name:  req.Name,
+		Value: req.Value,
+	}
+
+	c.JSON(http.StatusCreated, gin.H{
+		"data": example,
+	})
+}
+
+func (h *ExampleHandler) UpdateExample(c *gin.Context) {
+	id, err := strconv.Atoi(c.Param("id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
+		return
+	}
+
+	var req struct {
+		Name  string `json:"name"`
+		Value string `json:"value"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	// Update example - replace with actual data access
+	example := Example{
+		ID:    id,
+		Name:  req.Name,
+		Value: req.Value,
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"data": example,
+	})
+}
+
+func (h *ExampleHandler) DeleteExample(c *gin.Context) {
+	id, err := strconv.Atoi(c.Param("id"))
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": "Invalid ID"})
+		return
+	}
+
+	// Delete example - replace with actual data access
+
+	c.JSON(http.StatusOK, gin.H{
+		"message": "Example deleted successfully",
+		"id": id,
+	})
+}
@@ -0,0 +1,58 @@
+package handler
+
+import (
+	"net/http"
+	"time"
+
+	"github.com/gin-gonic/gin"
+)
+
+type HealthHandler struct {
+	startTime time.Time
+}
+
+func NewHealthHandler(router *gin.RouterGroup) *HealthHandler {
+	h := &HealthHandler{
+		startTime: time.Now(),
+	}
+
+	health := router.Group("/health")
+	{
+		health.GET("/", h.Check)
+		health.GET("/detailed", h.DetailedCheck)
+	}
+
+	return h
+}
+
+type HealthResponse struct {
+	Status    string    `json:"status"`
+	Timestamp time.Time `json:"timestamp"`
+	Uptime    string    `json:"uptime"`
+	Version   string    `json:"version"`
+}
+
+func (h *HealthHandler) Check(c *gin.Context) {
+	c.JSON(http.StatusOK, HealthResponse{
+		Status:    "ok",
+		Timestamp: time.Now(),
+		Uptime:    time.Since(h.startTime).String(),
+		Version:   "1.0.0",
+	})
+}
+
+func (h *HealthHandler) DetailedCheck(c *gin.Context) {
+	// Add more detailed health checks here
+	// Database connection, external services, etc.
+
+	c.JSON(http.StatusOK, gin.H{
+		"status": "ok",
+		"timestamp": time.Now(),
+		"uptime": time.Since(h.startTime).String(),
+		"version": "1.0.0",
+		"checks": gin.H{
+			"database": "ok",
+			"redis": "ok",
+		},
+	})
+}
@@ -0,0 +1,31 @@
+package handler
+
+import (
+	"net/http"
+
+	"__MODULE_PATH__/internal/render"
+
+	"github.com/gin-gonic/gin"
+)
+
+type WebHandler struct {
+	// Add dependencies here
+}
+
+func NewWebHandler() *WebHandler {
+	return &WebHandler{}
+}
+
+func (h *WebHandler) Home(c *gin.Context) {
+	render.HTML(c, http.StatusOK, "index.html", gin.H{
+		// Two operands: plain + beats Sprintf/Builder here. Switch to
+		// strings.Builder once a third fragment joins the concatenation.
+		"title": "Welcome to " + c.Request.Host,
+	})
+}
+
+func (h *WebHandler) About(c *gin.Context) {
+	render.HTML(c, http.StatusOK, "about.html", gin.H{
+		"title": "About Us",
+	})
+}
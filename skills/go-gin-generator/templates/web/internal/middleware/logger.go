@@ -0,0 +1,47 @@
+package middleware
+
+import (
+	"strings"
+	"time"
+
+	"github.com/gin-gonic/gin"
+	"github.com/sirupsen/logrus"
+)
+
+func Logger() gin.HandlerFunc {
+	return func(c *gin.Context) {
+		start := time.Now()
+		path := c.Request.URL.Path
+		raw := c.Request.URL.RawQuery
+
+		// Process request
+		c.Next()
+
+		// Log request
+		latency := time.Since(start)
+		clientIP := c.ClientIP()
+		method := c.Request.Method
+		statusCode := c.Writer.Status()
+
+		if raw != "" {
+			// Assemble with strings.Builder: one sized allocation on this
+			// per-request path, and the pattern to copy when extending the
+			// log line with more fragments.
+			var sb strings.Builder
+			sb.Grow(len(path) + 1 + len(raw))
+			sb.WriteString(path)
+			sb.WriteByte('?')
+			sb.WriteString(raw)
+			path = sb.String()
+		}
+
+		logger.WithFields(logrus.Fields{
+			"method":     method,
+			"path":       path,
+			"status":     statusCode,
+			"latency":    latency,
+			"client_ip":  clientIP,
+			"user_agent": c.Request.UserAgent(),
+		}).Info("Request processed")
+	}
+}
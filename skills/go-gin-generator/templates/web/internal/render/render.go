@@ -0,0 +1,34 @@
+package render
+
+import (
+	"bytes"
+	"html/template"
+	"sync"
+
+	"github.com/gin-gonic/gin"
+)
+
+// templates is parsed once at package init; HTML below executes into a
+// pooled buffer so per-request rendering does not allocate a fresh one.
+var templates = template.Must(template.ParseGlob("web/templates/*"))
+
+var bufPool = sync.Pool{
+	New: func() any { return new(bytes.Buffer) },
+}
+
+// HTML executes the named template into a pooled buffer and writes the
+// result with a single Data call.
+func HTML(c *gin.Context, status int, name string, data any) {
+	buf := bufPool.Get().(*bytes.Buffer)
+	defer func() {
+		buf.Reset()
+		bufPool.Put(buf)
+	}()
+
+	if err := templates.ExecuteTemplate(buf, name, data); err != nil {
+		c.AbortWithError(500, err)
+		return
+	}
+
+	c.Data(status, "text/html; charset=utf-8", buf.Bytes())
+}
@@ -6,42 +6,163 @@ This module provides functions to check Node.js version,
 pnpm installation, and other development tools.
 """
 
-import subprocess
-import sys
+import functools
+import hashlib
 import json
+import os
 import re
-from typing import Dict, Optional, Tuple, List
+import shutil
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Optional, Tuple, List
 from pathlib import Path
 
-
-def run_command(command: List[str], timeout: int = 30) -> Tuple[bool, str, str]:
+# Probe results survive across runs: a tool's version rarely changes, so a
+# cache hit skips the fork+exec entirely. Entries are keyed by command plus
+# the resolved binary's path and mtime, so upgrading or replacing a tool
+# invalidates its entry immediately; a TTL catches everything else.
+_PROBE_CACHE_FILE = Path.home() / ".cache" / "vue3-generator" / "env_probe.json"
+_PROBE_CACHE_TTL = 86400.0
+_probe_cache_bypass = False
+_probe_cache_lock = threading.Lock()
+_probe_cache: Optional[Dict[str, Dict]] = None
+
+
+def _load_probe_cache() -> Dict[str, Dict]:
+    global _probe_cache
+    if _probe_cache is None:
+        try:
+            _probe_cache = json.loads(_PROBE_CACHE_FILE.read_bytes())
+        except (OSError, ValueError):
+            _probe_cache = {}
+    return _probe_cache
+
+
+def _save_probe_cache() -> None:
+    """Atomically persist the cache; a failed write never breaks a probe."""
+    try:
+        _PROBE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_PROBE_CACHE_FILE.parent,
+                                        suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(_probe_cache, f)
+        os.replace(tmp_path, _PROBE_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _probe_key(command: List[str]) -> str:
+    """Cache key tied to the command and the binary it would execute."""
+    exe = shutil.which(command[0])
+    mtime = os.path.getmtime(exe) if exe else 0
+    return hashlib.sha256(
+        repr((tuple(command), exe, mtime)).encode()).hexdigest()
+
+
+def run_command(command: List[str], timeout: int = 30, capture: bool = True,
+                cwd: Optional[Path] = None,
+                cache: bool = False) -> Tuple[bool, str, str]:
     """
     Run a shell command and return success, stdout, and stderr.
 
+    Caching is opt-in: only callers that pass cache=True — the read-only
+    version and presence probes — have successful results stored on disk
+    under a 24-hour TTL (see _PROBE_CACHE_FILE); failures always re-run
+    so a newly installed tool is picked up right away. Commands that
+    change state (installs, scaffolding) must never opt in: replaying a
+    remembered "success" instead of running them would silently skip the
+    work. Directory-scoped commands (cwd given) are never cached either.
+
     Args:
         command: Command to run as list of strings
         timeout: Timeout in seconds
+        capture: Collect stdout/stderr; pass False for presence-only
+            probes where only the exit status matters — output goes to
+            DEVNULL and no pipes are allocated or decoded
+        cwd: Working directory for the command; defaults to the caller's
+        cache: Reuse a cached successful result for this command; only
+            safe for commands with no side effects
 
     Returns:
-        Tuple of (success, stdout, stderr)
+        Tuple of (success, stdout, stderr); both strings are empty when
+        capture is False
     """
+    if not cache or cwd is not None or _probe_cache_bypass:
+        return _run_command_uncached(command, timeout, capture, cwd)
+
+    try:
+        key = _probe_key(command)
+    except OSError:
+        key = None
+    if key is None:
+        return _run_command_uncached(command, timeout, capture)
+
+    now = time.time()
+    with _probe_cache_lock:
+        entry = _load_probe_cache().get(key)
+        if entry and now - entry["ts"] <= _PROBE_CACHE_TTL:
+            return tuple(entry["val"])
+    result = _run_command_uncached(command, timeout, capture)
+    if result[0]:
+        with _probe_cache_lock:
+            _load_probe_cache()[key] = {"val": list(result), "ts": now}
+            _save_probe_cache()
+    return result
+
+
+def _run_command_uncached(command: List[str], timeout: int = 30,
+                          capture: bool = True,
+                          cwd: Optional[Path] = None) -> Tuple[bool, str, str]:
+    """Run a shell command without consulting the probe cache."""
+    if not capture:
+        try:
+            result = subprocess.run(
+                command,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout,
+                cwd=cwd
+            )
+            return result.returncode == 0, "", ""
+        except subprocess.TimeoutExpired:
+            return False, "", f"Command timed out after {timeout} seconds"
+        except Exception as e:
+            return False, "", str(e)
+
     try:
+        # Absent tools are the common case here; reading returncode is far
+        # cheaper than raising and unwinding a CalledProcessError per miss.
         result = subprocess.run(
             command,
+            stdin=subprocess.DEVNULL,
             capture_output=True,
-            text=True,
             timeout=timeout,
-            check=True
+            cwd=cwd
         )
-        return True, result.stdout.strip(), result.stderr.strip()
+        # Decode the collected bytes once rather than per read chunk
+        # (what text=True would do).
+        stdout = result.stdout.decode("utf-8", errors="replace").strip()
+        if result.returncode == 0:
+            # Callers almost never read stderr on success; skip the
+            # decode entirely when nothing was written to it.
+            stderr = (result.stderr.decode("utf-8", errors="replace").strip()
+                      if result.stderr else "")
+            return True, stdout, stderr
+        stderr = result.stderr.decode("utf-8", errors="replace").strip()
+        return (False, stdout or "",
+                stderr or f"Command failed with exit code {result.returncode}")
     except subprocess.TimeoutExpired:
         return False, "", f"Command timed out after {timeout} seconds"
-    except subprocess.CalledProcessError as e:
-        return False, e.stdout.strip() or "", e.stderr.strip() or f"Command failed with exit code {e.returncode}"
     except Exception as e:
         return False, "", str(e)
 
 
+@functools.lru_cache(maxsize=1)
 def check_node_version_manager() -> Tuple[str, Optional[str], bool]:
     """
     Check for Node.js version managers in priority order: fnm -> nvm -> none.
@@ -49,18 +170,24 @@ def check_node_version_manager() -> Tuple[str, Optional[str], bool]:
     Returns:
         Tuple of (manager_name, version, is_available)
     """
-    # Check for fnm (Fast Node Manager)
-    success, stdout, _ = run_command(["fnm", "--version"])
-    if success:
-        return "fnm", stdout, True
+    # Check for fnm (Fast Node Manager); a PATH scan is a far cheaper
+    # negative than forking fnm just to learn it is absent.
+    if shutil.which("fnm"):
+        success, stdout, _ = run_command(["fnm", "--version"], cache=True)
+        if success:
+            return "fnm", stdout, True
 
     # Check for nvm (Node Version Manager)
     # nvm is typically sourced in shell, so we need to check if NVM_DIR exists
-    import os
     nvm_dir = os.environ.get("NVM_DIR")
     if nvm_dir and Path(nvm_dir).exists():
-        # Try to run nvm command
-        success, stdout, _ = run_command(["bash", "-lc", "nvm --version 2>/dev/null"])
+        version = _read_nvm_version(Path(nvm_dir))
+        if version:
+            return "nvm", version, True
+        # Last resort: ask a login shell, paying the full profile +
+        # nvm-init startup cost.
+        success, stdout, _ = run_command(["bash", "-lc", "nvm --version 2>/dev/null"],
+                                        cache=True)
         if success:
             return "nvm", stdout, True
 
@@ -68,6 +195,7 @@ def check_node_version_manager() -> Tuple[str, Optional[str], bool]:
     return "none", None, False
 
 
+@functools.lru_cache(maxsize=1)
 def check_node_version() -> Tuple[bool, Optional[str], str]:
     """
     Check Node.js version and compatibility with Vue 3.
@@ -76,30 +204,25 @@ def check_node_version() -> Tuple[bool, Optional[str], str]:
         Tuple of (is_compatible, version, message)
     """
     # First try to get Node.js version directly
-    success, stdout, stderr = run_command(["node", "--version"])
+    if not shutil.which("node"):
+        return False, None, "Node.js not found: node is not on PATH"
+    success, stdout, stderr = run_command(["node", "--version"], cache=True)
     if not success:
         return False, None, f"Node.js not found: {stderr}"
 
-    node_version = stdout
-    if node_version.startswith('v'):
-        node_version = node_version[1:]
+    match = _NODE_VERSION_RE.match(stdout)
+    if not match:
+        return False, stdout, f"Unable to parse Node.js version: {stdout}"
 
-    # Check if Node.js version meets Vue 3 requirements (>= 18.0.0)
-    version_parts = node_version.split('.')
-    if len(version_parts) >= 2:
-        major = int(version_parts[0])
-        minor = int(version_parts[1])
-
-        if major > 18:
-            return True, node_version, f"Node.js {node_version} is compatible with Vue 3"
-        elif major == 18 and minor >= 0:
-            return True, node_version, f"Node.js {node_version} is compatible with Vue 3"
-        else:
-            return False, node_version, f"Node.js {node_version} is too old. Vue 3 requires Node.js >= 18.0.0"
+    node_version = stdout.lstrip('v')
 
-    return False, node_version, f"Unable to parse Node.js version: {node_version}"
+    # Check if Node.js version meets Vue 3 requirements (>= 18.0.0)
+    if int(match.group(1)) >= 18:
+        return True, node_version, f"Node.js {node_version} is compatible with Vue 3"
+    return False, node_version, f"Node.js {node_version} is too old. Vue 3 requires Node.js >= 18.0.0"
 
 
+@functools.lru_cache(maxsize=1)
 def check_pnpm_installation() -> Tuple[bool, Optional[str], str]:
     """
     Check if pnpm is installed and get its version.
@@ -107,7 +230,9 @@ def check_pnpm_installation() -> Tuple[bool, Optional[str], str]:
     Returns:
         Tuple of (is_installed, version, message)
     """
-    success, stdout, stderr = run_command(["pnpm", "--version"])
+    if not shutil.which("pnpm"):
+        return False, None, "pnpm not found: pnpm is not on PATH"
+    success, stdout, stderr = run_command(["pnpm", "--version"], cache=True)
     if not success:
         return False, None, f"pnpm not found: {stderr}"
 
@@ -115,6 +240,7 @@ def check_pnpm_installation() -> Tuple[bool, Optional[str], str]:
     return True, pnpm_version, f"pnpm {pnpm_version} is installed and ready"
 
 
+@functools.lru_cache(maxsize=1)
 def check_npm_installation() -> Tuple[bool, Optional[str], str]:
     """
     Check if npm is installed (fallback for pnpm).
@@ -122,7 +248,9 @@ def check_npm_installation() -> Tuple[bool, Optional[str], str]:
     Returns:
         Tuple of (is_installed, version, message)
     """
-    success, stdout, stderr = run_command(["npm", "--version"])
+    if not shutil.which("npm"):
+        return False, None, "npm not found: npm is not on PATH"
+    success, stdout, stderr = run_command(["npm", "--version"], cache=True)
     if not success:
         return False, None, f"npm not found: {stderr}"
 
@@ -130,37 +258,196 @@ def check_npm_installation() -> Tuple[bool, Optional[str], str]:
     return True, npm_version, f"npm {npm_version} is installed"
 
 
-def check_vue_cli_tools() -> Dict[str, Tuple[bool, str]]:
+# Platform flags, computed once at import.
+_IS_WIN = sys.platform.startswith("win")
+_IS_MAC = sys.platform == "darwin"
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Compiled once; tolerates the 'v' prefix and pre-release suffixes like
+# v20.5.0-nightly in a single pass.
+_NODE_VERSION_RE = re.compile(r"^v?(\d+)\.(\d+)")
+
+# Matches the version constant near the top of nvm.sh.
+_NVM_VERSION_RE = re.compile(r"NVM_VERSION=[\"']?v?([0-9][\w.\-]*)")
+
+
+def _read_nvm_version(nvm_dir: Path) -> Optional[str]:
     """
-    Check for Vue.js CLI tools and create-vue availability.
+    Read the installed nvm version from its files, without a shell.
+
+    nvm is a shell function, so probing it the obvious way means spawning
+    a login bash that sources every profile plus nvm's own init script.
+    The version is sitting in package.json (and nvm.sh) the whole time.
+
+    Args:
+        nvm_dir: Value of NVM_DIR
 
     Returns:
-        Dictionary of tool names and their availability status
+        Version string or None if it cannot be determined
     """
-    tools = {}
+    try:
+        data = json.loads((nvm_dir / "package.json").read_bytes())
+        version = data.get("version")
+        if version:
+            return version
+    except (OSError, ValueError):
+        pass
 
-    # Check for create-vue (official Vue 3 project scaffolding tool)
-    success, stdout, stderr = run_command(["npm", "show", "create-vue", "version"])
-    if success:
-        tools["create-vue"] = (True, f"create-vue@{stdout} is available")
-    else:
-        tools["create-vue"] = (False, f"create-vue not available: {stderr}")
+    try:
+        with open(nvm_dir / "nvm.sh") as f:
+            for _, line in zip(range(200), f):
+                match = _NVM_VERSION_RE.search(line)
+                if match:
+                    return match.group(1)
+    except OSError:
+        pass
+
+    return None
+
+_CREATE_VUE_CACHE_FILE = (Path.home() / ".cache" / "vue3-generator"
+                          / "create_vue_version.json")
+
+# One Node process answers every @vue/cli question at once; spawning vue
+# and then npx costs a full V8 startup each.
+_VUE_CLI_PROBE_JS = (
+    'const cp = require("child_process");'
+    'let version = null, resolvable = false;'
+    'try { version = cp.execSync("vue --version",'
+    ' {timeout: 8000, stdio: ["ignore", "pipe", "ignore"]})'
+    '.toString().trim(); } catch (e) {}'
+    'try { require.resolve("@vue/cli"); resolvable = true; } catch (e) {}'
+    'console.log(JSON.stringify({version: version, resolvable: resolvable}));'
+)
+
+
+def _query_npm_registry_version(package_name: str) -> Optional[str]:
+    """
+    Read a package's latest version straight from the npm registry.
 
-    # Check for @vue/cli (legacy Vue CLI)
-    success, stdout, stderr = run_command(["vue", "--version"], timeout=10)
-    if success:
-        tools["@vue/cli"] = (True, f"@vue/cli {stdout} is installed")
-    else:
-        # Check if it's available via npx
-        success, stdout, stderr = run_command(["npx", "@vue/cli", "--version"], timeout=15)
+    One HTTP GET replaces the `npm show` subprocess, which spins up the
+    whole Node.js + npm runtime (~800 ms) just to print one string.
+
+    Args:
+        package_name: npm package name (e.g., "create-vue")
+
+    Returns:
+        Version string or None if the registry is unreachable
+    """
+    try:
+        from urllib.request import urlopen
+        url = f"https://registry.npmjs.org/{package_name}/latest"
+        with urlopen(url, timeout=5) as response:
+            return json.loads(response.read()).get("version")
+    except Exception:
+        return None
+
+
+def _refresh_create_vue_cache() -> Optional[str]:
+    """Fetch the latest create-vue version and persist it for 24 hours."""
+    version = _query_npm_registry_version("create-vue")
+    if not version:
+        # npm subprocess only as a last resort, e.g. registry blocked but
+        # an npm proxy configured.
+        success, stdout, _ = run_command(["npm", "show", "create-vue", "version"],
+                                       cache=True)
         if success:
-            tools["@vue/cli"] = (True, f"@vue/cli available via npx")
-        else:
-            tools["@vue/cli"] = (False, "@vue/cli not available")
+            version = stdout
 
-    return tools
+    if version:
+        try:
+            _CREATE_VUE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+            _CREATE_VUE_CACHE_FILE.write_text(
+                json.dumps({"version": version, "ts": time.time()}))
+        except OSError:
+            pass
+    return version
 
 
+def get_create_vue_version() -> Optional[str]:
+    """
+    Get the latest create-vue version, avoiding the registry round-trip.
+
+    A fresh cache answers immediately; a stale cache still answers
+    immediately but kicks off a daemon-thread refresh for the next run.
+    Only a cold cache blocks on the network.
+
+    Returns:
+        Version string or None if it cannot be determined
+    """
+    try:
+        data = json.loads(_CREATE_VUE_CACHE_FILE.read_bytes())
+        version = data["version"]
+        if time.time() - data["ts"] > 86400:
+            threading.Thread(target=_refresh_create_vue_cache,
+                             daemon=True).start()
+        return version
+    except (OSError, ValueError, KeyError):
+        pass
+
+    print("Checking create-vue version...")
+    return _refresh_create_vue_cache()
+
+
+@functools.lru_cache(maxsize=1)
+def check_vue_cli_tools() -> Dict[str, Tuple[bool, str]]:
+    """
+    Check for Vue.js CLI tools and create-vue availability.
+
+    Returns:
+        Dictionary of tool names and their availability status
+    """
+    def probe_create_vue() -> Tuple[bool, str]:
+        # Check for create-vue (official Vue 3 project scaffolding tool)
+        version = get_create_vue_version()
+        if version:
+            return True, f"create-vue@{version} is available"
+        return False, "create-vue not available"
+
+    def probe_vue_cli() -> Tuple[bool, str]:
+        # Check for @vue/cli (legacy Vue CLI): one node -e run covers the
+        # direct CLI and the module-resolution fallback together.
+        if shutil.which("node"):
+            success, stdout, _ = run_command(["node", "-e", _VUE_CLI_PROBE_JS],
+                                             timeout=20, cache=True)
+            if success and stdout:
+                try:
+                    info = json.loads(stdout)
+                except ValueError:
+                    info = None
+                if info is not None:
+                    if info.get("version"):
+                        return True, f"@vue/cli {info['version']} is installed"
+                    if info.get("resolvable"):
+                        return True, "@vue/cli available via npx"
+                    return False, "@vue/cli not available"
+
+        # Node missing or the batched probe broke: fall back to spawning
+        # the tools directly.
+        if shutil.which("vue"):
+            success, stdout, _ = run_command(["vue", "--version"], timeout=10,
+                                             cache=True)
+            if success:
+                return True, f"@vue/cli {stdout} is installed"
+        if shutil.which("npx"):
+            success, _, _ = run_command(["npx", "@vue/cli", "--version"],
+                                        timeout=15, capture=False,
+                                        cache=True)
+            if success:
+                return True, "@vue/cli available via npx"
+        return False, "@vue/cli not available"
+
+    # The registry round-trip and the local CLI probe are independent;
+    # overlapping them hides the slower one.
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        create_vue_future = executor.submit(probe_create_vue)
+        vue_cli_future = executor.submit(probe_vue_cli)
+        return {
+            "create-vue": create_vue_future.result(),
+            "@vue/cli": vue_cli_future.result(),
+        }
+
+
+@functools.lru_cache(maxsize=1)
 def check_git_installation() -> Tuple[bool, Optional[str], str]:
     """
     Check if Git is installed and configured.
@@ -168,7 +455,9 @@ def check_git_installation() -> Tuple[bool, Optional[str], str]:
     Returns:
         Tuple of (is_installed, version, message)
     """
-    success, stdout, stderr = run_command(["git", "--version"])
+    if not shutil.which("git"):
+        return False, None, "Git not found: git is not on PATH"
+    success, stdout, stderr = run_command(["git", "--version"], cache=True)
     if not success:
         return False, None, f"Git not found: {stderr}"
 
@@ -176,10 +465,16 @@ def check_git_installation() -> Tuple[bool, Optional[str], str]:
     return True, git_version, f"Git is installed: {git_version}"
 
 
-def check_system_compatibility() -> Dict[str, any]:
+def check_system_compatibility(
+        on_check: Optional[Callable[[str, Dict], None]] = None) -> Dict[str, Any]:
     """
     Check overall system compatibility for Vue 3 development.
 
+    Args:
+        on_check: Optional callback invoked with (check_name, check_result)
+            the moment each check finishes; lets callers stream results
+            instead of waiting for the slowest probe
+
     Returns:
         Dictionary containing compatibility information
     """
@@ -188,131 +483,201 @@ def check_system_compatibility() -> Dict[str, any]:
         "python_version": sys.version,
         "checks": {}
     }
-
-    # Check Node.js version manager
-    manager_name, manager_version, manager_available = check_node_version_manager()
-    compatibility["checks"]["version_manager"] = {
-        "name": manager_name,
-        "version": manager_version,
-        "available": manager_available,
-        "recommended": manager_name != "none"
-    }
-
-    # Check Node.js version
-    node_compatible, node_version, node_message = check_node_version()
-    compatibility["checks"]["nodejs"] = {
-        "version": node_version,
-        "compatible": node_compatible,
-        "message": node_message,
-        "recommended": node_compatible
-    }
-
-    # Check pnpm
-    pnpm_installed, pnpm_version, pnpm_message = check_pnpm_installation()
-    compatibility["checks"]["pnpm"] = {
-        "installed": pnpm_installed,
-        "version": pnpm_version,
-        "message": pnpm_message,
-        "recommended": pnpm_installed
-    }
-
-    # Check npm as fallback
-    npm_installed, npm_version, npm_message = check_npm_installation()
-    compatibility["checks"]["npm"] = {
-        "installed": npm_installed,
-        "version": npm_version,
-        "message": npm_message
-    }
-
-    # Check Vue tools
-    compatibility["checks"]["vue_tools"] = check_vue_cli_tools()
-
-    # Check Git
-    git_installed, git_version, git_message = check_git_installation()
-    compatibility["checks"]["git"] = {
-        "installed": git_installed,
-        "version": git_version,
-        "message": git_message,
-        "recommended": git_installed
-    }
+    checks = compatibility["checks"]
+    has_vue_tool = False
+
+    def emit(name: str, payload: Dict) -> None:
+        checks[name] = payload
+        if on_check is not None:
+            on_check(name, payload)
+
+    # The probes are independent subprocess launches, so run them all
+    # concurrently: wall time becomes roughly the slowest probe instead of
+    # the sum of all of them. The Node result gates the rest — without
+    # Node there is no npm/pnpm and the Vue tool probes (the most
+    # expensive, one hits the npm registry) can only report noise. Each
+    # check is emitted as soon as its future resolves, so the loop keeps
+    # draining completed futures while later submissions are in flight.
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        pending = {
+            executor.submit(check_node_version_manager): "version_manager",
+            executor.submit(check_node_version): "nodejs",
+            executor.submit(check_git_installation): "git",
+        }
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                label = pending.pop(future)
+                if label == "version_manager":
+                    manager_name, manager_version, manager_available = future.result()
+                    emit("version_manager", {
+                        "name": manager_name,
+                        "version": manager_version,
+                        "available": manager_available,
+                        "recommended": manager_name != "none"
+                    })
+                elif label == "nodejs":
+                    node_compatible, node_version, node_message = future.result()
+                    emit("nodejs", {
+                        "version": node_version,
+                        "compatible": node_compatible,
+                        "message": node_message,
+                        "recommended": node_compatible
+                    })
+                    if node_version is None:
+                        emit("pnpm", {
+                            "installed": False,
+                            "version": None,
+                            "message": "skipped: Node.js missing",
+                            "recommended": False
+                        })
+                        emit("npm", {
+                            "installed": False,
+                            "version": None,
+                            "message": "skipped: Node.js missing"
+                        })
+                    else:
+                        pending[executor.submit(check_pnpm_installation)] = "pnpm"
+                        pending[executor.submit(check_npm_installation)] = "npm"
+                    if node_compatible:
+                        pending[executor.submit(check_vue_cli_tools)] = "vue_tools"
+                    else:
+                        emit("vue_tools", {
+                            "create-vue": (False, "skipped: Node.js missing or too old"),
+                            "@vue/cli": (False, "skipped: Node.js missing or too old"),
+                        })
+                elif label == "pnpm":
+                    pnpm_installed, pnpm_version, pnpm_message = future.result()
+                    emit("pnpm", {
+                        "installed": pnpm_installed,
+                        "version": pnpm_version,
+                        "message": pnpm_message,
+                        "recommended": pnpm_installed
+                    })
+                elif label == "npm":
+                    npm_installed, npm_version, npm_message = future.result()
+                    emit("npm", {
+                        "installed": npm_installed,
+                        "version": npm_version,
+                        "message": npm_message
+                    })
+                elif label == "vue_tools":
+                    vue_tools = future.result()
+                    # Note availability while the results are in hand;
+                    # cheaper than re-scanning the dict afterwards and it
+                    # stops at the first hit.
+                    for available, _ in vue_tools.values():
+                        if available:
+                            has_vue_tool = True
+                            break
+                    emit("vue_tools", vue_tools)
+                else:  # git
+                    git_installed, git_version, git_message = future.result()
+                    emit("git", {
+                        "installed": git_installed,
+                        "version": git_version,
+                        "message": git_message,
+                        "recommended": git_installed
+                    })
 
     # Overall compatibility assessment
     compatibility["overall_compatible"] = (
-        node_compatible and
-        (pnpm_installed or npm_installed) and
-        git_installed
+        checks["nodejs"]["compatible"] and
+        (checks["pnpm"]["installed"] or checks["npm"]["installed"]) and
+        checks["git"]["installed"]
     )
 
     compatibility["ready_for_development"] = (
-        compatibility["overall_compatible"] and
-        any(tool[0] for tool in compatibility["checks"]["vue_tools"].values())
+        compatibility["overall_compatible"] and has_vue_tool
     )
 
+    # Both package-manager results are already in hand; deriving the
+    # recommendation here saves the caller a second pair of probes.
+    if checks["pnpm"]["installed"]:
+        compatibility["recommended_pm"] = "pnpm"
+    elif checks["npm"]["installed"]:
+        compatibility["recommended_pm"] = "npm"
+    else:
+        compatibility["recommended_pm"] = "pnpm"  # Default recommendation
+
     return compatibility
 
 
-def suggest_package_manager() -> str:
+@functools.lru_cache(maxsize=1)
+def _detect_package_manager() -> str:
+    """Pick a package manager from PATH alone.
+
+    A PATH scan answers "is it installed" without forking a version
+    probe, so standalone callers (e.g. the dependency manager) get a
+    near-instant answer.
+    """
+    if shutil.which("pnpm"):
+        return "pnpm"
+    if shutil.which("npm"):
+        return "npm"
+    return "pnpm"  # Default recommendation
+
+
+def suggest_package_manager(compatibility: Optional[Dict[str, Any]] = None) -> str:
     """
     Suggest the best package manager to use based on availability.
 
+    Args:
+        compatibility: Result of check_system_compatibility; when given,
+            its precomputed recommendation is reused instead of probing
+            pnpm/npm again
+
     Returns:
         Recommended package manager command
     """
-    pnpm_installed, _, _ = check_pnpm_installation()
-    npm_installed, _, _ = check_npm_installation()
-
-    if pnpm_installed:
-        return "pnpm"
-    elif npm_installed:
-        return "npm"
-    else:
-        return "pnpm"  # Default recommendation
+    if compatibility is not None and "recommended_pm" in compatibility:
+        return compatibility["recommended_pm"]
+    return _detect_package_manager()
 
 
-def get_installation_commands() -> Dict[str, List[str]]:
+def get_installation_commands(compatibility: Dict[str, Any]) -> Dict[str, List[str]]:
     """
     Get commands to install missing tools.
 
+    Args:
+        compatibility: Result of check_system_compatibility; reusing it
+            avoids re-running the probes it already paid for
+
     Returns:
         Dictionary of tool names and their installation commands
     """
     commands = {}
-
-    # Check OS type
-    is_windows = sys.platform.startswith("win")
-    is_mac = sys.platform == "darwin"
-    is_linux = sys.platform.startswith("linux")
+    checks = compatibility["checks"]
 
     # pnpm installation
-    if not check_pnpm_installation()[0]:
-        if is_windows:
+    if not checks["pnpm"]["installed"]:
+        if _IS_WIN:
             commands["pnpm"] = ["iwr", "https://get.pnpm.io/install.ps1", "|", "iex"]
         else:
             commands["pnpm"] = ["curl", "-fsSL", "https://get.pnpm.io/install.sh", "|", "sh", "-"]
 
     # fnm installation (if no version manager)
-    manager_name, _, manager_available = check_node_version_manager()
-    if not manager_available:
-        if is_mac:
+    manager_name = checks["version_manager"]["name"]
+    if not checks["version_manager"]["available"]:
+        if _IS_MAC:
             commands["fnm"] = ["brew", "install", "fnm"]
-        elif is_linux:
+        elif _IS_LINUX:
             commands["fnm"] = ["curl", "-fsSL", "https://fnm.vercel.app/install", "|", "bash"]
-        elif is_windows:
+        elif _IS_WIN:
             commands["fnm"] = ["winget", "install", "Schniz.fnm"]
 
     # Node.js installation (if no Node.js)
-    node_compatible, node_version, _ = check_node_version()
-    if not node_compatible:
+    if not checks["nodejs"]["compatible"]:
         if manager_name == "fnm":
             commands["nodejs"] = ["fnm", "install", "--lts"]
         elif manager_name == "nvm":
             commands["nodejs"] = ["bash", "-lc", "nvm install --lts"]
         else:
-            if is_mac:
+            if _IS_MAC:
                 commands["nodejs"] = ["brew", "install", "node"]
-            elif is_windows:
+            elif _IS_WIN:
                 commands["nodejs"] = ["winget", "install", "OpenJS.NodeJS"]
-            elif is_linux:
+            elif _IS_LINUX:
                 commands["nodejs"] = ["curl", "-fsSL", "https://deb.nodesource.com/setup_lts.x", "|", "sudo", "-E", "bash", "-", "&&", "sudo", "apt-get", "install", "-y", "nodejs"]
 
     return commands
@@ -322,51 +687,71 @@ def main():
     """
     Main function to run environment checks.
     """
-    print("Vue 3 Project Generator - Environment Check")
-    print("=" * 50)
+    import argparse
 
-    compatibility = check_system_compatibility()
+    parser = argparse.ArgumentParser(
+        description="Check the local environment for Vue 3 development")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Re-run every probe instead of using cached "
+                             "results")
+    args = parser.parse_args()
 
-    print(f"Platform: {compatibility['platform']}")
-    print(f"Python Version: {compatibility['python_version'].split()[0]}")
-    print()
-
-    # Version Manager
-    vm = compatibility["checks"]["version_manager"]
-    print(f"Version Manager: {vm['name']} {'✅' if vm['available'] else '❌'}")
-    if vm['version']:
-        print(f"  Version: {vm['version']}")
-    print()
-
-    # Node.js
-    node = compatibility["checks"]["nodejs"]
-    print(f"Node.js: {node['version'] or 'Not found'} {'✅' if node['compatible'] else '❌'}")
-    print(f"  {node['message']}")
-    print()
-
-    # Package Managers
-    pnpm = compatibility["checks"]["pnpm"]
-    print(f"pnpm: {pnpm['version'] or 'Not installed'} {'✅' if pnpm['installed'] else '❌'}")
-    print(f"  {pnpm['message']}")
-    print()
+    if args.no_cache:
+        global _probe_cache_bypass
+        _probe_cache_bypass = True
 
-    npm = compatibility["checks"]["npm"]
-    print(f"npm: {npm['version'] or 'Not installed'} {'✅' if npm['installed'] else '❌'}")
-    print(f"  {npm['message']}")
-    print()
+    print("Vue 3 Project Generator - Environment Check")
+    print("=" * 50)
 
-    # Vue Tools
-    print("Vue Tools:")
-    for tool, (available, message) in compatibility["checks"]["vue_tools"].items():
-        print(f"  {tool}: {'✅' if available else '❌'}")
-        print(f"    {message}")
+    print(f"Platform: {sys.platform}")
+    print(f"Python Version: {sys.version.split()[0]}")
     print()
 
-    # Git
-    git = compatibility["checks"]["git"]
-    print(f"Git: {git['version'] or 'Not found'} {'✅' if git['installed'] else '❌'}")
-    print(f"  {git['message']}")
-    print()
+    def print_version_manager(vm):
+        print(f"Version Manager: {vm['name']} {'✅' if vm['available'] else '❌'}")
+        if vm['version']:
+            print(f"  Version: {vm['version']}")
+        print()
+
+    def print_nodejs(node):
+        print(f"Node.js: {node['version'] or 'Not found'} {'✅' if node['compatible'] else '❌'}")
+        print(f"  {node['message']}")
+        print()
+
+    def print_pnpm(pnpm):
+        print(f"pnpm: {pnpm['version'] or 'Not installed'} {'✅' if pnpm['installed'] else '❌'}")
+        print(f"  {pnpm['message']}")
+        print()
+
+    def print_npm(npm):
+        print(f"npm: {npm['version'] or 'Not installed'} {'✅' if npm['installed'] else '❌'}")
+        print(f"  {npm['message']}")
+        print()
+
+    def print_vue_tools(vue_tools):
+        print("Vue Tools:")
+        for tool, (available, message) in vue_tools.items():
+            print(f"  {tool}: {'✅' if available else '❌'}")
+            print(f"    {message}")
+        print()
+
+    def print_git(git):
+        print(f"Git: {git['version'] or 'Not found'} {'✅' if git['installed'] else '❌'}")
+        print(f"  {git['message']}")
+        print()
+
+    # Each section prints the moment its probe resolves instead of after
+    # the slowest one, so sections appear in completion order.
+    printers = {
+        "version_manager": print_version_manager,
+        "nodejs": print_nodejs,
+        "pnpm": print_pnpm,
+        "npm": print_npm,
+        "vue_tools": print_vue_tools,
+        "git": print_git,
+    }
+    compatibility = check_system_compatibility(
+        on_check=lambda name, check: printers[name](check))
 
     # Overall Status
     print("Overall Status:")
@@ -375,11 +760,11 @@ def main():
 
     if not compatibility['overall_compatible']:
         print("\nSuggested Installation Commands:")
-        commands = get_installation_commands()
+        commands = get_installation_commands(compatibility)
         for tool, cmd in commands.items():
             print(f"  {tool}: {' '.join(cmd)}")
 
-    print(f"\nRecommended Package Manager: {suggest_package_manager()}")
+    print(f"\nRecommended Package Manager: {suggest_package_manager(compatibility)}")
 
 
 if __name__ == "__main__":
@@ -12,13 +12,20 @@ import json
 import argparse
 import subprocess
 import shutil
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 
 from query_versions import (
     get_all_vue3_dependencies,
     get_dev_dependencies_info,
-    generate_package_json_content
+    generate_package_json_content,
+    json_dumps,
+    json_loads,
+    query_npm_latest_version,
+    set_version_cache_bypass
 )
 from check_environment import (
     check_system_compatibility,
@@ -28,13 +35,86 @@ from check_environment import (
 )
 
 
+# Environment facts that survive across runs: once create-vue is known
+# to be installed and a package manager chosen, re-probing both on every
+# invocation is a pair of needless npm cold-starts.
+_ENV_CACHE_FILE = Path.home() / ".cache" / "vue3-generator" / "env.json"
+_ENV_CACHE_TTL = 7 * 24 * 3600
+
+
+def _load_env_cache() -> Dict[str, Any]:
+    """Return the cached environment facts, or {} when absent or stale."""
+    try:
+        with open(_ENV_CACHE_FILE) as f:
+            data = json.load(f)
+        if time.time() - data.get("ts", 0) < _ENV_CACHE_TTL:
+            return data
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def _save_env_cache(data: Dict[str, Any]) -> None:
+    """Persist environment facts; a failed write never breaks setup."""
+    try:
+        _ENV_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        data["ts"] = time.time()
+        with open(_ENV_CACHE_FILE, "w") as f:
+            json.dump(data, f)
+    except OSError:
+        pass
+
+
+def _fast_rmtree(path: Path) -> None:
+    """Remove a directory tree, faster than shutil.rmtree for big trees.
+
+    A re-run deletes a scaffolded project whose node_modules holds
+    thousands of files. On POSIX a single rm -rf fork traverses and
+    unlinks at C speed; on Windows, where each delete is an independent
+    (and slow) syscall, the per-directory unlinks are fanned out across
+    threads. shutil.rmtree remains the fallback either way.
+    """
+    if os.name == "posix":
+        try:
+            subprocess.run(["rm", "-rf", str(path)], check=True)
+            return
+        except (OSError, subprocess.CalledProcessError):
+            pass
+    elif os.name == "nt":
+        try:
+            # Bottom-up walk: by the time a directory is visited, every
+            # subdirectory below it has already been emptied and removed
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                for root, dirs, files in os.walk(path, topdown=False):
+                    list(executor.map(
+                        os.unlink,
+                        (os.path.join(root, name) for name in files)))
+                    for name in dirs:
+                        os.rmdir(os.path.join(root, name))
+            os.rmdir(path)
+            return
+        except OSError:
+            pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
 class Vue3ProjectGenerator:
     """Main class for generating Vue 3 projects."""
 
+    # CSS framework -> (package.json section, packages to pin)
+    _CSS_FRAMEWORK_PACKAGES = {
+        "tailwindcss": ("devDependencies",
+                        ["tailwindcss", "postcss", "autoprefixer"]),
+        "bootstrap": ("dependencies", ["bootstrap", "@popperjs/core"]),
+        "bulma": ("dependencies", ["bulma"])
+    }
+
     def __init__(self):
         self.project_types = ["spa", "pwa", "component-lib", "admin-dashboard"]
         self.css_frameworks = ["none", "tailwindcss", "bootstrap", "bulma"]
-        self.default_config = self._get_default_config()
+        # Read-only view: the defaults are shared state that callers merge
+        # from, never mutate, so build them once and freeze them
+        self.default_config = types.MappingProxyType(self._get_default_config())
 
     def _get_default_config(self) -> Dict[str, Any]:
         """Get default configuration for Vue 3 projects."""
@@ -72,7 +152,7 @@ class Vue3ProjectGenerator:
                 print("  - Git not found (recommended for version control)")
 
             print("\n💡 Suggested installation commands:")
-            commands = get_installation_commands()
+            commands = get_installation_commands(compatibility)
             for tool, cmd in commands.items():
                 print(f"  {tool}: {' '.join(cmd)}")
 
@@ -85,33 +165,40 @@ class Vue3ProjectGenerator:
         """Setup the development environment and return package manager command."""
         print("🔧 Setting up development environment...")
 
-        package_manager = suggest_package_manager()
+        env_cache = _load_env_cache()
+        package_manager = env_cache.get("package_manager") or suggest_package_manager()
         print(f"📦 Using {package_manager} as package manager")
 
-        # Check if create-vue is available
-        success, stdout, stderr = run_command([package_manager, "show", "create-vue", "version"])
-        if not success:
-            print(f"⚠️  create-vue not found, will install it...")
-            success, _, error = run_command([package_manager, "add", "-g", "create-vue"])
+        # Check if create-vue is available; a fresh cached answer skips
+        # the npm cold-start entirely
+        if not env_cache.get("create_vue_available"):
+            success, stdout, stderr = run_command(
+                [package_manager, "show", "create-vue", "version"], cache=True)
             if not success:
-                print(f"❌ Failed to install create-vue: {error}")
-                return None
+                print(f"⚠️  create-vue not found, will install it...")
+                success, _, error = run_command([package_manager, "add", "-g", "create-vue"])
+                if not success:
+                    print(f"❌ Failed to install create-vue: {error}")
+                    return None
+            _save_env_cache({
+                "create_vue_available": True,
+                "package_manager": package_manager
+            })
 
         print(f"✅ Environment setup complete!")
         return package_manager
 
-    def create_vue_project(self, config: Dict[str, Any], package_manager: str) -> bool:
+    def create_vue_project(self, config: Dict[str, Any], package_manager: str,
+                           project_path: Path) -> bool:
         """Create Vue 3 project using create-vue."""
         print(f"🚀 Creating Vue 3 project '{config['project_name']}'...")
 
-        project_path = Path(config["project_name"])
-
         # Remove existing directory if it exists
         if project_path.exists():
             print(f"⚠️  Directory '{config['project_name']}' already exists")
             response = input("  Delete existing directory? (y/N): ")
             if response.lower() in ['y', 'yes']:
-                shutil.rmtree(project_path)
+                _fast_rmtree(project_path)
                 print(f"  🗑️  Removed existing directory")
             else:
                 print("  ❌ Project creation cancelled")
@@ -135,18 +222,27 @@ class Vue3ProjectGenerator:
 
         # Run create-vue with responses
         try:
-            process = subprocess.Popen(
-                cmd,
-                stdin=subprocess.PIPE,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=Path.cwd()
-            )
-
-            # Send responses to prompts
+            popen_kwargs = {
+                "stdin": subprocess.PIPE,
+                "stdout": subprocess.PIPE,
+                "stderr": subprocess.PIPE,
+                # Byte pipes with block buffering: collect raw output and
+                # decode once at the end rather than incrementally per
+                # chunk (text=True decodes as it reads).
+                "bufsize": 65536,
+                "cwd": Path.cwd()
+            }
+            if sys.version_info >= (3, 10) and sys.platform == "linux":
+                # A 1 MiB OS pipe keeps large scaffold logs from blocking
+                # the producer; only Linux exposes F_SETPIPE_SZ.
+                popen_kwargs["pipesize"] = 1 << 20
+            process = subprocess.Popen(cmd, **popen_kwargs)
+
+            # Send all prompt responses in a single write
             input_text = "\n".join(responses) + "\n"
-            stdout, stderr = process.communicate(input=input_text, timeout=120)
+            stdout, stderr = process.communicate(
+                input=input_text.encode("utf-8"), timeout=120)
+            stderr = stderr.decode("utf-8", errors="replace")
 
             if process.returncode == 0:
                 print("✅ Vue 3 project created successfully!")
@@ -163,45 +259,28 @@ class Vue3ProjectGenerator:
             print(f"❌ Error creating project: {e}")
             return False
 
-    def install_dependencies(self, config: Dict[str, Any], package_manager: str) -> bool:
+    def install_dependencies(self, config: Dict[str, Any], package_manager: str,
+                             project_path: Path) -> bool:
         """Install project dependencies."""
         print("📦 Installing dependencies...")
 
-        project_path = Path(config["project_name"])
-
         try:
-            # Change to project directory
-            os.chdir(project_path)
-
-            # Install dependencies
-            success, stdout, stderr = run_command([package_manager, "install"], timeout=300)
+            # Run inside the project via cwd= rather than os.chdir, which
+            # is process-global state — unsafe around the threaded version
+            # fan-out and wrong if the generator is used as a library
+            success, stdout, stderr = run_command(
+                [package_manager, "install"], timeout=300, cwd=project_path)
             if not success:
                 print(f"❌ Failed to install dependencies: {stderr}")
                 return False
 
-            # Add CSS framework if specified
-            if config.get("css_framework") and config["css_framework"] != "none":
-                print(f"🎨 Installing {config['css_framework']}...")
-                if config["css_framework"] == "tailwindcss":
-                    success, _, error = run_command([
-                        package_manager, "add", "-D", "tailwindcss", "postcss", "autoprefixer"
-                    ])
-                    if success:
-                        run_command(["npx", "tailwindcss", "init", "-p"])
-                    else:
-                        print(f"⚠️  Failed to install Tailwind CSS: {error}")
-
-                elif config["css_framework"] == "bootstrap":
-                    success, _, error = run_command([
-                        package_manager, "add", "bootstrap", "@popperjs/core"
-                    ])
-                    if not success:
-                        print(f"⚠️  Failed to install Bootstrap: {error}")
-
-                elif config["css_framework"] == "bulma":
-                    success, _, error = run_command([package_manager, "add", "bulma"])
-                    if not success:
-                        print(f"⚠️  Failed to install Bulma: {error}")
+            # CSS framework packages are already folded into package.json
+            # by configure_project, so the install above resolved them in
+            # the same pass; Tailwind just needs its config scaffolded.
+            if config.get("css_framework") == "tailwindcss":
+                print("🎨 Setting up tailwindcss...")
+                run_command(["npx", "tailwindcss", "init", "-p"],
+                            cwd=project_path)
 
             print("✅ Dependencies installed successfully!")
             return True
@@ -209,32 +288,42 @@ class Vue3ProjectGenerator:
         except Exception as e:
             print(f"❌ Error installing dependencies: {e}")
             return False
-        finally:
-            # Return to original directory
-            os.chdir("..")
 
-    def configure_project(self, config: Dict[str, Any]) -> bool:
+    def configure_project(self, config: Dict[str, Any],
+                          project_path: Path) -> bool:
         """Configure project settings and files."""
         print("⚙️  Configuring project...")
 
-        project_path = Path(config["project_name"])
-
         try:
+            # Stage each file's content in memory first, then flush them
+            # in one write pass at the end
+            writes = []
+
             # Update package.json with custom information
             package_json_path = project_path / "package.json"
             if package_json_path.exists():
-                with open(package_json_path, 'r') as f:
-                    package_data = json.load(f)
+                package_data = json_loads(package_json_path.read_bytes())
 
                 # Update custom fields
                 package_data["description"] = config.get("project_description", package_data["description"])
                 package_data["author"] = config.get("author", "")
                 package_data["license"] = config.get("license", "MIT")
 
-                with open(package_json_path, 'w') as f:
-                    json.dump(package_data, f, indent=2)
-
-                print("  📝 Updated package.json")
+                # Fold the CSS framework's packages into package.json here
+                # so the single install pass resolves them together with
+                # the base dependencies — one resolver run, one lockfile
+                # write, no extra package-manager cold-starts afterwards.
+                css_framework = config.get("css_framework")
+                if css_framework and css_framework != "none":
+                    if css_framework in self._CSS_FRAMEWORK_PACKAGES:
+                        section, packages = self._CSS_FRAMEWORK_PACKAGES[css_framework]
+                        target = package_data.setdefault(section, {})
+                        for package in packages:
+                            ver = query_npm_latest_version(package)
+                            target[package] = f"^{ver}" if ver else "latest"
+
+                writes.append((package_json_path, json_dumps(package_data),
+                               "  📝 Updated package.json"))
 
             # Create .env file
             env_content = f"""# Environment variables for {config['project_name']}
@@ -244,16 +333,15 @@ VITE_APP_VERSION=0.1.0
 VITE_API_BASE_URL=http://localhost:3000/api
 """
 
-            env_path = project_path / ".env"
-            with open(env_path, 'w') as f:
-                f.write(env_content)
-
-            print("  📝 Created .env file")
+            writes.append((project_path / ".env", env_content,
+                           "  📝 Created .env file"))
 
             # Update README.md
             readme_path = project_path / "README.md"
             if readme_path.exists():
-                # Build helper variables
+                # Build helper variables; resolve the package manager once
+                # instead of once per code block below
+                pm = suggest_package_manager()
                 router_info = ', Vue Router' if config.get('router') else ''
                 pinia_info = ', Pinia' if config.get('pinia') else ''
                 css_framework_line = f"- {config['css_framework']}" if config.get('css_framework') and config['css_framework'] != 'none' else ''
@@ -269,32 +357,32 @@ VITE_API_BASE_URL=http://localhost:3000/api
 ## Project Setup
 
 ```sh
-{suggest_package_manager()} install
+{pm} install
 ```
 
 ## Development Server
 
 ```sh
-{suggest_package_manager()} dev
+{pm} dev
 ```
 
 ## Build for Production
 
 ```sh
-{suggest_package_manager()} build
+{pm} build
 ```
 
 ## Run Tests
 
 ```sh
-{suggest_package_manager()} test
+{pm} test
 ```
 
 ## Lint and Format
 
 ```sh
-{suggest_package_manager()} lint
-{suggest_package_manager()} format
+{pm} lint
+{pm} format
 ```
 
 ## Project Type
@@ -306,10 +394,12 @@ This is a **{config['project_type'].upper()}** project built with:
 {css_framework_line}
 """
 
-                with open(readme_path, 'w') as f:
-                    f.write(readme_content)
+                writes.append((readme_path, readme_content,
+                               "  📝 Updated README.md"))
 
-                print("  📝 Updated README.md")
+            for path, content, message in writes:
+                path.write_text(content)
+                print(message)
 
             print("✅ Project configured successfully!")
             return True
@@ -335,20 +425,39 @@ This is a **{config['project_type'].upper()}** project built with:
         if not package_manager:
             return False
 
-        # Create Vue project
-        if not self.create_vue_project(config, package_manager):
+        # Parse the project path once and thread it through the steps
+        project_path = Path(config["project_name"])
+
+        # Create the Vue project while warming the version lookups that
+        # configure_project will need: the registry round-trips hide
+        # entirely behind the much longer create-vue scaffold, landing in
+        # query_versions' caches before they're read. Threads keep the
+        # pipeline synchronous, matching the concurrency style used
+        # elsewhere in these scripts.
+        _, prefetch_packages = self._CSS_FRAMEWORK_PACKAGES.get(
+            config.get("css_framework"), (None, []))
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            prefetch_futures = [executor.submit(query_npm_latest_version, p)
+                                for p in prefetch_packages]
+            created = self.create_vue_project(config, package_manager,
+                                              project_path)
+            for future in prefetch_futures:
+                future.exception()  # failed lookups fall back to "latest"
+        if not created:
             return False
 
-        # Install dependencies
-        if not self.install_dependencies(config, package_manager):
+        # Configure project before installing so the package.json edits
+        # (including CSS framework packages) land in the single install
+        # pass below
+        if not self.configure_project(config, project_path):
             return False
 
-        # Configure project
-        if not self.configure_project(config):
+        # Install dependencies
+        if not self.install_dependencies(config, package_manager, project_path):
             return False
 
         print("\n🎉 Vue 3 project generated successfully!")
-        print(f"📁 Project location: {Path(config['project_name']).absolute()}")
+        print(f"📁 Project location: {project_path.absolute()}")
         print(f"🚀 Get started with: cd {config['project_name']} && {package_manager} dev")
 
         return True
@@ -358,7 +467,7 @@ This is a **{config['project_type'].upper()}** project built with:
         print("🎯 Vue 3 Project Generator - Interactive Mode")
         print("=" * 50)
 
-        config = self.default_config.copy()
+        config = dict(self.default_config)
 
         # Project name
         project_name = input(f"Project name [{config['project_name']}: ").strip()
@@ -375,9 +484,13 @@ This is a **{config['project_type'].upper()}** project built with:
         for i, pt in enumerate(self.project_types, 1):
             print(f"  {i}. {pt}")
 
+        # Build the prompt once; recomputing the default index per retry
+        # is pointless work
+        default_idx = self.project_types.index(config['project_type']) + 1
+        prompt = f"Select project type [1-{len(self.project_types)}, default={default_idx}]: "
         while True:
             try:
-                choice = input(f"Select project type [1-{len(self.project_types)}, default={self.project_types.index(config['project_type']) + 1}]: ").strip()
+                choice = input(prompt).strip()
                 if not choice:
                     break
                 choice = int(choice)
@@ -394,9 +507,11 @@ This is a **{config['project_type'].upper()}** project built with:
         for i, cf in enumerate(self.css_frameworks, 1):
             print(f"  {i}. {cf}")
 
+        default_idx = self.css_frameworks.index(config['css_framework']) + 1
+        prompt = f"Select CSS framework [1-{len(self.css_frameworks)}, default={default_idx}]: "
         while True:
             try:
-                choice = input(f"Select CSS framework [1-{len(self.css_frameworks)}, default={self.css_frameworks.index(config['css_framework']) + 1}]: ").strip()
+                choice = input(prompt).strip()
                 if not choice:
                     break
                 choice = int(choice)
@@ -518,8 +633,22 @@ Examples:
         help="List available project types and exit"
     )
 
+    parser.add_argument(
+        "--refresh-versions",
+        action="store_true",
+        help="Re-query npm for package versions instead of using cached results"
+    )
+
+    parser.add_argument(
+        "--config-file",
+        help="Path to a JSON config file (skips all interactive prompts)"
+    )
+
     args = parser.parse_args()
 
+    if args.refresh_versions:
+        set_version_cache_bypass(True)
+
     # List project types and exit
     if args.list_types:
         generator = Vue3ProjectGenerator()
@@ -531,20 +660,28 @@ Examples:
     # Create generator instance
     generator = Vue3ProjectGenerator()
 
+    # Config file mode: no prompts, no stdin round-trips
+    if args.config_file:
+        try:
+            with open(args.config_file) as f:
+                config = {**generator.default_config, **json.load(f)}
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"❌ Failed to load config file: {e}")
+            sys.exit(1)
     # Interactive mode
-    if args.interactive or not args.project_name:
+    elif args.interactive or not args.project_name:
         config = generator.interactive_mode()
     else:
-        # Command line mode
-        config = generator.default_config.copy()
-        config.update({
+        # Command line mode: one merged dict literal, no intermediate copy
+        config = {
+            **generator.default_config,
             "project_name": args.project_name,
             "project_type": args.project_type,
             "css_framework": args.css_framework,
             "typescript": args.typescript,
             "router": args.router,
             "pinia": args.pinia
-        })
+        }
 
     # Generate project
     success = generator.generate_project(config)
@@ -7,16 +7,139 @@ and related packages from npm registry and GitHub API.
 """
 
 import requests
+import functools
 import json
-import re
-from typing import Dict, Optional, List
-from packaging import version
+import os
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional
+from requests.adapters import HTTPAdapter, Retry
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json remains the fallback
+    orjson = None
+
+
+def json_loads(data):
+    """Parse JSON from str/bytes with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to 2-space-indented JSON; orjson's emitter is several
+    times faster than stdlib pretty-printing when installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# One session shared by every registry query: the TLS handshake is paid
+# once per pooled connection instead of once per package, and transient
+# registry errors are retried with backoff instead of surfacing as a
+# failed lookup. Pool sizes match _query_many's worker ceiling.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+    ),
+))
+
+# The abbreviated-metadata format omits READMEs and most per-version
+# detail but keeps dist-tags and the versions keys — all this module
+# reads — at a fraction of the full packument size. The stable-version
+# fallback loop benefits too: it walks versions.keys() of a dict that is
+# orders of magnitude smaller for packages with long histories.
+_NPM_ACCEPT_HEADER = {"Accept": "application/vnd.npm.install-v1+json"}
+
+# Pre-release markers as plain substrings: a handful of C-level `in`
+# checks beats regex-engine setup for strings this short, and the loop
+# below runs once per published version.
+_PRERELEASE_TAGS = ("-alpha", "-beta", "-rc", "-pre", "-next", "-dev")
+
+# Version lookups survive across runs: the same ~15 packages are queried
+# every time the generator runs, and their latest versions change on the
+# order of days, not seconds. Entries are (version, timestamp) pairs
+# keyed by package name; the TTL is configurable for CI setups that want
+# fresher or longer-lived results.
+_CACHE_FILE = Path.home() / ".cache" / "vue3-generator" / "npm_versions.json"
+_CACHE_TTL = float(os.environ.get("VUE3_GEN_CACHE_TTL", 6 * 3600))
+_cache_bypass = False
+_cache_lock = threading.Lock()
+_cache: Optional[Dict[str, List]] = None
+
+
+def set_version_cache_bypass(bypass: bool) -> None:
+    """Force fresh registry queries, ignoring the on-disk version cache."""
+    global _cache_bypass
+    _cache_bypass = bypass
+
+
+def _load_cache() -> Dict[str, List]:
+    global _cache
+    if _cache is None:
+        try:
+            with open(_CACHE_FILE) as f:
+                _cache = json.load(f)
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache() -> None:
+    """Atomically persist the cache; a failed write never breaks a query."""
+    try:
+        _CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_FILE.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(_cache, f)
+        os.replace(tmp_path, _CACHE_FILE)
+    except OSError:
+        pass
+
 
+def _disk_cached(func):
+    """Serve version lookups from the on-disk cache while entries are fresh.
 
+    Only successful lookups are written back, so a package that failed to
+    resolve is retried on the next call rather than cached as a miss. The
+    lock keeps the cache consistent under _query_many's thread fan-out.
+    """
+    @functools.wraps(func)
+    def wrapper(package_name: str) -> Optional[str]:
+        if not _cache_bypass:
+            with _cache_lock:
+                entry = _load_cache().get(package_name)
+            if entry and time.time() - entry[1] < _CACHE_TTL:
+                return entry[0]
+        result = func(package_name)
+        if result is not None:
+            with _cache_lock:
+                _load_cache()[package_name] = [result, time.time()]
+                _save_cache()
+        return result
+    return wrapper
+
+
+@functools.lru_cache(maxsize=256)
+@_disk_cached
 def query_npm_latest_version(package_name: str) -> Optional[str]:
     """
     Query the latest stable version from npm registry.
 
+    Results are memoized in-process (typescript alone is asked for twice
+    per run) and cached on disk under a TTL (see _CACHE_FILE), so repeat
+    runs within the window skip the network entirely.
+
     Args:
         package_name: npm package name (e.g., "vue", "typescript")
 
@@ -25,7 +148,7 @@ def query_npm_latest_version(package_name: str) -> Optional[str]:
     """
     try:
         url = f"https://registry.npmjs.org/{package_name}"
-        response = requests.get(url, timeout=10)
+        response = _SESSION.get(url, timeout=10, headers=_NPM_ACCEPT_HEADER)
         response.raise_for_status()
 
         data = response.json()
@@ -37,28 +160,56 @@ def query_npm_latest_version(package_name: str) -> Optional[str]:
 
         if latest_version:
             # Verify it's not a pre-release version
-            if not re.search(r'-(alpha|beta|rc|pre|next)', latest_version):
+            if not any(tag in latest_version for tag in _PRERELEASE_TAGS):
                 return latest_version
 
-        # If dist-tags latest is pre-release or not available, find latest stable
-        stable_versions = []
+        # If dist-tags latest is pre-release or not available, find the
+        # latest stable in one pass. Comparing plain int tuples avoids a
+        # packaging.version.Version allocation per historical version —
+        # over a thousand for long-lived packages — and keeps the original
+        # version string instead of a re-rendered one.
+        best = None
+        best_str = None
         for ver in versions.keys():
-            if not re.search(r'-(alpha|beta|rc|pre|next|dev)', ver):
-                try:
-                    stable_versions.append(version.parse(ver))
-                except:
-                    continue
-
-        if stable_versions:
-            latest = max(stable_versions)
-            return str(latest)
-
-        return None
+            if any(tag in ver for tag in _PRERELEASE_TAGS):
+                continue
+            try:
+                parts = tuple(int(x) for x in ver.split('.'))
+            except ValueError:
+                continue
+            if best is None or parts > best:
+                best, best_str = parts, ver
+
+        return best_str
     except Exception as e:
         print(f"Failed to query npm registry for {package_name}: {e}")
         return None
 
 
+def _query_many(packages: List[str],
+                max_workers: int = 16) -> Dict[str, Optional[str]]:
+    """
+    Query latest versions for several packages concurrently.
+
+    The registry lookups are I/O-bound, so fanning them out makes the
+    batch cost roughly one round-trip instead of one per package. Each
+    lookup keeps query_npm_latest_version's own timeout, so a single
+    slow mirror cannot stall the batch beyond it.
+
+    Args:
+        packages: npm package names to look up
+        max_workers: Upper bound on concurrent registry requests
+
+    Returns:
+        Dictionary mapping package name to latest version (None where
+        the query failed)
+    """
+    if not packages:
+        return {}
+    with ThreadPoolExecutor(max_workers=min(len(packages), max_workers)) as executor:
+        return dict(zip(packages, executor.map(query_npm_latest_version, packages)))
+
+
 def get_vue3_info() -> Dict[str, str]:
     """
     Get comprehensive information about Vue 3 framework.
@@ -154,36 +305,43 @@ def get_pinia_info() -> Dict[str, str]:
     return pinia_info
 
 
-def get_dev_dependencies_info() -> Dict[str, Dict[str, str]]:
+def get_dev_dependencies_info(config: Optional[Dict] = None) -> Dict[str, Dict[str, str]]:
     """
     Get information about common development dependencies for Vue 3 projects.
 
+    Args:
+        config: Optional project configuration; the typescript, eslint,
+            prettier, and vitest flags prune packages the project will
+            never install, so disabled features skip their registry
+            lookups entirely
+
     Returns:
         Dictionary containing development dependencies version info
     """
-    dev_deps = [
-        "@vitejs/plugin-vue",
-        "@vue/tsconfig",
-        "@rushstack/eslint-patch",
-        "@vue/eslint-config-typescript",
-        "@vue/eslint-config-prettier",
-        "eslint",
-        "eslint-plugin-vue",
-        "prettier",
-        "vitest",
-        "@vue/test-utils",
-        "jsdom",
-        "typescript"
-    ]
-
-    dev_dependencies = {}
-
-    for dep in dev_deps:
-        ver = query_npm_latest_version(dep)
-        dev_dependencies[dep] = {
-            "version": ver,
-            "dev": True
-        }
+    if config is None:
+        config = {}
+
+    def enabled(flag: str) -> bool:
+        return config.get(flag, True)
+
+    dev_deps = ["@vitejs/plugin-vue"]
+    if enabled("typescript"):
+        dev_deps += ["@vue/tsconfig", "typescript"]
+    if enabled("eslint"):
+        dev_deps += ["@rushstack/eslint-patch", "eslint", "eslint-plugin-vue"]
+        if enabled("typescript"):
+            dev_deps.append("@vue/eslint-config-typescript")
+        if enabled("prettier"):
+            dev_deps.append("@vue/eslint-config-prettier")
+    if enabled("prettier"):
+        dev_deps.append("prettier")
+    if enabled("vitest"):
+        dev_deps += ["vitest", "@vue/test-utils", "jsdom"]
+
+    versions = _query_many(dev_deps)
+    dev_dependencies = {
+        dep: {"version": versions[dep], "dev": True} for dep in dev_deps
+    }
 
     # Add fallbacks for common dependencies
     fallbacks = {
@@ -202,7 +360,7 @@ def get_dev_dependencies_info() -> Dict[str, Dict[str, str]]:
     }
 
     for dep, fallback in fallbacks.items():
-        if not dev_dependencies[dep]["version"]:
+        if dep in dev_dependencies and not dev_dependencies[dep]["version"]:
             dev_dependencies[dep]["version"] = fallback
 
     return dev_dependencies
@@ -252,27 +410,43 @@ def get_css_framework_info(framework_name: str = "tailwindcss") -> Optional[Dict
     return framework_info
 
 
-def get_all_vue3_dependencies(include_css_framework: str = None) -> Dict[str, Dict[str, str]]:
+def get_all_vue3_dependencies(include_css_framework: str = None,
+                              config: Optional[Dict] = None) -> Dict[str, Dict[str, str]]:
     """
     Get all dependencies needed for a Vue 3 project.
 
     Args:
         include_css_framework: Optional CSS framework to include
+        config: Optional project configuration; the router and pinia
+            flags skip those lookups when the features are disabled
 
     Returns:
         Dictionary containing all dependencies with version info
     """
-    dependencies = {
-        "vue": get_vue3_info(),
-        "vue-router": get_vue_router_info(),
-        "pinia": get_pinia_info()
-    }
-
-    # Add CSS framework if requested
-    if include_css_framework:
-        css_info = get_css_framework_info(include_css_framework)
-        if css_info:
-            dependencies.update(css_info)
+    if config is None:
+        config = {}
+
+    # Each info helper is a registry round-trip; overlapping them makes
+    # the whole set cost roughly the slowest single lookup.
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        vue_future = executor.submit(get_vue3_info)
+        router_future = (executor.submit(get_vue_router_info)
+                         if config.get("router", True) else None)
+        pinia_future = (executor.submit(get_pinia_info)
+                        if config.get("pinia", True) else None)
+        css_future = (executor.submit(get_css_framework_info, include_css_framework)
+                      if include_css_framework else None)
+
+        dependencies = {"vue": vue_future.result()}
+        if router_future is not None:
+            dependencies["vue-router"] = router_future.result()
+        if pinia_future is not None:
+            dependencies["pinia"] = pinia_future.result()
+
+        if css_future is not None:
+            css_info = css_future.result()
+            if css_info:
+                dependencies.update(css_info)
 
     return dependencies
 
@@ -340,7 +514,7 @@ def generate_package_json_content(
             }
         }
 
-    return json.dumps(package_json, indent=2)
+    return json_dumps(package_json)
 
 
 def main():
@@ -6,53 +6,140 @@ This module provides functions to manage project dependencies using pnpm,
 including installation, updates, and version management.
 """
 
-import subprocess
-import json
+import hashlib
+import mmap
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
-
-from query_versions import get_all_vue3_dependencies, get_dev_dependencies_info
+from typing import Any, Dict, List, Tuple, Optional
+
+from query_versions import (
+    get_all_vue3_dependencies,
+    get_dev_dependencies_info,
+    json_dumps,
+    json_loads
+)
 from check_environment import run_command, suggest_package_manager
 
 
+# A clean audit is purely a function of the lockfile, so the last
+# passing result is remembered keyed by the lockfile's digest
+_AUDIT_CACHE_FILE = Path.home() / ".cache" / "vue3-generator" / "audit.json"
+
+# Constant package sets, hoisted so setup_vue3_project doesn't rebuild
+# the lists on every call; the CSS table maps framework -> ((package,
+# is_dev), ...) and turns the install dispatch into one dict lookup.
+_CORE_DEPS: Tuple[str, ...] = ("vue", "vue-router", "pinia")
+_DEV_DEPS: Tuple[str, ...] = (
+    "@vitejs/plugin-vue",
+    "typescript",
+    "vue-tsc",
+    "vite",
+    "@vue/eslint-config-typescript",
+    "@vue/eslint-config-prettier",
+    "eslint",
+    "eslint-plugin-vue",
+    "prettier",
+    "vitest",
+    "@vue/test-utils"
+)
+_CSS_FRAMEWORK_SPECS: Dict[str, Tuple[Tuple[str, bool], ...]] = {
+    "tailwindcss": (("tailwindcss", True), ("autoprefixer", True),
+                    ("postcss", True)),
+    "bootstrap": (("bootstrap", False), ("@popperjs/core", False)),
+    "bulma": (("bulma", False),)
+}
+
+
 class VueDependencyManager:
     """Manages dependencies for Vue 3 projects."""
 
-    def __init__(self, project_path: str):
+    # Shared across instances: package-manager detection probes the
+    # environment, not the project, so one lookup serves every manager
+    # built in this process
+    _pkg_manager: Optional[str] = None
+
+    def __init__(self, project_path: str, prefer_offline: bool = True):
         self.project_path = Path(project_path)
-        self.package_manager = suggest_package_manager()
+        if VueDependencyManager._pkg_manager is None:
+            VueDependencyManager._pkg_manager = suggest_package_manager()
+        self.package_manager = VueDependencyManager._pkg_manager
+        # Reuse cached registry metadata on installs: repeat setups on a
+        # warm store then skip most HTTPS round-trips
+        self.prefer_offline = prefer_offline
+        self._has_package_json: Optional[bool] = None
+        # Memoized derived state, keyed by what it describes:
+        #   "dep_state"  - (installed, outdated) views of the graph
+        #   "freshness"  - node_modules-vs-lockfile staleness verdict
+        # Mutating operations drop exactly the keys they outdate; the
+        # audit cache is keyed by the lockfile hash and so needs no
+        # explicit invalidation.
+        self._caches: Dict[str, Any] = {}
+
+    def _package_json_exists(self) -> bool:
+        """Stat package.json once; the project path never changes."""
+        if self._has_package_json is None:
+            self._has_package_json = (self.project_path / "package.json").exists()
+        return self._has_package_json
 
     def run_in_project(self, command: List[str], timeout: int = 120) -> Tuple[bool, str, str]:
-        """Run a command in the project directory."""
-        try:
-            # Save current directory
-            original_cwd = Path.cwd()
-
-            # Change to project directory
-            import os
-            os.chdir(self.project_path)
-
-            # Run command
-            success, stdout, stderr = run_command(command, timeout)
-
-            return success, stdout, stderr
-
-        except Exception as e:
-            return False, "", str(e)
-        finally:
-            # Restore original directory
-            import os
-            os.chdir(original_cwd)
+        """Run a command in the project directory.
+
+        The directory is scoped to the subprocess via cwd= rather than
+        os.chdir, which mutates process-global state and is unsafe under
+        the concurrent report queries.
+        """
+        return run_command(command, timeout, cwd=self.project_path)
+
+    def _invalidate(self, *keys: str) -> None:
+        """Drop the named cache entries after a mutating operation."""
+        for key in keys:
+            self._caches.pop(key, None)
+
+    def _is_node_modules_fresh(self) -> bool:
+        """True when node_modules is at least as new as the lockfile.
+
+        Mirrors pnpm's own up-to-date check with two stat calls, so a
+        steady-state install can be skipped without even forking pnpm.
+        """
+        fresh = self._caches.get("freshness")
+        if fresh is None:
+            try:
+                modules_mtime = (self.project_path / "node_modules"
+                                 / ".modules.yaml").stat().st_mtime
+                lock_mtime = (self.project_path
+                              / "pnpm-lock.yaml").stat().st_mtime
+                fresh = modules_mtime >= lock_mtime
+            except OSError:
+                fresh = False
+            self._caches["freshness"] = fresh
+        return fresh
+
+    def install_dependencies(self, frozen: bool = False) -> bool:
+        """Install all project dependencies.
+
+        Args:
+            frozen: Install strictly from the lockfile
+                (--frozen-lockfile), replacing full resolution with a
+                lockfile read — the fast path for CI
+        """
+        if not frozen and self._is_node_modules_fresh():
+            print("✅ Dependencies already up to date, skipping install")
+            return True
 
-    def install_dependencies(self) -> bool:
-        """Install all project dependencies."""
         print("📦 Installing dependencies...")
 
-        success, stdout, stderr = self.run_in_project([self.package_manager, "install"])
+        cmd = [self.package_manager, "install"]
+        if frozen:
+            cmd.append("--frozen-lockfile")
+        elif self.prefer_offline:
+            cmd.append("--prefer-offline")
+
+        success, stdout, stderr = self.run_in_project(cmd)
 
         if success:
             print("✅ Dependencies installed successfully!")
+            self._invalidate("dep_state", "freshness")
             return True
         else:
             print(f"❌ Failed to install dependencies: {stderr}")
@@ -68,12 +155,15 @@ class VueDependencyManager:
         cmd = [self.package_manager, "add"]
         if dev:
             cmd.append("-D")
+        if self.prefer_offline:
+            cmd.append("--prefer-offline")
         cmd.append(package_spec)
 
         success, stdout, stderr = self.run_in_project(cmd)
 
         if success:
             print(f"✅ {package_spec} added successfully!")
+            self._invalidate("dep_state", "freshness")
             return True
         else:
             print(f"❌ Failed to add {package_spec}: {stderr}")
@@ -87,6 +177,7 @@ class VueDependencyManager:
 
         if success:
             print(f"✅ {package_name} removed successfully!")
+            self._invalidate("dep_state", "freshness")
             return True
         else:
             print(f"❌ Failed to remove {package_name}: {stderr}")
@@ -99,10 +190,16 @@ class VueDependencyManager:
 
         print(f"🔄 Updating {package_spec}...")
 
-        success, stdout, stderr = self.run_in_project([self.package_manager, "update", package_spec])
+        cmd = [self.package_manager, "update"]
+        if self.prefer_offline:
+            cmd.append("--prefer-offline")
+        cmd.append(package_spec)
+
+        success, stdout, stderr = self.run_in_project(cmd)
 
         if success:
             print(f"✅ {package_spec} updated successfully!")
+            self._invalidate("dep_state", "freshness")
             return True
         else:
             print(f"❌ Failed to update {package_spec}: {stderr}")
@@ -116,46 +213,55 @@ class VueDependencyManager:
 
         if success:
             print("✅ All dependencies updated successfully!")
+            self._invalidate("dep_state", "freshness")
             return True
         else:
             print(f"❌ Failed to update dependencies: {stderr}")
             return False
 
-    def get_installed_packages(self) -> Dict[str, Dict[str, str]]:
-        """Get list of installed packages with their versions."""
+    def _query_installed_packages(self) -> Dict[str, Dict[str, str]]:
+        """Fetch installed packages with their versions from pnpm."""
         packages = {}
 
-        # Get production dependencies
-        success, stdout, stderr = self.run_in_project([self.package_manager, "list", "--prod", "--json"])
-        if success:
-            try:
-                prod_deps = json.loads(stdout)
-                for name, info in prod_deps.items():
-                    packages[name] = {
-                        "version": info.get("version", "unknown"),
-                        "type": "production"
-                    }
-            except json.JSONDecodeError:
-                print(f"⚠️  Could not parse production dependencies: {stderr}")
-
-        # Get development dependencies
-        success, stdout, stderr = self.run_in_project([self.package_manager, "list", "--dev", "--json"])
-        if success:
-            try:
-                dev_deps = json.loads(stdout)
-                for name, info in dev_deps.items():
-                    if name not in packages:  # Don't overwrite prod deps
-                        packages[name] = {
-                            "version": info.get("version", "unknown"),
-                            "type": "development"
-                        }
-            except json.JSONDecodeError:
-                print(f"⚠️  Could not parse development dependencies: {stderr}")
+        # One listing covers both dependency groups; spawning a second
+        # process just to separate prod from dev repeats the package
+        # manager's startup and the same tree walk
+        success, stdout, stderr = self.run_in_project(
+            [self.package_manager, "list", "--json", "--depth", "0"])
+        if not success:
+            print(f"⚠️  Could not list installed packages: {stderr}")
+            return packages
+
+        try:
+            listing = json_loads(stdout)
+        except ValueError:
+            print(f"⚠️  Could not parse installed packages: {stderr}")
+            return packages
+
+        # pnpm emits one object per workspace project; npm emits a single
+        # object
+        projects = listing if isinstance(listing, list) else [listing]
+        for project in projects:
+            for name, info in project.get("dependencies", {}).items():
+                packages[name] = {
+                    "version": info.get("version", "unknown"),
+                    "type": "production"
+                }
+
+        # Snapshot the prod names once, then bulk-load the dev group in a
+        # single update() instead of a per-key membership check and store
+        prod_names = set(packages)
+        for project in projects:
+            packages.update(
+                (name, {"version": info.get("version", "unknown"),
+                        "type": "development"})
+                for name, info in project.get("devDependencies", {}).items()
+                if name not in prod_names)  # Don't overwrite prod deps
 
         return packages
 
-    def check_outdated_packages(self) -> Dict[str, Dict[str, str]]:
-        """Check for outdated packages."""
+    def _query_outdated_packages(self) -> Dict[str, Dict[str, str]]:
+        """Fetch outdated packages from pnpm."""
         print("🔍 Checking for outdated packages...")
 
         success, stdout, stderr = self.run_in_project([self.package_manager, "outdated", "--json"])
@@ -165,72 +271,120 @@ class VueDependencyManager:
             return {}
 
         try:
-            outdated = json.loads(stdout)
+            outdated = json_loads(stdout)
             return outdated
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"⚠️  Could not parse outdated packages information")
             return {}
 
+    def _fetch_dep_state(self) -> Tuple[Dict[str, Dict[str, str]],
+                                        Dict[str, Dict[str, str]]]:
+        """Return the (installed, outdated) views of the dependency graph.
+
+        Both getters read the same graph, so they share one fetch: the
+        two pnpm queries run concurrently the first time and every later
+        call is a memo hit until a mutating operation drops the state.
+        `pnpm outdated` only reports packages with a newer version
+        available, so it cannot replace the `list` call for the
+        installed view — the merge happens at the cache, not the
+        subprocess.
+        """
+        state = self._caches.get("dep_state")
+        if state is None:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                installed_future = executor.submit(self._query_installed_packages)
+                outdated_future = executor.submit(self._query_outdated_packages)
+                state = (installed_future.result(), outdated_future.result())
+            self._caches["dep_state"] = state
+        return state
+
+    def get_installed_packages(self) -> Dict[str, Dict[str, str]]:
+        """Get list of installed packages with their versions."""
+        return self._fetch_dep_state()[0]
+
+    def check_outdated_packages(self) -> Dict[str, Dict[str, str]]:
+        """Check for outdated packages."""
+        return self._fetch_dep_state()[1]
+
+    def _add_package_batch(self, specs: List[str], dev: bool = False) -> bool:
+        """Add a batch of package specs with a single package-manager call."""
+        cmd = [self.package_manager, "add"]
+        if dev:
+            cmd.append("-D")
+        if self.prefer_offline:
+            cmd.append("--prefer-offline")
+        cmd.extend(specs)
+
+        success, stdout, stderr = self.run_in_project(cmd, timeout=300)
+
+        if success:
+            self._invalidate("dep_state", "freshness")
+            # One write per batch: under the concurrent report path each
+            # print contends on stdout, and a joined block cannot
+            # interleave with other tasks' lines
+            print("\n".join(f"  ✅ {spec}" for spec in specs))
+            return True
+        else:
+            print(f"❌ Failed to add {' '.join(specs)}: {stderr}")
+            return False
+
     def setup_vue3_project(self, config: Dict[str, Dict[str, str]]) -> bool:
         """Setup complete Vue 3 project dependencies."""
         print("🔧 Setting up Vue 3 project dependencies...")
 
         # Check if we're in a valid project directory
-        package_json_path = self.project_path / "package.json"
-        if not package_json_path.exists():
+        if not self._package_json_exists():
             print(f"❌ No package.json found in {self.project_path}")
             return False
 
-        # Install core dependencies
-        print("\n📦 Installing core Vue 3 dependencies...")
-        core_deps = ["vue", "vue-router", "pinia"]
-        for dep in core_deps:
+        # Collect every spec first, then install each group with one
+        # package-manager invocation: a separate "add" per package pays
+        # process startup, a resolver pass, and a lockfile rewrite apiece.
+        # Batching already shrinks the whole setup to two spawns, so a
+        # resident Node worker driving pnpm's programmatic API in-process
+        # would save at most one Node startup while pinning an unstable
+        # @pnpm/core dependency; the CLI boundary stays.
+        prod_specs = []
+        dev_specs = []
+
+        for dep in _CORE_DEPS:
             if dep in config:
                 version = config[dep].get("version")
                 if version:
-                    if not self.add_dependency(dep, version):
-                        print(f"⚠️  Failed to add {dep}, continuing...")
-
-        # Install development dependencies
-        print("\n📦 Installing development dependencies...")
-        dev_deps = [
-            "@vitejs/plugin-vue",
-            "typescript",
-            "vue-tsc",
-            "vite",
-            "@vue/eslint-config-typescript",
-            "@vue/eslint-config-prettier",
-            "eslint",
-            "eslint-plugin-vue",
-            "prettier",
-            "vitest",
-            "@vue/test-utils"
-        ]
-
-        for dep in dev_deps:
+                    prod_specs.append(f"{dep}@{version}")
+
+        for dep in _DEV_DEPS:
             if dep in config:
                 version = config[dep].get("version")
                 if version:
-                    if not self.add_dependency(dep, version, dev=True):
-                        print(f"⚠️  Failed to add {dep}, continuing...")
+                    dev_specs.append(f"{dep}@{version}")
 
-        # Install CSS framework if specified
+        # Fold the CSS framework into the same two batches
         css_framework = config.get("css_framework")
-        if css_framework and css_framework != "none":
-            print(f"\n🎨 Installing {css_framework}...")
-            if css_framework == "tailwindcss":
-                self.add_dependency("tailwindcss", dev=True)
-                self.add_dependency("autoprefixer", dev=True)
-                self.add_dependency("postcss", dev=True)
-            elif css_framework == "bootstrap":
-                self.add_dependency("bootstrap")
-                self.add_dependency("@popperjs/core")
-            elif css_framework == "bulma":
-                self.add_dependency("bulma")
-
-        # Final install to resolve all dependencies
-        print("\n🔄 Resolving all dependencies...")
-        return self.install_dependencies()
+        framework_specs = _CSS_FRAMEWORK_SPECS.get(css_framework)
+        if framework_specs:
+            print(f"🎨 Including {css_framework}...")
+            for package, dev in framework_specs:
+                (dev_specs if dev else prod_specs).append(package)
+
+        if prod_specs:
+            print("\n📦 Installing core Vue 3 dependencies...")
+            if not self._add_package_batch(prod_specs):
+                return False
+
+        # The two batches stay sequential on purpose: both mutate the
+        # same lockfile and pnpm store, so concurrent `add` calls would
+        # only contend on pnpm's own locks. Concurrency pays off for the
+        # read-only queries instead (see generate_dependency_report).
+        if dev_specs:
+            print("\n📦 Installing development dependencies...")
+            if not self._add_package_batch(dev_specs, dev=True):
+                return False
+
+        # "add" already installs what it resolves; no trailing install
+        # pass is needed
+        print("\n✅ Vue 3 project dependencies set up successfully!")
+        return True
 
     def clean_dependencies(self) -> bool:
         """Clean and optimize dependencies."""
@@ -254,41 +408,89 @@ class VueDependencyManager:
             return None
 
         try:
-            info = json.loads(stdout)
+            info = json_loads(stdout)
             return info
-        except json.JSONDecodeError:
+        except ValueError:
             print(f"❌ Could not parse dependency info for {package_name}")
             return None
 
+    def _lockfile_hash(self) -> Optional[str]:
+        """Digest of the lockfile, or None when it is missing.
+
+        blake2b is the fastest digest in hashlib and the hash only needs
+        to detect change, not resist attack.
+        """
+        lockfile = ("pnpm-lock.yaml" if self.package_manager == "pnpm"
+                    else "package-lock.json")
+        try:
+            # Map the file and hash it in one pass instead of looping
+            # over read() chunks through an intermediate buffer
+            with open(self.project_path / lockfile, "rb") as f:
+                try:
+                    with mmap.mmap(f.fileno(), 0,
+                                   access=mmap.ACCESS_READ) as mm:
+                        return hashlib.blake2b(mm).hexdigest()
+                except ValueError:
+                    # An empty lockfile cannot be mapped
+                    return hashlib.blake2b().hexdigest()
+        except OSError:
+            return None
+
     def audit_dependencies(self) -> bool:
         """Check for security vulnerabilities in dependencies."""
+        # The audit result is purely a function of the lockfile, so a
+        # passing result is reused until the lockfile changes. Only clean
+        # audits are cached: a failure (vulnerable or offline) always
+        # re-runs.
+        lock_hash = self._lockfile_hash()
+        if lock_hash:
+            try:
+                cached = json_loads(_AUDIT_CACHE_FILE.read_bytes())
+                if cached.get("hash") == lock_hash and cached.get("passed"):
+                    print("✅ Dependency audit passed (cached, lockfile unchanged)")
+                    return True
+            except (OSError, ValueError):
+                pass
+
         print("🔒 Auditing dependencies for security vulnerabilities...")
 
-        # pnpm uses different commands for auditing
-        if self.package_manager == "pnpm":
-            success, stdout, stderr = self.run_in_project([self.package_manager, "audit"])
-        else:
-            success, stdout, stderr = self.run_in_project([self.package_manager, "audit"])
+        success, stdout, stderr = self.run_in_project([self.package_manager, "audit"])
 
         if success:
-            print("✅ Dependency audit completed!")
-            print(stdout)
+            print(f"✅ Dependency audit completed!\n{stdout}")
+            if lock_hash:
+                try:
+                    _AUDIT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+                    _AUDIT_CACHE_FILE.write_text(
+                        json_dumps({"hash": lock_hash, "passed": True}))
+                except OSError:
+                    pass
             return True
         else:
             print(f"❌ Dependency audit failed: {stderr}")
             return False
 
-    def generate_dependency_report(self) -> Dict[str, any]:
+    def generate_dependency_report(self) -> Dict[str, Any]:
         """Generate a comprehensive dependency report."""
         print("📊 Generating dependency report...")
 
-        report = {
-            "project_path": str(self.project_path),
-            "package_manager": self.package_manager,
-            "installed_packages": self.get_installed_packages(),
-            "outdated_packages": self.check_outdated_packages(),
-            "audit_passed": self.audit_dependencies()
-        }
+        # The queries are independent, read-only subprocess calls that
+        # mostly wait on pnpm and the registry; running them concurrently
+        # costs roughly the slowest one (usually the audit). The audit
+        # runs beside the dep-state fetch, which parallelizes its two
+        # queries internally. Each task's status lines may print in
+        # completion order.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            audit_future = executor.submit(self.audit_dependencies)
+            installed, outdated = self._fetch_dep_state()
+
+            report = {
+                "project_path": str(self.project_path),
+                "package_manager": self.package_manager,
+                "installed_packages": installed,
+                "outdated_packages": outdated,
+                "audit_passed": audit_future.result()
+            }
 
         return report
 
@@ -320,7 +522,7 @@ def main():
         success = manager.audit_dependencies()
     elif command == "report":
         report = manager.generate_dependency_report()
-        print(json.dumps(report, indent=2))
+        print(json_dumps(report))
         success = True
     else:
         print(f"❌ Unknown command: {command}")